@@ -9,6 +9,71 @@ from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 from bs4 import BeautifulSoup, Tag
 
+# 호출마다 re 모듈 캐시를 조회하지 않도록 정규식을 모듈 로드 시 한 번만 컴파일
+
+# 기본 날짜 패턴들
+_DATE_PATTERNS = [re.compile(p) for p in (
+    # 한국어 날짜 형식
+    r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일',  # 2025년 8월 22일
+    r'(\d{1,2})월\s*(\d{1,2})일',  # 8월 22일 (올해로 가정)
+    
+    # 점 구분 형식
+    r'(\d{4})\.(\d{1,2})\.(\d{1,2})',  # 2025.08.22
+    r'(\d{2})\.(\d{1,2})\.(\d{1,2})',  # 25.08.22 (20xx년으로 가정)
+    r'(\d{1,2})\.(\d{1,2})\.(\d{1,2})',  # 08.22 (올해로 가정)
+    
+    # 하이픈 구분 형식
+    r'(\d{4})-(\d{1,2})-(\d{1,2})',  # 2025-08-22
+    r'(\d{2})-(\d{1,2})-(\d{1,2})',  # 25-08-22 (20xx년으로 가정)
+    
+    # 슬래시 구분 형식
+    r'(\d{4})/(\d{1,2})/(\d{1,2})',  # 2025/08/22
+    r'(\d{2})/(\d{1,2})/(\d{1,2})',  # 25/08/22 (20xx년으로 가정)
+    
+    # 공백 구분 형식
+    r'(\d{4})\s+(\d{1,2})\s+(\d{1,2})',  # 2025 08 22
+    r'(\d{2})\s+(\d{1,2})\s+(\d{1,2})',  # 25 08 22 (20xx년으로 가정)
+)]
+
+# 제목 정리
+_TITLE_BRACKET_RE = re.compile(r'[\[\]【】]')
+_TITLE_SPECIAL_RE = re.compile(r'[^\w\s가-힣\-\.\,\:\!\?]')
+_WS_RE = re.compile(r'\s+')
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# 광고 관련 텍스트
+_AD_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'\[.*?광고.*?\]',
+    r'\(.*?광고.*?\)',
+    r'<.*?광고.*?>',
+    r'광고\s*문의',
+    r'광고\s*제휴',
+    r'스폰서',
+    r'협찬',
+)]
+
+# 기자명 관련 텍스트
+_REPORTER_PATTERNS = [re.compile(p) for p in (
+    r'기자\s*[가-힣]+\s*기자',
+    r'[가-힣]+\s*기자',
+    r'기자\s*[가-힣]+',
+    r'취재\s*[가-힣]+',
+    r'[가-힣]+\s*취재',
+)]
+
+# 본문 공백 정리
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+_LEADING_WS_RE = re.compile(r'^\s+', re.MULTILINE)
+_TRAILING_WS_RE = re.compile(r'\s+$', re.MULTILINE)
+
+# 기자명 추출
+_AUTHOR_PATTERNS = [re.compile(p) for p in (
+    r'([가-힣]+)\s*기자',
+    r'기자\s*([가-힣]+)',
+    r'([가-힣]+)\s*취재',
+    r'취재\s*([가-힣]+)',
+)]
+
 class ParserUtils:
     """HTML 파싱 공통 유틸리티"""
     
@@ -27,34 +92,12 @@ class ParserUtils:
         if not date_str:
             return None
         
-        # 기본 패턴들
-        default_patterns = [
-            # 한국어 날짜 형식
-            r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일',  # 2025년 8월 22일
-            r'(\d{1,2})월\s*(\d{1,2})일',  # 8월 22일 (올해로 가정)
-            
-            # 점 구분 형식
-            r'(\d{4})\.(\d{1,2})\.(\d{1,2})',  # 2025.08.22
-            r'(\d{2})\.(\d{1,2})\.(\d{1,2})',  # 25.08.22 (20xx년으로 가정)
-            r'(\d{1,2})\.(\d{1,2})\.(\d{1,2})',  # 08.22 (올해로 가정)
-            
-            # 하이픈 구분 형식
-            r'(\d{4})-(\d{1,2})-(\d{1,2})',  # 2025-08-22
-            r'(\d{2})-(\d{1,2})-(\d{1,2})',  # 25-08-22 (20xx년으로 가정)
-            
-            # 슬래시 구분 형식
-            r'(\d{4})/(\d{1,2})/(\d{1,2})',  # 2025/08/22
-            r'(\d{2})/(\d{1,2})/(\d{1,2})',  # 25/08/22 (20xx년으로 가정)
-            
-            # 공백 구분 형식
-            r'(\d{4})\s+(\d{1,2})\s+(\d{1,2})',  # 2025 08 22
-            r'(\d{2})\s+(\d{1,2})\s+(\d{1,2})',  # 25 08 22 (20xx년으로 가정)
-        ]
-        
-        patterns = patterns or default_patterns
+        compiled_patterns = (
+            [re.compile(p) for p in patterns] if patterns else _DATE_PATTERNS
+        )
         
-        for pattern in patterns:
-            match = re.search(pattern, date_str)
+        for pattern in compiled_patterns:
+            match = pattern.search(date_str)
             if match:
                 groups = match.groups()
                 if len(groups) == 3:
@@ -95,11 +138,11 @@ class ParserUtils:
             return ""
         
         # 불필요한 문자 제거
-        title = re.sub(r'[\[\]【】]', '', title)  # 대괄호 제거
-        title = re.sub(r'[^\w\s가-힣\-\.\,\:\!\?]', '', title)  # 특수문자 제거
+        title = _TITLE_BRACKET_RE.sub('', title)  # 대괄호 제거
+        title = _TITLE_SPECIAL_RE.sub('', title)  # 특수문자 제거
         
         # 연속된 공백을 하나로
-        title = re.sub(r'\s+', ' ', title)
+        title = _WS_RE.sub(' ', title)
         
         return title.strip()
     
@@ -118,35 +161,17 @@ class ParserUtils:
             return ""
         
         # 광고 관련 텍스트 제거
-        ad_patterns = [
-            r'\[.*?광고.*?\]',
-            r'\(.*?광고.*?\)',
-            r'<.*?광고.*?>',
-            r'광고\s*문의',
-            r'광고\s*제휴',
-            r'스폰서',
-            r'협찬',
-        ]
-        
-        for pattern in ad_patterns:
-            content = re.sub(pattern, '', content, flags=re.IGNORECASE)
+        for pattern in _AD_PATTERNS:
+            content = pattern.sub('', content)
         
         # 기자명 관련 텍스트 제거
-        reporter_patterns = [
-            r'기자\s*[가-힣]+\s*기자',
-            r'[가-힣]+\s*기자',
-            r'기자\s*[가-힣]+',
-            r'취재\s*[가-힣]+',
-            r'[가-힣]+\s*취재',
-        ]
-        
-        for pattern in reporter_patterns:
-            content = re.sub(pattern, '', content)
+        for pattern in _REPORTER_PATTERNS:
+            content = pattern.sub('', content)
         
         # 불필요한 공백 정리
-        content = re.sub(r'\n\s*\n', '\n\n', content)  # 연속된 빈 줄을 2개로
-        content = re.sub(r'^\s+', '', content, flags=re.MULTILINE)  # 줄 시작 공백 제거
-        content = re.sub(r'\s+$', '', content, flags=re.MULTILINE)  # 줄 끝 공백 제거
+        content = _BLANK_LINES_RE.sub('\n\n', content)  # 연속된 빈 줄을 2개로
+        content = _LEADING_WS_RE.sub('', content)  # 줄 시작 공백 제거
+        content = _TRAILING_WS_RE.sub('', content)  # 줄 끝 공백 제거
         
         return content.strip()
     
@@ -183,8 +208,8 @@ class ParserUtils:
             
         except Exception:
             # HTML 파싱 실패 시 정규식으로 태그 제거
-            text = re.sub(r'<[^>]+>', '', html_content)
-            text = re.sub(r'\s+', ' ', text)
+            text = _TAG_RE.sub('', html_content)
+            text = _WS_RE.sub(' ', text)
             return text.strip()
     
     @staticmethod
@@ -201,16 +226,8 @@ class ParserUtils:
         if not text:
             return None
         
-        # 기자명 패턴들
-        author_patterns = [
-            r'([가-힣]+)\s*기자',
-            r'기자\s*([가-힣]+)',
-            r'([가-힣]+)\s*취재',
-            r'취재\s*([가-힣]+)',
-        ]
-        
-        for pattern in author_patterns:
-            match = re.search(pattern, text)
+        for pattern in _AUTHOR_PATTERNS:
+            match = pattern.search(text)
             if match:
                 author = match.group(1).strip()
                 if len(author) >= 2:  # 2글자 이상만 유효한 기자명으로 간주
@@ -25,6 +25,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 # 프로젝트 내부 모듈
 from utils.supabase_manager_unified import UnifiedSupabaseManager
 from utils.common import make_request
+from utils.common.browser_pool import get_browser, close_browser
 
 console = Console()
 
@@ -68,9 +69,7 @@ class ChosunPoliticsCollector:
         # Supabase 매니저 초기화
         self.supabase_manager = UnifiedSupabaseManager()
         
-        # Playwright 관련
-        self._playwright = None
-        self._browser = None
+        # Playwright 브라우저는 utils.common.browser_pool에서 공유
 
     async def _make_request(self, url: str, params: Optional[Dict] = None) -> Optional[str]:
         """HTTP GET 요청 수행"""
@@ -366,16 +365,9 @@ class ChosunPoliticsCollector:
     async def _extract_content_with_playwright(self, url: str) -> str:
         """Playwright를 활용하여 본문 추출"""
         try:
-            from playwright.async_api import async_playwright
-            
-            if not hasattr(self, '_browser'):
-                self._playwright = await async_playwright().start()
-                self._browser = await self._playwright.chromium.launch(
-                    headless=True,
-                    args=['--no-sandbox', '--disable-dev-shm-usage', '--disable-gpu']
-                )
-            
-            page = await self._browser.new_page()
+            # 공유 브라우저 사용 (실행은 최초 1회, 이후에는 페이지만 생성)
+            browser = await get_browser()
+            page = await browser.new_page()
             
             try:
                 await page.goto(url, wait_until='domcontentloaded', timeout=10000)
@@ -458,7 +450,8 @@ class ChosunPoliticsCollector:
                     p_tags = content_elem.find_all('p')
                 
                 if p_tags:
-                    content = '\n'.join(p.get_text(strip=True) for p in p_tags if p.get_text(strip=True))
+                    # 문단별 텍스트 추출(하위 노드 재귀)은 한 번만 수행
+                    content = '\n'.join(text for text in (p.get_text(strip=True) for p in p_tags) if text)
                     content = re.sub(r'\n\s*\n', '\n\n', content)
                     return content.strip()
             
@@ -549,12 +542,7 @@ class ChosunPoliticsCollector:
     async def _cleanup_playwright(self):
         """Playwright 리소스 정리"""
         try:
-            if hasattr(self, '_browser') and self._browser:
-                await self._browser.close()
-            
-            if hasattr(self, '_playwright') and self._playwright:
-                await self._playwright.stop()
-                
+            await close_browser()
         except Exception as e:
             console.print(f"⚠️ Playwright 정리 오류: {str(e)}")
 
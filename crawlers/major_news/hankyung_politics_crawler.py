@@ -13,6 +13,7 @@
 """
 import sys
 import os
+import asyncio
 import requests
 from bs4 import BeautifulSoup
 import time
@@ -371,7 +372,8 @@ class HankyungPoliticsCrawler:
     async def collect_all_articles(self) -> List[Dict]:
         """모든 기사 수집 (비동기 인터페이스)"""
         try:
-            return self.crawl_hankyung()
+            # requests/time.sleep 기반 동기 크롤링이 이벤트 루프를 막지 않도록 스레드에서 실행
+            return await asyncio.to_thread(self.crawl_hankyung)
         except KeyboardInterrupt:
             print("\n⚠️  사용자에 의해 중단되었습니다.")
             return self.articles
@@ -473,5 +475,4 @@ async def main():
     await crawler.save_to_database(articles)
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main())
@@ -311,7 +311,8 @@ class MKPoliticsCrawler:
                         return None
                     
                     # 모든 문단 텍스트 결합
-                    content_parts = [elem.get_text(strip=True) for elem in content_elems if elem.get_text(strip=True)]
+                    # 요소별 텍스트 추출(하위 노드 재귀)은 한 번만 수행
+                    content_parts = [text for text in (elem.get_text(strip=True) for elem in content_elems) if text]
                     content = '\n\n'.join(content_parts)
                     
                     if not content.strip():
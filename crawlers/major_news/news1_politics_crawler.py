@@ -37,6 +37,9 @@ logger = logging.getLogger(__name__)
 # Rich 콘솔 설정
 console = Console()
 
+# 정치 하위 카테고리 기사 URL 판별 (여러 번의 `in` 검사를 C 정규식 한 번으로)
+ARTICLE_SECTION_RE = re.compile(r'/(?:president|assembly|pm-bai-comm|general-politics)/')
+
 class News1PoliticsCrawler:
     def __init__(self):
         self.base_url = "https://www.news1.kr"
@@ -500,13 +503,13 @@ class News1PoliticsCrawler:
     def _extract_article_links_from_html(self, soup) -> list:
         """HTML에서 기사 링크를 추출합니다."""
         links = []
-        article_elements = soup.find_all('a', href=True)
+        # '/politics/' 포함 여부는 CSS 셀렉터(soupsieve)에서 바로 거름
+        article_elements = soup.select('a[href*="/politics/"]')
         
         for element in article_elements:
             href = element.get('href')
             # 실제 기사 URL만 필터링 (카테고리 페이지 제외)
-            if (href and '/politics/' in href and 
-                any(keyword in href for keyword in ['/president/', '/assembly/', '/pm-bai-comm/', '/general-politics/']) and
+            if (ARTICLE_SECTION_RE.search(href) and
                 not href.endswith(('/president', '/assembly', '/pm-bai-comm', '/general-politics'))):
                 
                 if href.startswith('/'):
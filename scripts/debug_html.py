@@ -3,58 +3,107 @@
 HTML 구조 디버깅 스크립트
 """
 
+import argparse
 import asyncio
-import httpx
+import os
+import sys
 import re
-from bs4 import BeautifulSoup
+from pathlib import Path
+from selectolax.lexbor import LexborHTMLParser
 from rich.console import Console
 
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.common.http_client import fetch_text, fetch_and_analyze, close_shared_client
+from utils.common.fetch_cache import cached_get
+
 console = Console()
 
-async def debug_html_structure():
-    """HTML 구조 디버깅"""
-    
-    url = "https://www.chosun.com/politics/politics_general/2025/08/19/MX46I5KXANFQZICDOXZAUV3VMU/"
+# 본문 후보 탐색용 (속성, 부분 문자열) 조건 - [속성*="값"] 셀렉터와 동일 (모듈 로드 시 한 번만 생성)
+INTERESTING_ATTRS = (
+    ('class', 'article'),
+    ('class', 'content'),
+    ('class', 'body'),
+    ('class', 'text'),
+    ('id', 'article'),
+    ('id', 'content'),
+)
+SCRIPT_KEYWORDS = ('content', 'body', 'article', 'text', '본문', '기사')
+# 문장 구분자(.!?) 사이가 100자를 넘는 구간만 C 정규식 엔진에서 먼저 골라냄
+LONG_SENTENCE_RE = re.compile(r'[^.!?]{101,}')
+
+DEFAULT_URL = "https://www.chosun.com/politics/politics_general/2025/08/19/MX46I5KXANFQZICDOXZAUV3VMU/"
+
+async def dump_html(html: str, path: str):
+    """받은 HTML을 파일로 저장 (디스크 쓰기는 스레드로 넘겨 이벤트 루프를 막지 않음)"""
+    await asyncio.to_thread(Path(path).write_text, html, encoding='utf-8')
+    console.print(f"💾 HTML 저장: {path}")
+
+async def fetch_html(url: str, max_bytes: int = None, use_cache: bool = True) -> str:
+    """디버깅할 HTML 가져오기 (max_bytes 지정 시 캐시를 거치지 않고 앞부분만 수신)"""
+    if max_bytes is None and use_cache:
+        # 반복 실행 시 디스크 캐시 재사용 (TTL 30분)
+        return await cached_get(url)
+    # 공유 클라이언트로 요청 (연결/DNS 재사용), max_bytes 도달 시 수신 중단
+    return await fetch_text(url, max_bytes=max_bytes)
+
+async def debug_html_structure(url: str = DEFAULT_URL, max_bytes: int = None, dump_path: str = None,
+                               use_cache: bool = True, html: str = None):
+    """HTML 구조 디버깅 (max_bytes 지정 시 HTML 앞부분만 받아 분석, dump_path 지정 시 원본 저장, html 전달 시 요청 생략)"""
     
     console.print(f"🔍 URL: {url}")
     console.print("=" * 80)
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-            html = response.text
-            
-        soup = BeautifulSoup(html, 'html.parser')
+        if html is None:
+            html = await fetch_html(url, max_bytes=max_bytes, use_cache=use_cache)
+        
+        # 디버그 덤프는 요청한 경우에만 저장 (분석과 동시에 진행)
+        dump_task = asyncio.create_task(dump_html(html, dump_path)) if dump_path else None
+        
+        tree = LexborHTMLParser(html)
         
         # 1. HTML 전체 길이
         console.print(f"📊 HTML 전체 길이: {len(html)}자")
         
         # 2. 모든 태그 분석
         console.print("\n📋 2. 모든 태그 분석:")
-        all_tags = soup.find_all()
+        # DOM을 한 번만 순회하며 태그 수, script/div 목록, 속성 조건별 요소를 함께 분류
+        all_tags = tree.css('*')
         tag_counts = {}
+        scripts = []
+        divs = []
+        attr_matches = {condition: [] for condition in INTERESTING_ATTRS}
         for tag in all_tags:
-            tag_name = tag.name
+            tag_name = tag.tag
             if tag_name not in tag_counts:
                 tag_counts[tag_name] = 0
             tag_counts[tag_name] += 1
+            if tag_name == 'script':
+                scripts.append(tag)
+            elif tag_name == 'div':
+                divs.append(tag)
+            attrs = tag.attributes
+            for condition in INTERESTING_ATTRS:
+                attr, needle = condition
+                if needle in (attrs.get(attr) or ''):
+                    attr_matches[condition].append(tag)
         
         for tag_name, count in sorted(tag_counts.items()):
             console.print(f"   - {tag_name}: {count}개")
         
         # 3. script 태그 내용 분석
         console.print("\n📋 3. Script 태그 분석:")
-        scripts = soup.find_all('script')
         console.print(f"총 script 태그: {len(scripts)}개")
         
         for i, script in enumerate(scripts):
-            if script.string:
-                script_content = script.string
+            script_content = script.text()
+            if script_content:
                 console.print(f"   - script[{i}]: {len(script_content)}자")
                 
                 # 본문 관련 키워드 검색
-                keywords = ['content', 'body', 'article', 'text', '본문', '기사']
-                for keyword in keywords:
+                for keyword in SCRIPT_KEYWORDS:
                     if keyword in script_content:
                         console.print(f"     ✅ '{keyword}' 키워드 발견")
                 
@@ -70,10 +119,10 @@ async def debug_html_structure():
         # 4. div 태그 중 텍스트가 있는 것들
         console.print("\n📋 4. 텍스트가 있는 div 태그들:")
         text_divs = []
-        for div in soup.find_all('div'):
-            text = div.get_text(strip=True)
+        for div in divs:
+            text = div.text(strip=True)
             if len(text) > 50:  # 50자 이상
-                classes = ' '.join(div.get('class', []))
+                classes = ' '.join((div.attributes.get('class') or '').split())
                 text_divs.append((classes, len(text), text[:150]))
         
         text_divs.sort(key=lambda x: x[1], reverse=True)
@@ -84,39 +133,68 @@ async def debug_html_structure():
         
         # 5. 특정 클래스나 ID를 가진 요소들
         console.print("\n📋 5. 특정 클래스/ID 요소들:")
-        interesting_selectors = [
-            '[class*="article"]',
-            '[class*="content"]',
-            '[class*="body"]',
-            '[class*="text"]',
-            '[id*="article"]',
-            '[id*="content"]'
-        ]
-        
-        for selector in interesting_selectors:
-            elements = soup.select(selector)
+        for attr, needle in INTERESTING_ATTRS:
+            selector = f'[{attr}*="{needle}"]'
+            elements = attr_matches[(attr, needle)]
             if elements:
                 console.print(f"   ✅ {selector}: {len(elements)}개")
                 for elem in elements[:3]:  # 처음 3개만
-                    text = elem.get_text(strip=True)
-                    console.print(f"      - {elem.name}.{'.'.join(elem.get('class', []))}: {len(text)}자")
+                    text = elem.text(strip=True)
+                    console.print(f"      - {elem.tag}.{'.'.join((elem.attributes.get('class') or '').split())}: {len(text)}자")
             else:
                 console.print(f"   ❌ {selector}: 없음")
         
         # 6. HTML 전체에서 본문 관련 텍스트 검색
         console.print("\n📋 6. 본문 관련 텍스트 검색:")
-        full_text = soup.get_text()
+        # script/style 내용은 본문 텍스트에서 제외
+        tree.strip_tags(['script', 'style'])
+        full_text = tree.root.text()
         
         # 본문으로 보이는 긴 텍스트 찾기
-        sentences = re.split(r'[.!?]', full_text)
-        long_sentences = [s.strip() for s in sentences if len(s.strip()) > 100]
+        candidates = (m.group().strip() for m in LONG_SENTENCE_RE.finditer(full_text))
+        long_sentences = [s for s in candidates if len(s) > 100]
         
         console.print(f"100자 이상 문장: {len(long_sentences)}개")
         for i, sentence in enumerate(long_sentences[:5]):
             console.print(f"   {i+1}. {sentence[:200]}...")
         
+        if dump_task:
+            await dump_task
+        
     except Exception as e:
         console.print(f"❌ 오류 발생: {str(e)}")
 
+def _dump_path_for(dump_path: str, index: int, total: int) -> str:
+    """URL이 여러 개면 덤프 파일명 뒤에 순번을 붙여 서로 덮어쓰지 않도록 함"""
+    if not dump_path or total == 1:
+        return dump_path
+    path = Path(dump_path)
+    return str(path.with_name(f"{path.stem}_{index + 1}{path.suffix}"))
+
+async def main(urls: list = None, max_bytes: int = None, dump_path: str = None, use_cache: bool = True):
+    """디버그 실행 후 공유 클라이언트 정리 (여러 URL은 동시에 받고 분석 결과는 순서대로 출력)"""
+    urls = urls or [DEFAULT_URL]
+    
+    async def fetch(url):
+        return await fetch_html(url, max_bytes=max_bytes, use_cache=use_cache)
+    
+    async def analyze(i, url, html):
+        await debug_html_structure(url, dump_path=_dump_path_for(dump_path, i, len(urls)), html=html)
+    
+    try:
+        await fetch_and_analyze(urls, analyze, fetch=fetch)
+    finally:
+        await close_shared_client()
+
 if __name__ == "__main__":
-    asyncio.run(debug_html_structure())
+    parser = argparse.ArgumentParser(description='HTML 구조 디버깅')
+    parser.add_argument('urls', nargs='*', metavar='URL',
+                        help='분석할 기사 URL (여러 개 가능, 기본: 조선일보 샘플 기사)')
+    parser.add_argument('--max-bytes', type=int, default=None,
+                        help='HTML을 이 크기(바이트)까지만 받아 분석 (예: 262144, 기본: 전체)')
+    parser.add_argument('--dump', metavar='PATH', default=None,
+                        help='받은 HTML을 저장할 파일 경로 (예: chosun_article_debug.html, 기본: 저장 안 함)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='디스크 캐시를 쓰지 않고 항상 새로 요청')
+    args = parser.parse_args()
+    asyncio.run(main(args.urls, max_bytes=args.max_bytes, dump_path=args.dump, use_cache=not args.no_cache))
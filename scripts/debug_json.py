@@ -3,29 +3,43 @@
 JSON 데이터 구조 분석 스크립트
 """
 
+import argparse
 import asyncio
-import httpx
+import os
+import sys
 import re
-import json
-from bs4 import BeautifulSoup
+import orjson
+from bs4 import BeautifulSoup, SoupStrainer
 from rich.console import Console
 
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.common.http_client import fetch_text, fetch_and_analyze, close_shared_client
+from utils.common.fetch_cache import cached_get
+
 console = Console()
 
-async def debug_json_structure():
-    """JSON 데이터 구조 분석"""
-    
-    url = "https://www.chosun.com/politics/politics_general/2025/08/19/MX46I5KXANFQZICDOXZAUV3VMU/"
+# JSON 분석에는 script 태그만 필요하므로 나머지 태그는 트리로 만들지 않음
+SCRIPT_ONLY = SoupStrainer('script')
+
+DEFAULT_URL = "https://www.chosun.com/politics/politics_general/2025/08/19/MX46I5KXANFQZICDOXZAUV3VMU/"
+
+async def fetch_html(url: str, use_cache: bool = True) -> str:
+    """공유 클라이언트로 요청 (연결/DNS 재사용), 반복 실행 시 디스크 캐시 재사용"""
+    return await cached_get(url) if use_cache else await fetch_text(url)
+
+async def debug_json_structure(url: str = DEFAULT_URL, use_cache: bool = True, html: str = None):
+    """JSON 데이터 구조 분석 (html 전달 시 요청 생략)"""
     
     console.print(f"🔍 URL: {url}")
     console.print("=" * 80)
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-            html = response.text
-            
-        soup = BeautifulSoup(html, 'html.parser')
+        if html is None:
+            html = await fetch_html(url, use_cache=use_cache)
+        
+        soup = BeautifulSoup(html, 'lxml', parse_only=SCRIPT_ONLY)
         
         # script 태그에서 JSON 데이터 찾기
         scripts = soup.find_all('script')
@@ -50,7 +64,7 @@ async def debug_json_structure():
                     
                     # JSON 파싱 시도
                     try:
-                        data = json.loads(json_str)
+                        data = orjson.loads(json_str)
                         console.print("✅ JSON 파싱 성공!")
                         
                         # 데이터 구조 분석
@@ -96,7 +110,7 @@ async def debug_json_structure():
                                 elif isinstance(value, dict):
                                     console.print(f"      키들: {list(value.keys())}")
                         
-                    except json.JSONDecodeError as e:
+                    except orjson.JSONDecodeError as e:
                         console.print(f"❌ JSON 파싱 실패: {str(e)}")
                         
                         # 부분적으로 파싱 시도
@@ -171,5 +185,25 @@ async def debug_json_structure():
     except Exception as e:
         console.print(f"❌ 오류 발생: {str(e)}")
 
+async def main(urls: list = None, use_cache: bool = True):
+    """디버그 실행 후 공유 클라이언트 정리 (여러 URL은 동시에 받고 분석 결과는 순서대로 출력)"""
+    
+    async def fetch(url):
+        return await fetch_html(url, use_cache=use_cache)
+    
+    async def analyze(i, url, html):
+        await debug_json_structure(url, html=html)
+    
+    try:
+        await fetch_and_analyze(urls or [DEFAULT_URL], analyze, fetch=fetch)
+    finally:
+        await close_shared_client()
+
 if __name__ == "__main__":
-    asyncio.run(debug_json_structure())
+    parser = argparse.ArgumentParser(description='JSON 데이터 구조 분석')
+    parser.add_argument('urls', nargs='*', metavar='URL',
+                        help='분석할 기사 URL (여러 개 가능, 기본: 조선일보 샘플 기사)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='디스크 캐시를 쓰지 않고 항상 새로 요청')
+    args = parser.parse_args()
+    asyncio.run(main(args.urls, use_cache=not args.no_cache))
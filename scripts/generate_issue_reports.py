@@ -10,11 +10,13 @@
 - 편향성 퍼센트는 HTML 게이지바로 시각화
 """
 
+import argparse
 import os
 import sys
-import json
-from datetime import datetime
-from typing import Dict, List, Optional
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Set
+
+import orjson
 
 # utils 모듈 import를 위한 경로 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -22,192 +24,10 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.supabase_manager_unified import UnifiedSupabaseManager
 
 
-class IssueReportGenerator:
-    def __init__(self):
-        self.sm = UnifiedSupabaseManager()
-        
-    def generate_all_issue_reports(self):
-        """모든 이슈에 대해 레포트를 생성합니다."""
-        print("🚀 이슈별 레포트 생성 시작")
-        print("=" * 60)
-        
-        try:
-            # 모든 테이블에서 데이터 로드
-            issues_result = self.sm.client.table('issues').select('*').gt('id', 1).execute()
-            common_points_result = self.sm.client.table('common_points').select('*').execute()
-            bias_summaries_result = self.sm.client.table('bias_summaries').select('*').execute()
-            media_summaries_result = self.sm.client.table('media_summaries').select('*').execute()
-            media_outlets_result = self.sm.client.table('media_outlets').select('*').execute()
-            
-            if not issues_result.data:
-                print("❌ 이슈 데이터를 찾을 수 없습니다.")
-                return
-            
-            issues = issues_result.data
-            common_points = common_points_result.data
-            bias_summaries = bias_summaries_result.data
-            media_summaries = media_summaries_result.data
-            media_outlets = media_outlets_result.data
-            
-            # 언론사 ID를 이름으로 매핑
-            media_id_to_name = {media['id']: media['name'] for media in media_outlets}
-            
-            print(f"📊 {len(issues)}개 이슈, {len(common_points)}개 공통점, {len(bias_summaries)}개 편향성 요약, {len(media_summaries)}개 언론사 요약 로드 완료\n")
-            
-            # 각 이슈별로 레포트 생성
-            all_reports = []
-            
-            for issue in issues:
-                issue_id = issue['id']
-                print(f"📊 이슈 {issue_id} 레포트 생성 중...")
-                
-                # 해당 이슈의 관련 데이터 수집
-                issue_common_points = [cp for cp in common_points if cp['issue_id'] == issue_id]
-                issue_bias_summaries = [bs for bs in bias_summaries if bs['issue_id'] == issue_id]
-                issue_media_summaries = [ms for ms in media_summaries if ms['issue_id'] == issue_id]
-                
-                # 레포트 생성
-                report = self._create_issue_report(
-                    issue, 
-                    issue_common_points, 
-                    issue_bias_summaries, 
-                    issue_media_summaries,
-                    media_id_to_name
-                )
-                
-                all_reports.append(report)
-                print(f"   ✅ 이슈 {issue_id} 레포트 생성 완료")
-            
-            # 전체 레포트를 JSON으로 저장
-            self._save_reports_to_json(all_reports)
-            
-            # HTML 형태로도 저장 (블로그용)
-            self._save_reports_to_html(all_reports)
-            
-            print("\n✅ 모든 이슈 레포트 생성 완료!")
-            print("🎉 JSON과 HTML 형태로 저장되었습니다!")
-            
-        except Exception as e:
-            print(f"❌ 레포트 생성 중 오류 발생: {e}")
-    
-    def _create_issue_report(self, issue: Dict, common_points: List[Dict], 
-                            bias_summaries: List[Dict], media_summaries: List[Dict],
-                            media_id_to_name: Dict[int, str]) -> Dict:
-        """개별 이슈 레포트를 생성합니다."""
-        report = {
-            'issue_id': issue['id'],
-            'title': issue.get('title', '제목 없음'),
-            'subtitle': issue.get('subtitle', '부제목 없음'),
-            'summary': issue.get('summary', '요약 없음'),
-            'dominant_bias': issue.get('dominant_bias', '알 수 없음'),
-            'source_count': issue.get('source_count', 0),
-            'created_at': issue.get('created_at', ''),
-            'updated_at': issue.get('updated_at', ''),
-            'eli5': issue.get('eli5', 'ELI5 설명 없음'),
-            
-            # 편향성 퍼센트 (게이지바용)
-            'bias_percentages': {
-                'left': issue.get('bias_left_pct', 0),
-                'center': issue.get('bias_center_pct', 0),
-                'right': issue.get('bias_right_pct', 0)
-            },
-            
-            # Common Points
-            'common_points': {
-                'main_topics': [],
-                'common_keywords': [],
-                'core_issues': [],
-                'political_context': '',
-                'media_bias_patterns': ''
-            },
-            
-            # Bias Summaries
-            'bias_summaries': {
-                'left': '',
-                'center': '',
-                'right': ''
-            },
-            
-            # Media Summaries
-            'media_summaries': []
-        }
-        
-        # Common Points 정리
-        for cp in common_points:
-            point = cp['point']
-            if '주요 주제:' in point:
-                topic = point.replace('주요 주제:', '').strip()
-                if topic not in report['common_points']['main_topics']:
-                    report['common_points']['main_topics'].append(topic)
-            elif '공통 키워드:' in point:
-                keyword = point.replace('공통 키워드:', '').strip()
-                if keyword not in report['common_points']['common_keywords']:
-                    report['common_points']['common_keywords'].append(keyword)
-            elif '핵심 이슈:' in point:
-                core_issue = point.replace('핵심 이슈:', '').strip()
-                if core_issue not in report['common_points']['core_issues']:
-                    report['common_points']['core_issues'].append(core_issue)
-            elif '정치적 맥락:' in point:
-                report['common_points']['political_context'] = point.replace('정치적 맥락:', '').strip()
-            elif '언론사 편향성:' in point:
-                report['common_points']['media_bias_patterns'] = point.replace('언론사 편향성:', '').strip()
-        
-        # Bias Summaries 정리
-        for bs in bias_summaries:
-            bias_type = bs['bias'].lower()
-            if bias_type in report['bias_summaries']:
-                report['bias_summaries'][bias_type] = bs['summary']
-        
-        # Media Summaries 정리
-        for ms in media_summaries:
-            media_name = media_id_to_name.get(ms['media_id'], f"언론사_{ms['media_id']}")
-            report['media_summaries'].append({
-                'media_name': media_name,
-                'media_id': ms['media_id'],
-                'summary': ms['summary']
-            })
-        
-        return report
-    
-    def _save_reports_to_json(self, reports: List[Dict]):
-        """레포트를 JSON 파일로 저장합니다."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # 전체 레포트
-        all_reports_file = f"outputs/issue_reports_{timestamp}.json"
-        with open(all_reports_file, 'w', encoding='utf-8') as f:
-            json.dump(reports, f, ensure_ascii=False, indent=2)
-        
-        # 최신 레포트
-        latest_file = "outputs/issue_reports_latest.json"
-        with open(latest_file, 'w', encoding='utf-8') as f:
-            json.dump(reports, f, ensure_ascii=False, indent=2)
-        
-        print(f"📁 JSON 파일 저장 완료:")
-        print(f"   - 전체: {all_reports_file}")
-        print(f"   - 최신: {latest_file}")
-    
-    def _save_reports_to_html(self, reports: List[Dict]):
-        """레포트를 HTML 파일로 저장합니다 (블로그용)."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # 전체 레포트 HTML
-        all_reports_html = f"outputs/issue_reports_{timestamp}.html"
-        with open(all_reports_html, 'w', encoding='utf-8') as f:
-            f.write(self._generate_html_content(reports))
-        
-        # 최신 레포트 HTML
-        latest_html = "outputs/issue_reports_latest.html"
-        with open(latest_html, 'w', encoding='utf-8') as f:
-            f.write(self._generate_html_content(reports))
-        
-        print(f"📁 HTML 파일 저장 완료:")
-        print(f"   - 전체: {all_reports_html}")
-        print(f"   - 최신: {latest_html}")
-    
-    def _generate_html_content(self, reports: List[Dict]) -> str:
-        """HTML 콘텐츠를 생성합니다."""
-        html_content = """
+LATEST_REPORTS_JSON = "outputs/issue_reports_latest.json"
+
+# 레포트 HTML의 고정 부분 (doctype, CSS, 컨테이너 시작/끝)
+_HTML_HEAD = """
 <!DOCTYPE html>
 <html lang="ko">
 <head>
@@ -451,18 +271,251 @@ class IssueReportGenerator:
 <body>
     <div class="container">
         <h1>📊 뉴스 이슈 분석 레포트</h1>
-        <div class="timestamp">생성 시간: """ + datetime.now().strftime("%Y년 %m월 %d일 %H:%M") + """</div>
 """
-        
-        for report in reports:
-            html_content += self._generate_issue_html(report)
-        
-        html_content += """
+
+# 언론사 편향성 → (이모지, CSS 클래스)
+_BIAS_META = {
+    'left': ('🔵', 'media-left'),
+    'right': ('🔴', 'media-right'),
+    'center': ('⚪', 'media-center'),
+}
+
+_HTML_TAIL = """
     </div>
 </body>
 </html>
 """
-        return html_content
+
+
+class IssueReportGenerator:
+    # common_points.point 접두어 → 레포트 필드
+    _PREFIX_MAP = {
+        '주요 주제': 'main_topics',
+        '공통 키워드': 'common_keywords',
+        '핵심 이슈': 'core_issues',
+        '정치적 맥락': 'political_context',
+        '언론사 편향성': 'media_bias_patterns',
+    }
+    # 여러 값을 모으는(리스트) 필드
+    _LIST_KEYS = frozenset({'main_topics', 'common_keywords', 'core_issues'})
+    
+    def __init__(self):
+        self.sm = UnifiedSupabaseManager()
+        
+    def generate_all_issue_reports(self, since: Optional[str] = None, only_ids: Optional[Set[int]] = None):
+        """모든 이슈에 대해 레포트를 생성합니다.
+        
+        since 또는 only_ids가 주어지면 해당 이슈만 다시 생성하고,
+        기존 issue_reports_latest.json의 나머지 레포트는 그대로 유지합니다.
+        """
+        print("🚀 이슈별 레포트 생성 시작")
+        print("=" * 60)
+        
+        incremental = since is not None or only_ids is not None
+        
+        try:
+            # 이슈와 하위 데이터(공통점/편향성 요약/언론사 요약)를 뷰에서 한 번에 로드
+            issues = self._fetch_issue_report_rows(since=since, only_ids=only_ids)
+            
+            if not issues and not incremental:
+                print("❌ 이슈 데이터를 찾을 수 없습니다.")
+                return
+            
+            if incremental:
+                print(f"📊 변경된 이슈 {len(issues)}개 로드 완료 (since={since}, ids={sorted(only_ids) if only_ids else '-'})\n")
+                if not issues:
+                    print("✅ 변경된 이슈가 없어 레포트를 다시 생성하지 않습니다.")
+                    return
+            else:
+                print(f"📊 {len(issues)}개 이슈 로드 완료\n")
+            
+            # 각 이슈별로 레포트 생성
+            all_reports = []
+            
+            for issue in issues:
+                issue_id = issue['id']
+                print(f"📊 이슈 {issue_id} 레포트 생성 중...")
+                
+                report = self._create_issue_report(issue)
+                
+                all_reports.append(report)
+                print(f"   ✅ 이슈 {issue_id} 레포트 생성 완료")
+            
+            # 증분 생성이면 기존 최신 레포트에 변경분만 반영
+            if incremental:
+                all_reports = self._merge_with_latest_reports(all_reports)
+            
+            # 전체 레포트를 JSON으로 저장
+            self._save_reports_to_json(all_reports)
+            
+            # HTML 형태로도 저장 (블로그용)
+            self._save_reports_to_html(all_reports)
+            
+            print("\n✅ 모든 이슈 레포트 생성 완료!")
+            print("🎉 JSON과 HTML 형태로 저장되었습니다!")
+            
+        except Exception as e:
+            print(f"❌ 레포트 생성 중 오류 발생: {e}")
+    
+    def _fetch_issue_report_rows(self, since: Optional[str] = None, only_ids: Optional[Set[int]] = None) -> List[Dict]:
+        """issue_report_v 뷰에서 이슈별 레포트 데이터를 한 번의 요청으로 조회합니다."""
+        def query():
+            q = self.sm.client.table('issue_report_v').select('*')
+            if since is not None:
+                q = q.gt('updated_at', since)
+            if only_ids is not None:
+                q = q.in_('id', sorted(only_ids))
+            return q.order('id').execute()
+        
+        try:
+            result = query()
+        except Exception as e:
+            # 뷰는 scripts/setup_report_schema.py에서 미리 생성 (레포트 생성 중에는 DDL 실행 안 함)
+            print(f"❌ issue_report_v 조회 실패 (scripts/setup_report_schema.py 실행 필요): {e}")
+            raise
+        
+        return result.data or []
+    
+    def _merge_with_latest_reports(self, reports: List[Dict]) -> List[Dict]:
+        """기존 최신 레포트에서 변경된 이슈만 교체하고 새 이슈는 추가합니다."""
+        if not os.path.exists(LATEST_REPORTS_JSON):
+            return reports
+        
+        with open(LATEST_REPORTS_JSON, 'rb') as f:
+            existing = orjson.loads(f.read())
+        
+        # 기존 순서는 유지하고, 기존에 없던 이슈는 뒤에 추가
+        updated = {report['issue_id']: report for report in reports}
+        merged = [updated.pop(report['issue_id'], report) for report in existing]
+        merged.extend(updated.values())
+        
+        print(f"📎 기존 레포트 {len(existing)}개에 변경분 {len(reports)}개 반영")
+        return merged
+    
+    def _create_issue_report(self, issue: Dict) -> Dict:
+        """개별 이슈 레포트를 생성합니다."""
+        common_points = issue.get('common_points') or []
+        bias_summaries = issue.get('bias_summaries') or []
+        media_summaries = issue.get('media_summaries') or []
+        
+        report = {
+            'issue_id': issue['id'],
+            'title': issue.get('title', '제목 없음'),
+            'subtitle': issue.get('subtitle', '부제목 없음'),
+            'summary': issue.get('summary', '요약 없음'),
+            'dominant_bias': issue.get('dominant_bias', '알 수 없음'),
+            'source_count': issue.get('source_count', 0),
+            'created_at': issue.get('created_at', ''),
+            'updated_at': issue.get('updated_at', ''),
+            'eli5': issue.get('eli5', 'ELI5 설명 없음'),
+            
+            # 편향성 퍼센트 (게이지바용)
+            'bias_percentages': {
+                'left': issue.get('bias_left_pct', 0),
+                'center': issue.get('bias_center_pct', 0),
+                'right': issue.get('bias_right_pct', 0)
+            },
+            
+            # Common Points
+            'common_points': {
+                'main_topics': [],
+                'common_keywords': [],
+                'core_issues': [],
+                'political_context': '',
+                'media_bias_patterns': ''
+            },
+            
+            # Bias Summaries
+            'bias_summaries': {
+                'left': '',
+                'center': '',
+                'right': ''
+            },
+            
+            # Media Summaries
+            'media_summaries': []
+        }
+        
+        # Common Points 정리 (접두어 한 번 분리 후 테이블로 분기)
+        seen = {key: set() for key in self._LIST_KEYS}
+        for cp in common_points:
+            prefix, sep, rest = cp['point'].partition(':')
+            key = self._PREFIX_MAP.get(prefix.strip()) if sep else None
+            if key is None:
+                continue
+            value = rest.strip()
+            if key in self._LIST_KEYS:
+                if value not in seen[key]:
+                    seen[key].add(value)
+                    report['common_points'][key].append(value)
+            else:
+                report['common_points'][key] = value
+        
+        # Bias Summaries 정리
+        for bs in bias_summaries:
+            bias_type = bs['bias'].lower()
+            if bias_type in report['bias_summaries']:
+                report['bias_summaries'][bias_type] = bs['summary']
+        
+        # Media Summaries 정리
+        for ms in media_summaries:
+            media_name = ms.get('media_name') or f"언론사_{ms['media_id']}"
+            report['media_summaries'].append({
+                'media_name': media_name,
+                'media_id': ms['media_id'],
+                'summary': ms['summary']
+            })
+        
+        return report
+    
+    def _save_reports_to_json(self, reports: List[Dict]):
+        """레포트를 JSON 파일로 저장합니다."""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        
+        # 한 번만 직렬화해서 두 파일에 그대로 기록 (orjson은 UTF-8 bytes를 바로 반환)
+        payload = orjson.dumps(reports, option=orjson.OPT_INDENT_2)
+        
+        # 전체 레포트
+        all_reports_file = f"outputs/issue_reports_{timestamp}.json"
+        with open(all_reports_file, 'wb') as f:
+            f.write(payload)
+        
+        # 최신 레포트
+        latest_file = LATEST_REPORTS_JSON
+        with open(latest_file, 'wb') as f:
+            f.write(payload)
+        
+        print(f"📁 JSON 파일 저장 완료:")
+        print(f"   - 전체: {all_reports_file}")
+        print(f"   - 최신: {latest_file}")
+    
+    def _save_reports_to_html(self, reports: List[Dict]):
+        """레포트를 HTML 파일로 저장합니다 (블로그용)."""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        
+        html_content = self._generate_html_content(reports)
+        
+        # 전체 레포트 HTML
+        all_reports_html = f"outputs/issue_reports_{timestamp}.html"
+        with open(all_reports_html, 'w', encoding='utf-8') as f:
+            f.write(html_content)
+        
+        # 최신 레포트 HTML
+        latest_html = "outputs/issue_reports_latest.html"
+        with open(latest_html, 'w', encoding='utf-8') as f:
+            f.write(html_content)
+        
+        print(f"📁 HTML 파일 저장 완료:")
+        print(f"   - 전체: {all_reports_html}")
+        print(f"   - 최신: {latest_html}")
+    
+    def _generate_html_content(self, reports: List[Dict]) -> str:
+        """HTML 콘텐츠를 생성합니다."""
+        timestamp = datetime.now().strftime("%Y년 %m월 %d일 %H:%M")
+        parts = [_HTML_HEAD, f'        <div class="timestamp">생성 시간: {timestamp}</div>\n']
+        parts.extend(self._generate_issue_html(report) for report in reports)
+        parts.append(_HTML_TAIL)
+        return ''.join(parts)
     
     def _generate_issue_html(self, report: Dict) -> str:
         """개별 이슈의 HTML을 생성합니다."""
@@ -471,12 +524,18 @@ class IssueReportGenerator:
         center_pct = report['bias_percentages']['center']
         right_pct = report['bias_percentages']['right']
         
-        html = f"""
+        # 반복 사용되는 값은 미리 계산
+        dominant_bias_class = report['dominant_bias'].lower()
+        summary_html = report['summary'].replace('\n', '<br>')
+        eli5 = report['eli5']
+        eli5_html = eli5.replace('\n', '<br>') if eli5 and eli5 != 'ELI5 설명 없음' else 'ELI5 설명이 준비 중입니다.'
+        
+        parts = [f"""
         <div class="issue-card">
             <div class="issue-header">
                 <div class="issue-title">{report['title']}</div>
                 <div class="issue-subtitle">{report['subtitle']}</div>
-                <div class="issue-summary">{report['summary'].replace(chr(10), '<br>')}</div>
+                <div class="issue-summary">{summary_html}</div>
             </div>
             
             <div class="stats">
@@ -485,7 +544,7 @@ class IssueReportGenerator:
                     <div class="stat-label">📊 기사 수</div>
                 </div>
                 <div class="stat-item">
-                    <div class="stat-number bias-{report['dominant_bias'].lower()}">{report['dominant_bias']}</div>
+                    <div class="stat-number bias-{dominant_bias_class}">{report['dominant_bias']}</div>
                     <div class="stat-label">🎯 주요 편향성</div>
                 </div>
                 <div class="stat-item">
@@ -543,28 +602,21 @@ class IssueReportGenerator:
             <div class="section">
                 <div class="section-title">🧒 5살 아이도 이해할 수 있는 설명 (ELI5)</div>
                 <div class="point-item eli5-content">
-                    {report['eli5'].replace(chr(10), '<br>') if report['eli5'] and report['eli5'] != 'ELI5 설명 없음' else 'ELI5 설명이 준비 중입니다.'}
+                    {eli5_html}
                 </div>
             </div>
             
             <div class="section">
                 <div class="section-title">📺 언론사별 보도 경향</div>
-"""
+"""]
         
         for media in report['media_summaries']:
             # 언론사 편향성에 따른 이모지와 색상 클래스 결정
-            media_bias = media.get('media_bias', 'center').lower()
-            if media_bias == 'left':
-                bias_emoji = '🔵'
-                bias_class = 'media-left'
-            elif media_bias == 'right':
-                bias_emoji = '🔴'
-                bias_class = 'media-right'
-            else:
-                bias_emoji = '⚪'
-                bias_class = 'media-center'
+            bias_emoji, bias_class = _BIAS_META.get(
+                media.get('media_bias', 'center').lower(), _BIAS_META['center']
+            )
             
-            html += f"""
+            parts.append(f"""
                 <div class="media-item {bias_class}">
                     <div class="media-header">
                         <span class="media-name">{media['media_name']}</span>
@@ -572,23 +624,40 @@ class IssueReportGenerator:
                     </div>
                     <div class="media-summary">{media['summary']}</div>
                 </div>
-"""
+""")
         
-        html += """
+        parts.append("""
             </div>
         </div>
-"""
-        return html
+""")
+        return ''.join(parts)
+
+
+def _parse_since(value: str) -> str:
+    """--since 값을 ISO 시각 문자열로 변환합니다 ('auto'는 최신 JSON 파일의 수정 시각)."""
+    if value != 'auto':
+        return value
+    if not os.path.exists(LATEST_REPORTS_JSON):
+        raise argparse.ArgumentTypeError(f"{LATEST_REPORTS_JSON} 파일이 없어 --since auto를 사용할 수 없습니다.")
+    return datetime.fromtimestamp(os.path.getmtime(LATEST_REPORTS_JSON), tz=timezone.utc).isoformat()
 
 
 def main():
     """메인 함수"""
+    parser = argparse.ArgumentParser(description='이슈별 레포트 생성 스크립트')
+    parser.add_argument('--since', type=_parse_since,
+                        help="이 시각 이후 updated_at이 바뀐 이슈만 다시 생성 (ISO 시각 또는 'auto': 최신 JSON 수정 시각)")
+    parser.add_argument('--ids', type=int, nargs='+', help='다시 생성할 이슈 ID 목록')
+    args = parser.parse_args()
+    
     try:
         generator = IssueReportGenerator()
-        generator.generate_all_issue_reports()
+        generator.generate_all_issue_reports(
+            since=args.since,
+            only_ids=set(args.ids) if args.ids else None
+        )
     except Exception as e:
         print(f"❌ 메인 실행 중 오류 발생: {e}")
 
-
 if __name__ == "__main__":
     main()
@@ -11,9 +11,18 @@ import os
 import sys
 import json
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from collections import defaultdict
 
+import httpx
+
+# HTTP/2는 h2 패키지가 있을 때만 사용 (pip install httpx[http2])
+try:
+    import h2  # type: ignore  # noqa: F401
+    HTTP2_AVAILABLE = True
+except Exception:
+    HTTP2_AVAILABLE = False
+
 # utils 모듈 import를 위한 경로 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -27,6 +36,13 @@ class MediaSummariesGenerator:
         if not self.openai_api_key:
             raise ValueError("OPENAI_API_KEY 환경변수가 설정되지 않았습니다.")
         
+        # OpenAI 동시 요청 수
+        self.max_concurrent = 8
+        # 언론사별 요약에 사용할 최대 기사 수
+        self.max_articles_per_media = 20
+        self._client: Optional[httpx.AsyncClient] = None
+        self._pending_rows: List[Dict] = []
+        
     async def generate_media_summaries(self):
         """모든 클러스터에 대해 Media Summaries를 생성합니다."""
         print("🚀 Media Summaries 생성 시작")
@@ -51,52 +67,67 @@ class MediaSummariesGenerator:
             
             print(f"📊 {len(articles)}개 기사, {len(issues)}개 클러스터, {len(media_outlets)}개 언론사 로드 완료\n")
             
-            # 각 클러스터에 대해 Media Summaries 생성
-            for issue in issues:
-                cluster_id = issue['id']
-                print(f"📊 클러스터 {cluster_id} Media Summaries 생성 중...")
-                
-                # 해당 클러스터의 기사들 수집
-                cluster_articles = [article for article in articles if article.get('issue_id') == cluster_id]
-                
-                if not cluster_articles:
-                    print(f"⚠️ 클러스터 {cluster_id}: 기사가 없습니다.")
+            # 기사들을 (클러스터, 언론사) 단위로 한 번에 그룹화
+            buckets: Dict[Tuple[int, int], List[Dict]] = defaultdict(list)
+            for article in articles:
+                issue_id = article.get('issue_id')
+                media_id = article.get('media_id')
+                if issue_id and media_id:
+                    buckets[(issue_id, media_id)].append(article)
+            
+            # 언론사 이름은 언론사별로 한 번만 결정 (이름이 없으면 기본값)
+            media_names = {
+                media_id: media_id_to_name.get(media_id) or f"언론사_{media_id}"
+                for media_id in {media_id for _, media_id in buckets}
+            }
+            
+            # 각 클러스터·언론사 조합별 요약 작업 수집
+            issue_ids = {issue['id'] for issue in issues}
+            jobs = [
+                (cluster_id, media_id, media_articles_list, media_names[media_id])
+                for (cluster_id, media_id), media_articles_list in buckets.items()
+                if cluster_id in issue_ids
+            ]
+            
+            for cluster_id in sorted(issue_ids - {job[0] for job in jobs}):
+                print(f"⚠️ 클러스터 {cluster_id}: 기사가 없습니다.")
+            
+            print(f"📊 {len(jobs)}개 언론사 요약 생성 중 (동시 {self.max_concurrent}개)...")
+            
+            # 세마포어로 동시 요청 수를 제한하면서 OpenAI 호출을 병렬 처리
+            semaphore = asyncio.Semaphore(self.max_concurrent)
+            
+            async def summarize_with_semaphore(cluster_id, media_id, media_articles_list, media_name):
+                async with semaphore:
+                    print(f"   📰 클러스터 {cluster_id} - {media_name} ({len(media_articles_list)}개 기사) 분석 중...")
+                    summary = await self._generate_media_summary(cluster_id, media_id, media_articles_list, media_name)
+                    return cluster_id, media_id, summary
+            
+            try:
+                completed = await asyncio.gather(
+                    *(summarize_with_semaphore(*job) for job in jobs),
+                    return_exceptions=True
+                )
+            finally:
+                await self._close_client()
+            
+            # 데이터베이스에 저장
+            for result in completed:
+                if isinstance(result, Exception):
+                    print(f"❌ 언론사 요약 생성 실패: {result}")
                     continue
-                
-                # 언론사별로 기사 그룹화
-                media_articles = self._group_articles_by_media(cluster_articles)
-                
-                # 각 언론사별로 요약 생성
-                for media_id, media_articles_list in media_articles.items():
-                    if media_articles_list:
-                        media_name = media_id_to_name.get(media_id, f"언론사_{media_id}")
-                        print(f"   📰 {media_name} ({len(media_articles_list)}개 기사) 분석 중...")
-                        
-                        # Media Summary 생성
-                        media_summary = await self._generate_media_summary(cluster_id, media_id, media_articles_list, media_name)
-                        
-                        # 데이터베이스에 저장
-                        self._save_media_summary(cluster_id, media_id, media_summary)
-                
-                print()
+                cluster_id, media_id, media_summary = result
+                self._save_media_summary(cluster_id, media_id, media_summary)
+            
+            self._flush_media_summaries()
             
+            print()
             print("✅ Media Summaries 생성 완료!")
             print("\n🎉 모든 Media Summaries가 성공적으로 생성되었습니다!")
             
         except Exception as e:
             print(f"❌ Media Summaries 생성 중 오류 발생: {e}")
     
-    def _group_articles_by_media(self, articles: List[Dict]) -> Dict[int, List[Dict]]:
-        """기사들을 언론사별로 그룹화합니다."""
-        media_articles = defaultdict(list)
-        
-        for article in articles:
-            media_id = article.get('media_id')
-            if media_id:
-                media_articles[media_id].append(article)
-        
-        return dict(media_articles)
-    
     async def _generate_media_summary(self, cluster_id: int, media_id: int, articles: List[Dict], media_name: str) -> str:
         """특정 언론사의 기사들을 분석하여 요약을 생성합니다."""
         try:
@@ -114,57 +145,72 @@ class MediaSummariesGenerator:
     
     def _combine_media_articles_content(self, articles: List[Dict], media_name: str) -> str:
         """특정 언론사의 기사들을 결합합니다."""
-        combined = [f"**{media_name}의 기사들:**\n"]
+        # 제목·본문이 모두 있는 기사만 골라 앞 300자만 사용 (최대 max_articles_per_media개)
+        pairs = [
+            (article['title'], article['content'][:300])
+            for article in articles
+            if article.get('title') and article.get('content')
+        ][:self.max_articles_per_media]
         
-        for i, article in enumerate(articles, 1):
-            title = article.get('title', '')
-            content = article.get('content', '')
-            
-            if title and content:
-                combined.append(f"{i}. 제목: {title}")
-                combined.append(f"   내용: {content[:300]}...")
-                combined.append("")
+        combined = [f"**{media_name}의 기사들:**\n"]
+        combined.extend(
+            f"{i}. 제목: {title}\n   내용: {content}...\n"
+            for i, (title, content) in enumerate(pairs, 1)
+        )
         
         return "\n".join(combined)
     
-    async def _call_openai_api(self, content: str, media_name: str) -> str:
-        """OpenAI API를 호출하여 언론사별 요약을 수행합니다."""
-        import httpx
-        
-        prompt = self._create_media_analysis_prompt(content, media_name)
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://api.openai.com/v1/chat/completions",
+    async def _ensure_client(self) -> httpx.AsyncClient:
+        """OpenAI 호출에 재사용할 AsyncClient를 (처음 한 번만) 생성합니다."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                timeout=60.0,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
                 headers={
                     "Authorization": f"Bearer {self.openai_api_key}",
                     "Content-Type": "application/json"
-                },
-                json={
-                    "model": "gpt-4o-mini",
-                    "messages": [
-                        {
-                            "role": "system",
-                            "content": "당신은 한국 언론사의 보도 경향을 분석하는 전문가입니다. 각 언론사의 기사들을 분석하여 해당 언론사의 관점과 편향성을 정확하게 요약해주세요."
-                        },
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ],
-                    "max_tokens": 1000,
-                    "temperature": 0.3
-                },
-                timeout=60.0
+                }
             )
-            
-            if response.status_code == 200:
-                result = response.json()
-                content_text = result['choices'][0]['message']['content']
-                return content_text
-            else:
-                print(f"❌ OpenAI API 호출 실패: {response.status_code}")
-                return f"{media_name}의 보도 경향 분석 중..."
+        return self._client
+    
+    async def _close_client(self):
+        """재사용 중인 AsyncClient를 닫습니다."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    async def _call_openai_api(self, content: str, media_name: str) -> str:
+        """OpenAI API를 호출하여 언론사별 요약을 수행합니다."""
+        prompt = self._create_media_analysis_prompt(content, media_name)
+        
+        client = await self._ensure_client()
+        response = await client.post(
+            "https://api.openai.com/v1/chat/completions",
+            json={
+                "model": "gpt-4o-mini",
+                "messages": [
+                    {
+                        "role": "system",
+                        "content": "당신은 한국 언론사의 보도 경향을 분석하는 전문가입니다. 각 언론사의 기사들을 분석하여 해당 언론사의 관점과 편향성을 정확하게 요약해주세요."
+                    },
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ],
+                "max_tokens": 1000,
+                "temperature": 0.3
+            }
+        )
+        
+        if response.status_code == 200:
+            result = response.json()
+            content_text = result['choices'][0]['message']['content']
+            return content_text
+        else:
+            print(f"❌ OpenAI API 호출 실패: {response.status_code}")
+            return f"{media_name}의 보도 경향 분석 중..."
     
     def _create_media_analysis_prompt(self, content: str, media_name: str) -> str:
         """언론사별 분석을 위한 프롬프트를 생성합니다."""
@@ -188,28 +234,39 @@ class MediaSummariesGenerator:
         return prompt
     
     def _save_media_summary(self, cluster_id: int, media_id: int, summary: str):
-        """Media Summary를 media_summaries 테이블에 저장합니다."""
+        """Media Summary를 저장 대기 목록에 추가합니다 (_flush_media_summaries에서 일괄 저장)."""
+        self._pending_rows.append({
+            'issue_id': cluster_id,
+            'media_id': media_id,
+            'summary': summary
+        })
+    
+    def _flush_media_summaries(self):
+        """대기 중인 Media Summaries를 media_summaries 테이블에 한 번에 upsert합니다."""
+        if not self._pending_rows:
+            return
+        
+        def upsert():
+            return self.sm.client.table('media_summaries').upsert(
+                self._pending_rows, on_conflict='issue_id,media_id'
+            ).execute()
+        
         try:
-            # 기존 media_summary 삭제 (중복 방지)
-            self.sm.client.table('media_summaries').delete().eq('issue_id', cluster_id).eq('media_id', media_id).execute()
-            
-            # 새로운 media_summary 삽입
-            summary_data = {
-                'issue_id': cluster_id,
-                'media_id': media_id,
-                'summary': summary
-            }
+            try:
+                result = upsert()
+            except Exception as e:
+                # (issue_id, media_id) 유니크 인덱스가 없으면 생성 후 한 번 더 시도
+                print(f"⚠️ media_summaries upsert 실패, 유니크 인덱스 생성 후 재시도: {e}")
+                if not self.sm.create_media_summaries_unique_index():
+                    raise
+                result = upsert()
             
-            result = self.sm.client.table('media_summaries').insert(summary_data).execute()
+            saved_count = len(result.data) if result.data else 0
+            print(f"✅ {saved_count}/{len(self._pending_rows)}개 Media Summary 저장 완료")
+            self._pending_rows = []
             
-            if result.data:
-                print(f"     ✅ {media_id} 저장 완료")
-            else:
-                print(f"     ❌ {media_id} 저장 실패")
-                
         except Exception as e:
-            print(f"     ❌ {media_id} 저장 실패: {e}")
-
+            print(f"❌ Media Summaries 일괄 저장 실패: {e}")
 
 async def main():
     """메인 함수"""
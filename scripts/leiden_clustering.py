@@ -6,7 +6,7 @@ Leiden 기반 그래프 클러스터링 파이프라인
 1) (title + lead 최대 500자) 임베딩 벡터를 L2 정규화
 2) FAISS(또는 sklearn NearestNeighbors, cosine)로 k=25 kNN 그래프 생성
 3) 엣지 가중치=코사인유사도, 무방향 그래프(igraph) 구성
-4) Leiden으로 resolution ∈ {0.8, 1.0, 1.2, 1.3} 스윕
+4) Leiden(igraph 내장 C 구현, modularity)으로 resolution 스윕
 5) 각 결과에 대해 (a) 클러스터 개수, (b) 최대/중간/최소 클러스터 크기, (c) 코사인 실루엣 스코어 계산
    → 가장 “10~20개”에 가까우면서 실루엣이 높은 모델 선택
 6) 선택 결과의 cluster_id를 Supabase articles.issue_id(또는 별도 mapping)로 저장
@@ -23,7 +23,10 @@ import os
 import sys
 import re
 import json
+import hashlib
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 from typing import Dict, List, Tuple
 
 import numpy as np
@@ -48,17 +51,26 @@ except Exception:
     FAISS_AVAILABLE = False
 
 from sklearn.neighbors import NearestNeighbors
-from sklearn.metrics import silhouette_score
-from sklearn.preprocessing import normalize
+from sklearn.metrics import pairwise_distances_chunked
 from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.decomposition import PCA
+from scipy.sparse import csr_matrix
 
 try:
     import igraph as ig
-    import leidenalg as la
 except Exception as e:
-    print("❌ igraph/leidenalg 미설치: pip install python-igraph leidenalg")
+    print("❌ igraph 미설치: pip install python-igraph")
     raise
 
+# igraph 내장(C) Leiden이 없으면(구버전) leidenalg 사용
+NATIVE_LEIDEN_AVAILABLE = hasattr(ig.Graph, 'community_leiden')
+if not NATIVE_LEIDEN_AVAILABLE:
+    try:
+        import leidenalg as la
+    except Exception as e:
+        print("❌ igraph 구버전이며 leidenalg 미설치: pip install -U python-igraph 또는 pip install leidenalg")
+        raise
+
 try:
     import umap
     UMAP_AVAILABLE = True
@@ -66,11 +78,40 @@ except Exception:
     UMAP_AVAILABLE = False
 
 
+# FAISS HNSW 설정 (n < HNSW_MIN_SIZE 이면 IndexFlatIP 사용)
+HNSW_MIN_SIZE = 5000
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 80
+HNSW_EF_SEARCH = 64  # 실제 값은 max(64, 2k)
+
+
+# 키워드 추출용 전체 TF-IDF 어휘 크기
+KEYWORD_MAX_FEATURES = 20000
+
+# articles.issue_id 업데이트 시 한 요청에 포함할 기사 ID 수
+ARTICLE_UPDATE_CHUNK = 1000
+
+# kNN 결과 캐시 디렉터리 (임베딩 해시 + k 기준)
+KNN_CACHE_DIR = os.path.join('outputs', 'knn_cache')
+
+# UMAP 전 PCA 사전 축소 차원
+UMAP_PCA_COMPONENTS = 50
+
+# embeddings 페이지 크기 / articles in_ 조회 시 한 요청의 ID 수
+SUPABASE_PAGE_SIZE = 5000
+SUPABASE_IN_CHUNK = 1000
+
+
 def parse_embedding(value) -> np.ndarray:
     """Supabase USER-DEFINED embedding을 numpy 배열로 파싱."""
     if isinstance(value, (list, np.ndarray)):
         return np.array(value, dtype=np.float32)
     if isinstance(value, str):
+        # pgvector 문자열 "[0.1,-0.2,...]" 빠른 경로 (C 파서)
+        if value.startswith('['):
+            arr = np.fromstring(value[1:-1], sep=',', dtype=np.float32)
+            if arr.size:
+                return arr
         nums = re.findall(r"-?\d+\.?\d*", value)
         arr = np.array([float(x) for x in nums], dtype=np.float32)
         return arr
@@ -78,77 +119,274 @@ def parse_embedding(value) -> np.ndarray:
 
 
 def l2_normalize_rows(matrix: np.ndarray) -> np.ndarray:
-    return normalize(matrix, norm='l2', axis=1)
+    """행 단위 L2 정규화. 연속 float32 배열이면 복사 없이 제자리에서 수행."""
+    matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+    if FAISS_AVAILABLE:
+        faiss.normalize_L2(matrix)
+    else:
+        matrix /= np.clip(np.linalg.norm(matrix, axis=1, keepdims=True), 1e-12, None)
+    return matrix
+
+
+def _drop_self_neighbors(idxs: np.ndarray, sims: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """k+1개 이웃 결과에서 자기 자신을 위치와 무관하게 제거하고 k개로 자름.
+
+    동일 벡터(동점)가 있으면 자기 자신이 첫 열이 아닐 수 있으므로 열 위치 대신 마스크로 제거한다.
+    """
+    self_mask = idxs == np.arange(idxs.shape[0])[:, None]
+    # 자기 자신이 아닌 열을 원래 순서대로 앞으로 모은 뒤 k개만 사용
+    order = np.argsort(self_mask, axis=1, kind='stable')[:, :k]
+    return np.take_along_axis(idxs, order, axis=1), np.take_along_axis(sims, order, axis=1)
 
 
 def build_knn_cosine(embeddings: np.ndarray, k: int = 25) -> Tuple[np.ndarray, np.ndarray]:
     """코사인 거리 기반 kNN 인덱스 구성. 반환: (indices, similarities)"""
     # 코사인 유사도 = 내적 (L2 정규화 전제)
     if FAISS_AVAILABLE:
-        index = faiss.IndexFlatIP(embeddings.shape[1])
-        index.add(embeddings.astype(np.float32))
-        sims, idxs = index.search(embeddings.astype(np.float32), k + 1)  # self 포함
-        # 첫 열은 자기 자신(유사도=1) 제거
-        return idxs[:, 1:], sims[:, 1:]
+        n, d = embeddings.shape
+        # 이미 연속 float32면 복사 없이 그대로 사용 (add/search가 같은 배열 공유)
+        emb_f32 = np.ascontiguousarray(embeddings, dtype=np.float32)
+        if n < HNSW_MIN_SIZE:
+            # 소규모에서는 전수 탐색(Flat)이 더 빠름
+            index = faiss.IndexFlatIP(d)
+        else:
+            # 대규모에서는 HNSW 근사 탐색 (내적 = 코사인 유사도)
+            index = faiss.IndexHNSWFlat(d, HNSW_M, faiss.METRIC_INNER_PRODUCT)
+            index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+        index.add(emb_f32)
+        if n >= HNSW_MIN_SIZE:
+            index.hnsw.efSearch = max(HNSW_EF_SEARCH, 2 * k)
+        sims, idxs = index.search(emb_f32, k + 1)  # self 포함
+        return _drop_self_neighbors(idxs, sims, k)
     # fallback: sklearn
     nn = NearestNeighbors(n_neighbors=k + 1, metric='cosine', algorithm='brute').fit(embeddings)
     distances, indices = nn.kneighbors(embeddings)
     # 코사인 유사도 = 1 - distance
     sims = 1.0 - distances
-    return indices[:, 1:], sims[:, 1:]
+    return _drop_self_neighbors(indices, sims, k)
 
 
-def knn_to_igraph(indices: np.ndarray, similarities: np.ndarray) -> ig.Graph:
-    """kNN 결과를 무방향 가중 그래프로 변환."""
-    n = indices.shape[0]
-    edges = []
-    weights = []
-    for i in range(n):
-        for j in range(indices.shape[1]):
-            nbr = int(indices[i, j])
-            w = float(similarities[i, j])
-            if i == nbr:
-                continue
-            # 무방향 그래프: (min,max)로 중복 방지
-            a, b = (i, nbr) if i < nbr else (nbr, i)
-            edges.append((a, b))
-            weights.append(w)
-    g = ig.Graph()
-    g.add_vertices(n)
-    g.add_edges(edges)
-    g.es['weight'] = weights
-    return g.simplify(combine_edges={'weight': 'mean'})
+def load_or_build_knn(embeddings: np.ndarray, k: int, cache_dir: str = KNN_CACHE_DIR) -> Tuple[np.ndarray, np.ndarray]:
+    """임베딩이 바뀌지 않았으면 디스크 캐시(.npz)에서 kNN 결과를 읽고, 없으면 계산 후 저장."""
+    emb = np.ascontiguousarray(embeddings, dtype=np.float32)
+    digest = hashlib.blake2b(emb.tobytes(), digest_size=16)
+    digest.update(repr(emb.shape).encode())
+    path = os.path.join(cache_dir, f'{digest.hexdigest()}_{k}.npz')
+    if os.path.exists(path):
+        try:
+            with np.load(path) as cached:
+                print(f'♻️ kNN 캐시 사용: {path}')
+                return cached['idxs'], cached['sims']
+        except Exception as e:
+            print(f'⚠️ kNN 캐시 로드 실패 (재계산): {e}')
+    idxs, sims = build_knn_cosine(emb, k=k)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        np.savez(path, idxs=idxs, sims=sims)
+    except Exception as e:
+        print(f'⚠️ kNN 캐시 저장 실패: {e}')
+    return idxs, sims
 
 
-def leiden_sweep(graph: ig.Graph, resolutions: List[float], embeddings: np.ndarray) -> Dict:
-    """여러 resolution에서 Leiden 실행 후 통계/실루엣 수집."""
-    results = {}
-    for res in resolutions:
-        # CPM 대신 Modularity 또는 RBConfiguration 사용으로 과분할 방지
+def knn_to_igraph(indices: np.ndarray, similarities: np.ndarray) -> ig.Graph:
+    """kNN 결과를 무방향 가중 그래프로 변환 (중복 엣지는 평균 가중치로 병합)."""
+    n, k = indices.shape
+    src = np.repeat(np.arange(n, dtype=np.int64), k)
+    dst = indices.ravel().astype(np.int64)
+    w = similarities.ravel().astype(np.float64)
+    # 자기 자신, (sklearn 등에서 나올 수 있는) 음수 인덱스, 유사도 0 이하 엣지 제거
+    # L2 정규화 임베딩의 top-k 이웃은 거의 항상 양수라 실제로 빠지는 엣지는 1% 미만
+    mask = (src != dst) & (dst >= 0) & (w > 0)
+    # 무방향 그래프: (min,max)로 정규화 후 하나의 int64 키로 묶어 중복 병합
+    a = np.minimum(src, dst)[mask]
+    b = np.maximum(src, dst)[mask]
+    keys, inverse = np.unique(a * n + b, return_inverse=True)
+    mean_w = np.bincount(inverse, weights=w[mask]) / np.bincount(inverse)
+    edge_a, edge_b = np.divmod(keys, n)
+    edges = list(zip(edge_a.tolist(), edge_b.tolist()))
+    graph = ig.Graph(n=n, edges=edges, edge_attrs={'weight': mean_w.tolist()})
+    # 중복 엣지/자기 루프는 위에서 이미 제거되었으므로 simplify()를 호출하지 않음 (python -O에서는 검사 생략)
+    assert graph.is_simple()
+    return graph
+
+
+def cosine_silhouette_scores(embeddings: np.ndarray, label_sets: List[np.ndarray],
+                             working_memory: int = 512) -> List[float]:
+    """여러 라벨 배정의 코사인 실루엣을 거리 행렬 한 번 순회로 계산.
+
+    pairwise_distances_chunked로 (chunk x n) 거리 블록만 메모리에 올리고,
+    각 블록에서 라벨 배정별 클러스터 거리 합을 누적한다 (n x n 행렬을 만들지 않음).
+    """
+    n = embeddings.shape[0]
+    sets = []
+    for labels in label_sets:
+        labels = np.asarray(labels)
+        n_clusters = int(labels.max()) + 1 if len(labels) else 0
+        indicator = csr_matrix((np.ones(n), (np.arange(n), labels)), shape=(n, n_clusters))
+        sets.append((labels, indicator, np.bincount(labels, minlength=n_clusters)))
+
+    def reduce_func(dist_chunk, start):
+        rows = np.arange(start, start + dist_chunk.shape[0])
+        chunk_scores = []
+        for labels, indicator, counts in sets:
+            if len(counts) < 2:
+                chunk_scores.append(np.zeros(len(rows)))
+                continue
+            # 각 점에서 클러스터별 평균 거리
+            sums = np.asarray((indicator.T @ dist_chunk.T).T)
+            own = labels[rows]
+            own_counts = counts[own]
+            a = sums[np.arange(len(rows)), own] / np.maximum(own_counts - 1, 1)
+            means = sums / counts
+            means[np.arange(len(rows)), own] = np.inf
+            b = means.min(axis=1)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                sil = (b - a) / np.maximum(a, b)
+            # 단일 원소 클러스터는 0 (sklearn과 동일)
+            sil = np.where(own_counts > 1, np.nan_to_num(sil), 0.0)
+            chunk_scores.append(sil)
+        return tuple(chunk_scores)
+
+    totals = np.zeros(len(sets))
+    for chunk in pairwise_distances_chunked(embeddings, metric='cosine', reduce_func=reduce_func,
+                                            working_memory=working_memory):
+        totals += [scores.sum() for scores in chunk]
+
+    return [float(total / n) if len(counts) > 1 else -1.0
+            for total, (_, _, counts) in zip(totals, sets)]
+
+
+def approx_cosine_silhouette(embeddings: np.ndarray, labels: np.ndarray) -> float:
+    """클러스터 중심 기반 근사 코사인 실루엣 (O(n·K)).
+
+    a = 자기 클러스터 중심까지의 거리, b = 가장 가까운 다른 중심까지의 거리.
+    스윕에서 resolution 비교용으로만 사용하고, 최종 선택 결과는 정확한 실루엣으로 다시 계산한다.
+    """
+    labels = np.asarray(labels)
+    n, d = embeddings.shape
+    n_clusters = int(labels.max()) + 1 if n else 0
+    if n_clusters < 2:
+        return -1.0
+    # 클러스터 중심 (L2 정규화 → 내적 = 코사인 유사도)
+    indicator = csr_matrix((np.ones(n), (labels, np.arange(n))), shape=(n_clusters, n))
+    counts = np.bincount(labels, minlength=n_clusters)
+    centroids = np.asarray(indicator @ embeddings, dtype=np.float32) / counts[:, None].astype(np.float32)
+    centroids /= np.clip(np.linalg.norm(centroids, axis=1, keepdims=True), 1e-12, None)
+
+    query = np.ascontiguousarray(embeddings, dtype=np.float32)
+    if FAISS_AVAILABLE:
+        # kNN 인덱스(기사 n개)는 재사용하지 않음: 여기서 필요한 것은 기사 → 중심(K개) 검색이라
+        # 인덱스 대상이 다르고, 중심 K개짜리 Flat 인덱스 생성 비용은 O(K·d)로 무시 가능
+        index = faiss.IndexFlatIP(d)
+        index.add(centroids)
+        top_sims, top_idx = index.search(query, 2)
+    else:
+        sims = query @ centroids.T
+        top_idx = np.argpartition(-sims, 1, axis=1)[:, :2]
+        top_sims = np.take_along_axis(sims, top_idx, axis=1)
+        # 두 후보를 유사도 내림차순으로 정렬
+        order = np.argsort(-top_sims, axis=1)
+        top_idx = np.take_along_axis(top_idx, order, axis=1)
+        top_sims = np.take_along_axis(top_sims, order, axis=1)
+    own_sim = np.einsum('ij,ij->i', query, centroids[labels])
+    # 가장 가까운 중심이 자기 클러스터면 두 번째, 아니면 첫 번째가 "다른 클러스터 중 최근접"
+    other_sim = np.where(top_idx[:, 0] == labels, top_sims[:, 1], top_sims[:, 0])
+    a = 1.0 - own_sim
+    b = 1.0 - other_sim
+    with np.errstate(invalid='ignore', divide='ignore'):
+        sil = np.nan_to_num((b - a) / np.maximum(a, b))
+    # 단일 원소 클러스터는 0 (sklearn과 동일)
+    sil[counts[labels] <= 1] = 0.0
+    return float(sil.mean())
+
+
+def _modularity_weights(graph: ig.Graph) -> List[float]:
+    """Modularity용 엣지 가중치 (음수가 없으면 그대로, 있으면 절댓값).
+
+    knn_to_igraph가 만든 그래프는 양수 가중치만 가지므로 보통 그대로 반환된다.
+    """
+    # Modularity는 음수 가중치를 허용하지 않으므로 절댓값 사용
+    weights = graph.es['weight']
+    w_arr = np.asarray(weights, dtype=np.float64)
+    if (w_arr < 0).any():
+        return np.abs(w_arr).tolist()
+    return weights
+
+
+def _leiden_labels(graph: ig.Graph, res: float, weights: List[float]) -> np.ndarray:
+    """한 resolution에서 Leiden 실행 후 라벨 반환."""
+    # CPM 대신 Modularity(resolution 적용) 사용으로 과분할 방지
+    if NATIVE_LEIDEN_AVAILABLE:
+        part = graph.community_leiden(objective_function='modularity', weights=weights,
+                                      resolution=res, n_iterations=2)
+    else:
         try:
-            # Modularity는 음수 가중치를 허용하지 않으므로 절댓값 사용
-            weights = [abs(w) for w in graph.es['weight']]
             part = la.find_partition(graph, la.ModularityVertexPartition, weights=weights)
         except Exception:
             # fallback: RBConfiguration
             part = la.find_partition(graph, la.RBConfigurationVertexPartition, weights='weight', resolution_parameter=res)
-        labels = np.array(part.membership)
-        # 실루엣 (코사인 거리)
-        try:
-            sil = silhouette_score(embeddings, labels, metric='cosine') if len(np.unique(labels)) > 1 else -1.0
-        except Exception:
-            sil = -1.0
-        sizes = np.bincount(labels)
-        sizes_sorted = np.sort(sizes)
-        results[res] = {
-            'labels': labels,
-            'n_clusters': int(len(sizes)),
-            'size_min': int(sizes_sorted[0]) if len(sizes_sorted) else 0,
-            'size_med': int(np.median(sizes_sorted)) if len(sizes_sorted) else 0,
-            'size_max': int(sizes_sorted[-1]) if len(sizes_sorted) else 0,
-            'silhouette': float(sil),
-        }
-    return results
+    return np.asarray(part.membership)
+
+
+def _evaluate_resolution(graph: ig.Graph, res: float, embeddings: np.ndarray,
+                         weights: List[float]) -> Dict:
+    """한 resolution의 라벨/크기 통계/근사 실루엣 계산."""
+    labels = _leiden_labels(graph, res, weights)
+    sizes = np.bincount(labels)
+    sizes_sorted = np.sort(sizes)
+    # 실루엣: 스윕 비교는 중심 기반 근사값 사용 (정확한 값은 선택된 결과에만 계산)
+    try:
+        sil = approx_cosine_silhouette(embeddings, labels)
+    except Exception:
+        sil = -1.0
+    return {
+        'labels': labels,
+        'n_clusters': int(len(sizes)),
+        'size_min': int(sizes_sorted[0]) if len(sizes_sorted) else 0,
+        'size_med': int(np.median(sizes_sorted)) if len(sizes_sorted) else 0,
+        'size_max': int(sizes_sorted[-1]) if len(sizes_sorted) else 0,
+        'silhouette': float(sil),
+    }
+
+
+def _evaluate_resolution_worker(res: float, n: int, edges: np.ndarray, weights: np.ndarray,
+                                shm_name: str, shape: Tuple[int, int]) -> Tuple[float, Dict]:
+    """프로세스 워커: 엣지 배열로 그래프를 재구성하고 공유 메모리의 임베딩으로 평가."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        embeddings = np.ndarray(shape, dtype=np.float32, buffer=shm.buf)
+        weights = weights.tolist()
+        graph = ig.Graph(n=n, edges=edges.tolist(), edge_attrs={'weight': weights})
+        return res, _evaluate_resolution(graph, res, embeddings, weights)
+    finally:
+        shm.close()
+
+
+def leiden_sweep(graph: ig.Graph, resolutions: List[float], embeddings: np.ndarray) -> Dict:
+    """여러 resolution에서 Leiden 실행 후 통계/실루엣 수집 (코어가 여러 개면 프로세스 병렬)."""
+    # 가중치 변환은 resolution마다 반복하지 않고 한 번만 수행
+    weights = _modularity_weights(graph)
+    max_workers = min(len(resolutions), os.cpu_count() or 1)
+    if max_workers <= 1:
+        return {res: _evaluate_resolution(graph, res, embeddings, weights) for res in resolutions}
+
+    # igraph 객체 대신 엣지/가중치 배열을 넘기고, 임베딩은 공유 메모리로 한 번만 복사
+    edges = np.asarray(graph.get_edgelist(), dtype=np.int64).reshape(-1, 2)
+    weights = np.asarray(weights, dtype=np.float64)
+    emb = np.ascontiguousarray(embeddings, dtype=np.float32)
+    shm = shared_memory.SharedMemory(create=True, size=max(emb.nbytes, 1))
+    try:
+        np.ndarray(emb.shape, dtype=np.float32, buffer=shm.buf)[:] = emb
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_evaluate_resolution_worker, res, graph.vcount(), edges, weights, shm.name, emb.shape)
+                for res in resolutions
+            ]
+            results = dict(future.result() for future in futures)
+    finally:
+        shm.close()
+        shm.unlink()
+    return {res: results[res] for res in resolutions}
 
 
 def choose_best_result(results: Dict) -> Tuple[float, Dict]:
@@ -175,54 +413,94 @@ def choose_best_result(results: Dict) -> Tuple[float, Dict]:
 
 
 def extract_keywords_by_cluster(titles: List[str], labels: np.ndarray, n_top: int = 10) -> Dict[int, List[Tuple[str, float]]]:
-    """단순 TF-IDF로 군집별 상위 n-gram 키워드 추출."""
-    df = pd.DataFrame({'title': titles, 'label': labels})
+    """전체 코퍼스에 TF-IDF를 한 번만 학습하고 군집별 평균 점수로 상위 n-gram 키워드 추출."""
+    labels = np.asarray(labels)
+    texts = ["" if t is None else str(t) for t in titles]
+    # 단일 학습: 군집마다 어휘를 다시 만들지 않음 (IDF도 전체 기준이라 군집 고유어가 부각됨)
+    vectorizer = TfidfVectorizer(ngram_range=(1, 2), max_features=KEYWORD_MAX_FEATURES, min_df=1)
+    X = vectorizer.fit_transform(texts)
+    vocab = vectorizer.get_feature_names_out()
+    # (K x n) 지시 행렬 한 번의 희소 곱으로 모든 군집의 평균 TF-IDF(c-TF-IDF) 계산
+    uniq, inverse = np.unique(labels, return_inverse=True)
+    n = len(labels)
+    indicator = csr_matrix((np.ones(n), (inverse, np.arange(n))), shape=(len(uniq), n))
+    counts = np.bincount(inverse, minlength=len(uniq))
+    scores = np.asarray((indicator @ X).todense()) / counts[:, None]
+    # 전체 정렬 대신 군집별 상위 n개만 선택 후 그 n개만 정렬
+    top_n = min(n_top, scores.shape[1])
     keywords = {}
-    for label in sorted(df['label'].unique()):
-        texts = df[df['label'] == label]['title'].fillna("").astype(str).tolist()
-        if not texts:
-            keywords[label] = []
-            continue
-        # 클러스터 크기에 따라 동적 min_df 설정으로 충돌 방지
-        cluster_size = len(texts)
-        if cluster_size < 3:
-            # 소형 클러스터: uni-gram만, min_df=1
-            ngram_range = (1, 1)
-            min_df = 1
-        else:
-            # 대형 클러스터: bi-gram 포함, min_df=2
-            ngram_range = (1, 2)
-            min_df = 2
-        
-        vectorizer = TfidfVectorizer(ngram_range=ngram_range, max_features=5000, min_df=min_df)
-        X = vectorizer.fit_transform(texts)
-        vocab = np.array(vectorizer.get_feature_names_out())
-        # 평균 TF-IDF로 상위 n 추출
-        scores = np.asarray(X.mean(axis=0)).ravel()
-        top_idx = np.argsort(scores)[::-1][:n_top]
-        keywords[label] = [(vocab[i], float(scores[i])) for i in top_idx]
+    if top_n == 0:
+        return {label: [] for label in uniq}
+    top_idx = np.argpartition(-scores, top_n - 1, axis=1)[:, :top_n]
+    for k, label in enumerate(uniq):
+        row = scores[k]
+        idx = top_idx[k][np.argsort(-row[top_idx[k]])]
+        keywords[label] = [(vocab[i], float(row[i])) for i in idx if row[i] > 0]
     return keywords
 
 
-def load_embeddings_from_supabase() -> pd.DataFrame:
+def _fetch_articles_by_ids(sm, ids: List[int]) -> Dict[int, Dict]:
+    """기사 ID 목록에 해당하는 articles 행을 id -> row 딕셔너리로 반환."""
+    articles = {}
+    for start in range(0, len(ids), SUPABASE_IN_CHUNK):
+        chunk = ids[start:start + SUPABASE_IN_CHUNK]
+        # lead 컬럼 이슈(함수로 인식)로 인해 content를 사용
+        res = sm.client.table('articles').select('id, title, content').in_('id', chunk).execute()
+        for row in res.data or []:
+            articles[row['id']] = row
+    return articles
+
+
+def load_embeddings_from_supabase() -> Tuple[List[Dict], np.ndarray]:
+    """기사 메타데이터 리스트와 (n, d) float32 임베딩 행렬을 반환.
+
+    embeddings를 article_id 순으로 SUPABASE_PAGE_SIZE씩 페이지 단위로 읽고,
+    각 페이지의 기사만 in_ 조회하여 바로 float32 버퍼에 채운다.
+    """
     sm = UnifiedSupabaseManager()
-    emb = sm.client.table('embeddings').select('article_id, embedding').execute()
-    if not emb.data:
-        raise ValueError('embeddings 테이블에 데이터가 없습니다')
-    # lead 컬럼 이슈(함수로 인식)로 인해 content를 사용
-    arts = sm.client.table('articles').select('id, title, content, issue_id').execute()
-    if not arts.data:
-        raise ValueError('articles 테이블에 데이터가 없습니다')
-    df_emb = pd.DataFrame(emb.data)
-    df_art = pd.DataFrame(arts.data)
-    df = df_emb.merge(df_art, left_on='article_id', right_on='id', how='inner')
-    # 파싱 및 정제
-    df['embedding'] = df['embedding'].apply(parse_embedding)
-    df = df.dropna(subset=['embedding'])
-    # 차원 통일 (최소 차원)
-    min_dim = min(len(x) for x in df['embedding'])
-    df['embedding'] = df['embedding'].apply(lambda x: x[:min_dim].astype(np.float32))
-    return df
+    records: List[Dict] = []
+    blocks: List[np.ndarray] = []
+    min_dim = None
+    start = 0
+    while True:
+        page = (sm.client.table('embeddings')
+                .select('article_id, embedding')
+                .order('article_id')
+                .range(start, start + SUPABASE_PAGE_SIZE - 1)
+                .execute()).data or []
+        if not page:
+            break
+        # 서버 max-rows가 페이지 크기보다 작을 수 있으므로 실제 받은 행 수만큼 전진하고 빈 페이지에서 종료
+        fetched = len(page)
+        page = [row for row in page if row.get('embedding') is not None]
+        articles = _fetch_articles_by_ids(sm, [row['article_id'] for row in page])
+
+        buf = None
+        filled = 0
+        for row in page:
+            art = articles.get(row['article_id'])
+            if art is None:
+                continue
+            vec = parse_embedding(row['embedding'])
+            if buf is None:
+                buf = np.empty((len(page), vec.size), dtype=np.float32)
+            # 차원은 최소 차원으로 통일
+            dim = min(vec.size, buf.shape[1])
+            buf[filled, :dim] = vec[:dim]
+            min_dim = dim if min_dim is None else min(min_dim, dim)
+            records.append(art)
+            filled += 1
+        if filled:
+            blocks.append(buf[:filled])
+
+        start += fetched
+
+    if not records:
+        raise ValueError('embeddings/articles 테이블에 매칭되는 데이터가 없습니다')
+    if len(blocks) == 1 and blocks[0].shape[1] == min_dim:
+        return records, blocks[0]
+    embeddings = np.concatenate([b[:, :min_dim] for b in blocks], axis=0)
+    return records, embeddings
 
 
 def main():
@@ -232,19 +510,23 @@ def main():
     parser.add_argument('--update-articles', action='store_true', help='articles.issue_id에 저장 시도')
     parser.add_argument('--save-mapping', action='store_true', help='별도 매핑 테이블 저장 시도(article_cluster_mapping)')
     parser.add_argument('--save-umap', action='store_true', help='UMAP 2D 계산 및 CSV 저장')
+    parser.add_argument('--no-knn-cache', action='store_true', help='outputs/knn_cache의 kNN 캐시 사용 안 함')
     args = parser.parse_args()
 
     print('🚀 Leiden 클러스터링 시작')
-    df = load_embeddings_from_supabase()
+    records, embeddings = load_embeddings_from_supabase()
+    assert embeddings.dtype == np.float32
     # title + content 최대 500자
-    titles = (df['title'].fillna("").astype(str) + ' ' + df['content'].fillna("").astype(str)).str.slice(0, 500).tolist()
-    article_ids = df['id'].tolist()
+    titles = [f"{r.get('title') or ''} {r.get('content') or ''}"[:500] for r in records]
+    article_ids = [r['id'] for r in records]
 
-    embeddings = np.stack(df['embedding'].to_list()).astype(np.float32)
     embeddings = l2_normalize_rows(embeddings)
 
     print('🔗 kNN 그래프 구성 중...')
-    idxs, sims = build_knn_cosine(embeddings, k=args.k)
+    if args.no_knn_cache:
+        idxs, sims = build_knn_cosine(embeddings, k=args.k)
+    else:
+        idxs, sims = load_or_build_knn(embeddings, k=args.k)
     graph = knn_to_igraph(idxs, sims)
     print(f'✅ 그래프: |V|={graph.vcount()}, |E|={graph.ecount()}')
 
@@ -255,13 +537,18 @@ def main():
 
     # 요약 표 출력
     print('\n📊 스윕 결과 요약:')
-    print('resolution,n_clusters,size_min,size_med,size_max,silhouette')
+    print('resolution,n_clusters,size_min,size_med,size_max,silhouette(approx)')
     for r in resolutions:
         info = sweep[r]
         print(f"{r},{info['n_clusters']},{info['size_min']},{info['size_med']},{info['size_max']},{info['silhouette']:.4f}")
 
     best_res, best_info = choose_best_result(sweep)
     labels = best_info['labels']
+    # 선택된 결과만 정확한 코사인 실루엣 계산
+    try:
+        best_info['silhouette'] = cosine_silhouette_scores(embeddings, [labels])[0]
+    except Exception as e:
+        print(f"⚠️ 정확한 실루엣 계산 실패 (근사값 유지): {e}")
     print(f"\n✅ 선택된 resolution={best_res} → n_clusters={best_info['n_clusters']}, silhouette={best_info['silhouette']:.4f}")
 
     # 키워드 추출
@@ -277,8 +564,10 @@ def main():
     print('💾 issues 테이블에 클러스터 정보 저장 중...')
     issue_ids = {}  # cluster_label -> issue_id 매핑
     
-    # 각 클러스터를 issues 테이블에 저장
-    for cluster_label in sorted(set(labels)):
+    # 각 클러스터의 issues 행을 만들어 한 번에 삽입
+    cluster_labels = sorted(set(labels))
+    issue_rows = []
+    for cluster_label in cluster_labels:
         cluster_mask = labels == cluster_label
         cluster_titles = [titles[i] for i in range(len(titles)) if cluster_mask[i]]
         cluster_articles = [article_ids[i] for i in range(len(article_ids)) if cluster_mask[i]]
@@ -298,54 +587,74 @@ def main():
         bias_right_pct = 0.0
         dominant_bias = "Center"  # 기본값
         
-        try:
-            # issues 테이블에 삽입
-            issue_data = {
-                'title': cluster_title,
-                'subtitle': f"클러스터 {cluster_label}",
-                'summary': cluster_summary,
-                'bias_left_pct': bias_left_pct,
-                'bias_center_pct': bias_center_pct,
-                'bias_right_pct': bias_right_pct,
-                'dominant_bias': dominant_bias,
-                'source_count': len(cluster_articles),
-                'updated_at': datetime.utcnow().isoformat()
-            }
-            
-            result = sm.client.table('issues').insert(issue_data).execute()
-            if result.data:
-                issue_id = result.data[0]['id']
-                issue_ids[cluster_label] = issue_id
-                print(f"  ✅ 클러스터 {cluster_label}: issue_id {issue_id} 생성")
-            else:
-                print(f"  ❌ 클러스터 {cluster_label}: issues 테이블 저장 실패")
-                
-        except Exception as e:
-            print(f"  ❌ 클러스터 {cluster_label}: {e}")
+        issue_rows.append({
+            'title': cluster_title,
+            'subtitle': f"클러스터 {cluster_label}",
+            'summary': cluster_summary,
+            'bias_left_pct': bias_left_pct,
+            'bias_center_pct': bias_center_pct,
+            'bias_right_pct': bias_right_pct,
+            'dominant_bias': dominant_bias,
+            'source_count': len(cluster_articles),
+            'updated_at': datetime.utcnow().isoformat()
+        })
+    
+    try:
+        # 삽입된 행은 요청 순서대로 반환됨
+        result = sm.client.table('issues').insert(issue_rows).execute()
+        if result.data and len(result.data) == len(cluster_labels):
+            for cluster_label, row in zip(cluster_labels, result.data):
+                issue_ids[cluster_label] = row['id']
+                print(f"  ✅ 클러스터 {cluster_label}: issue_id {row['id']} 생성")
+        else:
+            print(f"  ❌ issues 테이블 저장 실패")
+    except Exception as e:
+        print(f"  ❌ issues 테이블 저장 실패: {e}")
     
     print(f'✅ 총 {len(issue_ids)}개 클러스터를 issues 테이블에 저장')
     
-    # articles.issue_id 업데이트
+    # articles.issue_id 업데이트: 이슈별로 기사 ID를 묶어 청크 단위로 갱신
     print('💾 articles.issue_id 업데이트 중...')
+    # 클러스터 라벨 -> issue 슬롯 배열을 만들어 기사별 issue를 한 번의 인덱싱으로 조회
+    # (issue id 타입에 무관하도록 슬롯 번호를 거쳐 매핑)
+    issue_list = list(issue_ids.values())
+    issue_slot = np.full(int(labels.max()) + 1 if len(labels) else 0, -1, dtype=np.int64)
+    for slot, cluster_label in enumerate(issue_ids):
+        issue_slot[cluster_label] = slot
+    article_slot = issue_slot[labels]
+    mask = article_slot >= 0
+    order = np.argsort(article_slot[mask], kind='stable')
+    grouped_slots = article_slot[mask][order]
+    grouped_ids = np.asarray(article_ids, dtype=object)[mask][order]
+    slots, starts = np.unique(grouped_slots, return_index=True)
+    
     updated_count = 0
-    for i, (article_id, cluster_label) in enumerate(zip(article_ids, labels)):
-        if cluster_label in issue_ids:
+    for slot, ids in zip(slots.tolist(), np.split(grouped_ids, starts[1:])):
+        issue_id = issue_list[slot]
+        ids = ids.tolist()
+        for start in range(0, len(ids), ARTICLE_UPDATE_CHUNK):
+            chunk = ids[start:start + ARTICLE_UPDATE_CHUNK]
             try:
                 result = sm.client.table('articles').update({
-                    'issue_id': issue_ids[cluster_label]
-                }).eq('id', article_id).execute()
+                    'issue_id': issue_id
+                }).in_('id', chunk).execute()
                 if result.data:
-                    updated_count += 1
+                    updated_count += len(result.data)
             except Exception as e:
-                print(f"  ⚠️ 기사 {article_id} 업데이트 실패: {e}")
+                print(f"  ⚠️ issue_id {issue_id} 기사 {len(chunk)}개 업데이트 실패: {e}")
     
     print(f'✅ articles.issue_id 업데이트 완료: {updated_count}개 기사')
 
     # UMAP 2D 저장(옵션)
     if args.save_umap and UMAP_AVAILABLE:
         print('🗺️ UMAP 2D 계산 중...')
+        # 고차원 그대로 넣으면 이웃 탐색이 병목이므로 PCA로 먼저 50차원 축소
+        n_components = min(UMAP_PCA_COMPONENTS, *embeddings.shape)
+        umap_input = embeddings
+        if n_components < embeddings.shape[1]:
+            umap_input = PCA(n_components=n_components, random_state=42).fit_transform(embeddings)
         reducer = umap.UMAP(n_neighbors=15, min_dist=0.1, n_components=2, metric='cosine', random_state=42)
-        emb2d = reducer.fit_transform(embeddings)
+        emb2d = reducer.fit_transform(umap_input)
         out = pd.DataFrame({
             'article_id': article_ids,
             'x': emb2d[:, 0],
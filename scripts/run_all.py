@@ -9,7 +9,7 @@ import sys
 import importlib
 import time
 from typing import List, Dict, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 # 프로젝트 루트 디렉토리를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -19,6 +19,12 @@ from common.config import config
 
 logger = get_logger('run_all')
 
+
+def run_crawler_in_process(source_type: str, crawler_name: str) -> Dict[str, Any]:
+    """프로세스 워커용 진입점: 워커 안에서 러너(및 로거)를 새로 만들어 크롤러 실행"""
+    return CrawlerRunner().run_crawler(source_type, crawler_name)
+
+
 class CrawlerRunner:
     """크롤러 실행 관리자"""
     
@@ -158,12 +164,12 @@ class CrawlerRunner:
         
         self.logger.info(f"총 {len(crawler_tasks)}개 크롤러 실행 예정")
         
-        # 병렬 실행
+        # 병렬 실행 (HTML 파싱이 GIL에 묶이지 않도록 크롤러마다 별도 프로세스)
         results = {}
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
             # 작업 제출
             future_to_crawler = {
-                executor.submit(self.run_crawler, source_type, crawler_name): (source_type, crawler_name)
+                executor.submit(run_crawler_in_process, source_type, crawler_name): (source_type, crawler_name)
                 for source_type, crawler_name in crawler_tasks
             }
             
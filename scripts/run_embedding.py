@@ -14,13 +14,15 @@ load_dotenv()
 # 프로젝트 루트 디렉토리를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from utils.embedding_generator import EmbeddingGenerator
+from utils.embedding_generator import EmbeddingGenerator, EMBEDDING_CONCURRENCY
 
 def main():
     """임베딩 생성 실행"""
     # 명령행 인수 파싱
     parser = argparse.ArgumentParser(description='OpenAI 임베딩 생성 스크립트')
     parser.add_argument('--limit', type=int, help='테스트용 기사 개수 제한 (예: --limit 10)')
+    parser.add_argument('--concurrency', type=int, default=EMBEDDING_CONCURRENCY,
+                        help=f'동시에 요청할 임베딩 배치 수 (기본: {EMBEDDING_CONCURRENCY})')
     args = parser.parse_args()
     
     print("🚀 OPINION.IM OpenAI 임베딩 생성 시작")
@@ -33,7 +35,7 @@ def main():
     
     try:
         # 임베딩 생성 실행
-        generator = EmbeddingGenerator(limit=args.limit)
+        generator = EmbeddingGenerator(limit=args.limit, concurrency=args.concurrency)
         success = generator.embed_articles()
         
         if success:
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+이슈 레포트용 DB 스키마 설정 스크립트 (1회성 마이그레이션)
+
+레포트/요약 생성 스크립트는 읽기·쓰기만 하고 DDL은 실행하지 않으므로,
+배포 시 또는 스키마 변경 후 이 스크립트를 한 번 실행합니다.
+- 이슈 하위 테이블 issue_id 인덱스 (common_points, bias_summaries, articles)
+- media_summaries (issue_id, media_id) 유니크 인덱스
+- issue_report_v 뷰 (생성 후 PostgREST 스키마 캐시 갱신)
+"""
+
+import os
+import sys
+from dotenv import load_dotenv
+
+# .env 파일 로드
+load_dotenv()
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.supabase_manager_unified import UnifiedSupabaseManager
+
+
+def main():
+    """스키마 설정 실행"""
+    print("🛠️ 이슈 레포트 스키마 설정 시작")
+    print("=" * 60)
+
+    sm = UnifiedSupabaseManager()
+    steps = [
+        ("이슈 하위 테이블 인덱스", sm.create_issue_child_indexes),
+        ("media_summaries 유니크 인덱스", sm.create_media_summaries_unique_index),
+        ("issue_report_v 뷰", sm.create_issue_report_view),
+    ]
+
+    failed = []
+    for label, step in steps:
+        if step():
+            print(f"✅ {label} 생성/확인 완료")
+        else:
+            print(f"❌ {label} 생성 실패")
+            failed.append(label)
+
+    if failed:
+        print(f"\n❌ {len(failed)}개 단계 실패: {', '.join(failed)}")
+        sys.exit(1)
+
+    print("\n🎉 스키마 설정 완료!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""
+pytest 공통 설정
+- 프로젝트 루트를 Python 경로에 세션당 한 번만 추가
+- 테스트 간에 공유하는 Supabase 클라이언트 모킹 픽스처
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+PROJECT_ROOT = str(Path(__file__).resolve().parents[1])
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+
+@pytest.fixture(scope='session')
+def mock_supabase():
+    """common.supabase_manager.create_client를 세션 동안 MagicMock 클라이언트로 대체"""
+    with patch('common.supabase_manager.create_client') as mock_create_client:
+        mock_create_client.return_value = MagicMock()
+        yield mock_create_client
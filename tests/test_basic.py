@@ -9,14 +9,21 @@ import sys
 import unittest
 from unittest.mock import patch, MagicMock
 
-# 프로젝트 루트 디렉토리를 Python 경로에 추가
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# pytest 실행 시에는 conftest.py가 경로를 추가하므로, 직접 실행할 때만 프로젝트 루트를 추가
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from common.logger import get_logger
 from common.config import config
 from common.parser_utils import ParserUtils
 from common.supabase_manager import SupabaseManager
 
+try:
+    import xdist  # noqa: F401  (pytest-xdist)
+    XDIST_AVAILABLE = True
+except Exception:
+    XDIST_AVAILABLE = False
+
 class TestBasicFunctionality(unittest.TestCase):
     """기본 기능 테스트"""
     
@@ -54,13 +61,9 @@ class TestBasicFunctionality(unittest.TestCase):
         self.assertIsNotNone(logger)
         self.assertEqual(logger.level, 20)  # INFO level
     
-    @patch('common.supabase_manager.create_client')
+    @patch('common.supabase_manager.create_client', return_value=MagicMock())
     def test_supabase_manager(self, mock_create_client):
-        """Supabase 매니저 테스트 (모킹)"""
-        # 모킹 설정
-        mock_client = MagicMock()
-        mock_create_client.return_value = mock_client
-        
+        """Supabase 매니저 테스트 (모킹 - pytest 없이 직접 실행해도 동일하게 동작)"""
         # 환경변수 설정
         with patch.dict(os.environ, {
             'SUPABASE_URL': 'https://test.supabase.co',
@@ -128,16 +131,15 @@ def run_basic_tests():
     """기본 테스트 실행"""
     print("기본 기능 테스트 시작...")
     
-    # 테스트 스위트 생성
-    test_suite = unittest.TestSuite()
-    
-    # 테스트 클래스들 추가
-    test_suite.addTest(unittest.makeSuite(TestBasicFunctionality))
-    test_suite.addTest(unittest.makeSuite(TestCrawlerDiscovery))
-    test_suite.addTest(unittest.makeSuite(TestCommonModules))
+    # 테스트 스위트 생성 (makeSuite는 deprecated - 로더 하나로 클래스별 테스트 로드)
+    loader = unittest.TestLoader()
+    test_suite = unittest.TestSuite([
+        loader.loadTestsFromTestCase(test_class)
+        for test_class in (TestBasicFunctionality, TestCrawlerDiscovery, TestCommonModules)
+    ])
     
     # 테스트 실행
-    runner = unittest.TextTestRunner(verbosity=2)
+    runner = unittest.TextTestRunner(verbosity=2, buffer=True)
     result = runner.run(test_suite)
     
     # 결과 요약
@@ -155,6 +157,15 @@ def run_basic_tests():
     
     return result.wasSuccessful()
 
+def run_parallel_tests():
+    """pytest-xdist로 테스트 클래스를 워커 프로세스에 분산 실행"""
+    import pytest
+
+    print("기본 기능 테스트 병렬 실행 (pytest -n auto)...")
+    exit_code = pytest.main([os.path.abspath(__file__), '-n', 'auto', '--dist', 'loadscope', '-q'])
+    return exit_code == 0
+
 if __name__ == "__main__":
-    success = run_basic_tests()
+    # pytest-xdist가 설치되어 있으면 병렬 실행, 없으면 기존 직렬 러너 사용
+    success = run_parallel_tests() if XDIST_AVAILABLE else run_basic_tests()
     sys.exit(0 if success else 1)
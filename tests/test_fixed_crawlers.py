@@ -4,60 +4,58 @@
 """
 
 import asyncio
-import subprocess
-import time
+import contextlib
+import importlib
+import io
+import sys
 from datetime import datetime
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 
+sys.path.append('.')
+
 console = Console()
 
 # 수정된 크롤러 목록 (5개만 테스트)
 TEST_CRAWLERS = [
-    ("crawlers/major_news/donga_politics_crawler.py", "동아일보"),
-    ("crawlers/major_news/joongang_politics_crawler.py", "중앙일보"),
-    ("crawlers/major_news/hani_politics_crawler.py", "한겨레"),
-    ("crawlers/major_news/kmib_politics_crawler.py", "국민일보"),
-    ("crawlers/major_news/khan_politics_crawler.py", "경향신문"),
+    ("crawlers.major_news.donga_politics_crawler", "동아일보"),
+    ("crawlers.major_news.joongang_politics_crawler", "중앙일보"),
+    ("crawlers.major_news.hani_politics_crawler", "한겨레"),
+    ("crawlers.major_news.kmib_politics_crawler", "국민일보"),
+    ("crawlers.major_news.khan_politics_crawler", "경향신문"),
 ]
 
-async def run_crawler(crawler_path: str, crawler_name: str):
-    """개별 크롤러 실행"""
+async def run_crawler(crawler_module: str, crawler_name: str):
+    """개별 크롤러 실행 (서브프로세스 대신 같은 프로세스에서 모듈의 main() 실행)"""
     console.print(f"🚀 {crawler_name} 크롤러 실행 시작...")
     
+    output = io.StringIO()
     try:
-        process = await asyncio.create_subprocess_exec(
-            "python3", crawler_path,
-            env={"PYTHONPATH": "."},
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        
-        stdout, stderr = await process.communicate()
-        
-        if process.returncode == 0:
-            console.print(f"✅ {crawler_name}: 성공")
-            # stdout에서 수집된 기사 수 추출
-            output = stdout.decode('utf-8')
-            if "수집 결과:" in output:
-                lines = output.split('\n')
-                for line in lines:
-                    if "총 수집:" in line:
-                        try:
-                            articles_str = line.split("총 수집:")[1].split("개")[0].strip()
-                            articles_count = int(articles_str)
-                            console.print(f"   📰 {articles_count}개 기사 수집")
-                        except:
-                            console.print(f"   📰 기사 수집 정보 없음")
-                        break
-        else:
-            console.print(f"❌ {crawler_name}: 실패")
-            error_msg = stderr.decode('utf-8')[:200] + "..." if len(stderr.decode('utf-8')) > 200 else stderr.decode('utf-8')
-            console.print(f"   💬 {error_msg}")
-            
-    except Exception as e:
-        console.print(f"❌ {crawler_name}: 오류 - {str(e)}")
+        module = importlib.import_module(crawler_module)
+        # 크롤러 출력은 버퍼로 받아 수집 결과만 추출
+        with contextlib.redirect_stdout(output):
+            await module.main()
+    except (Exception, SystemExit) as e:
+        console.print(f"❌ {crawler_name}: 실패")
+        error_msg = str(e)[:200] + "..." if len(str(e)) > 200 else str(e)
+        console.print(f"   💬 {error_msg}")
+        return
+    
+    console.print(f"✅ {crawler_name}: 성공")
+    # 출력에서 수집된 기사 수 추출
+    output = output.getvalue()
+    if "수집 결과:" in output:
+        lines = output.split('\n')
+        for line in lines:
+            if "총 수집:" in line:
+                try:
+                    articles_str = line.split("총 수집:")[1].split("개")[0].strip()
+                    articles_count = int(articles_str)
+                    console.print(f"   📰 {articles_count}개 기사 수집")
+                except:
+                    console.print(f"   📰 기사 수집 정보 없음")
+                break
 
 async def test_fixed_crawlers():
     """수정된 크롤러들 테스트"""
@@ -65,15 +63,11 @@ async def test_fixed_crawlers():
     console.print(f"📅 시작 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     console.print("=" * 60)
     
-    for i, (crawler_path, crawler_name) in enumerate(TEST_CRAWLERS, 1):
+    # 크롤러마다 대상 사이트가 달라 크롤러 간 대기는 두지 않음 (요청 간격은 각 크롤러가 조절)
+    for i, (crawler_module, crawler_name) in enumerate(TEST_CRAWLERS, 1):
         console.print(f"\n📰 [{i:2d}/5] {crawler_name} 크롤러 테스트 중...")
         
-        await run_crawler(crawler_path, crawler_name)
-        
-        # 크롤러 간 간격
-        if i < len(TEST_CRAWLERS):
-            console.print("⏳ 다음 크롤러 준비 중... (5초 대기)")
-            await asyncio.sleep(5)
+        await run_crawler(crawler_module, crawler_name)
     
     console.print("\n" + "=" * 60)
     console.print("🎯 테스트 완료!")
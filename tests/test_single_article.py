@@ -3,14 +3,33 @@
 특정 기사 본문 수집 테스트
 """
 
+import argparse
 import asyncio
 from crawlers.major_news.chosun_politics_crawler import ChosunPoliticsCollector
 from rich.console import Console
 
 console = Console()
 
-async def test_single_article():
-    """특정 기사 본문 수집 테스트"""
+# HTML 본문이 이 길이 이상이면 정적 페이지로 보고 Playwright(수 초 소요) 생략.
+# 리드/페이월 미리보기만 잡힌 경우도 보통 수백 자는 되므로, 온전한 기사 본문이라 볼 수 있는
+# 800자 정도로 잡아 잘린 본문을 '충분하다'고 오판하지 않도록 함
+MIN_HTML_CONTENT_LENGTH = 800
+
+def _print_extraction(label: str, content) -> str:
+    """추출 결과 출력 (예외면 오류 표시 후 빈 문자열 반환)"""
+    if isinstance(content, BaseException):
+        console.print(f"❌ {label} 본문 추출 오류: {str(content)}")
+        return ""
+    
+    console.print(f"✅ {label} 본문 길이: {len(content)}자")
+    console.print(f"📄 {label} 본문 내용:")
+    console.print("-" * 40)
+    console.print(content[:1000] + "..." if len(content) > 1000 else content)
+    console.print("-" * 40)
+    return content
+
+async def test_single_article(force_playwright: bool = False):
+    """특정 기사 본문 수집 테스트 (force_playwright=True면 HTML 결과와 무관하게 Playwright도 실행)"""
     
     collector = ChosunPoliticsCollector()
     
@@ -20,38 +39,55 @@ async def test_single_article():
     console.print(f"🔍 테스트 URL: {test_url}")
     console.print("=" * 80)
     
+    playwright_skipped = False
+    
     try:
-        # HTML 방식으로 본문 추출
-        console.print("📖 HTML 방식으로 본문 추출 중...")
-        html_content = await collector._extract_content_from_html(test_url)
-        
-        console.print(f"✅ HTML 본문 길이: {len(html_content)}자")
-        console.print("📄 HTML 본문 내용:")
-        console.print("-" * 40)
-        console.print(html_content[:1000] + "..." if len(html_content) > 1000 else html_content)
-        console.print("-" * 40)
-        
-        # Playwright 방식으로 본문 추출
-        console.print("\n🌐 Playwright 방식으로 본문 추출 중...")
-        playwright_content = await collector._extract_content_with_playwright(test_url)
-        
-        console.print(f"✅ Playwright 본문 길이: {len(playwright_content)}자")
-        console.print("📄 Playwright 본문 내용:")
-        console.print("-" * 40)
-        console.print(playwright_content[:1000] + "..." if len(playwright_content) > 1000 else playwright_content)
-        console.print("-" * 40)
+        if force_playwright:
+            # HTML/Playwright 추출은 서로 다른 경로라 동시에 실행 (Playwright 콜드 스타트와 HTML 요청이 겹침)
+            console.print("📖 HTML 방식 / 🌐 Playwright 방식으로 본문 동시 추출 중...")
+            html_content, playwright_content = await asyncio.gather(
+                collector._extract_content_from_html(test_url),
+                collector._extract_content_with_playwright(test_url),
+                return_exceptions=True
+            )
+            html_content = _print_extraction("HTML", html_content)
+            playwright_content = _print_extraction("Playwright", playwright_content)
+        else:
+            console.print("📖 HTML 방식으로 본문 추출 중...")
+            try:
+                html_content = await collector._extract_content_from_html(test_url)
+            except Exception as e:
+                html_content = e
+            html_content = _print_extraction("HTML", html_content)
+            
+            # HTML로 충분한 본문을 얻었으면 Playwright 단계는 건너뛰고 HTML 결과로 비교 진행
+            if len(html_content) >= MIN_HTML_CONTENT_LENGTH:
+                console.print(f"\n⏭️ HTML 본문이 {MIN_HTML_CONTENT_LENGTH}자 이상이므로 Playwright 생략 (--force-playwright로 강제 실행)")
+                playwright_content = html_content
+                playwright_skipped = True
+            else:
+                console.print("\n🌐 Playwright 방식으로 본문 추출 중...")
+                try:
+                    playwright_content = await collector._extract_content_with_playwright(test_url)
+                except Exception as e:
+                    playwright_content = e
+                playwright_content = _print_extraction("Playwright", playwright_content)
         
         # 비교
         console.print("\n📊 본문 길이 비교:")
         console.print(f"   HTML: {len(html_content)}자")
-        console.print(f"   Playwright: {len(playwright_content)}자")
-        
-        if len(html_content) > len(playwright_content):
-            console.print("✅ HTML 방식이 더 많은 본문을 수집했습니다!")
-        elif len(playwright_content) > len(html_content):
-            console.print("✅ Playwright 방식이 더 많은 본문을 수집했습니다!")
+        if playwright_skipped:
+            console.print("   Playwright: 생략 (HTML 결과 사용)")
+            console.print("ℹ️ 두 방식을 비교하려면 --force-playwright로 실행하세요")
         else:
-            console.print("✅ 두 방식 모두 동일한 길이의 본문을 수집했습니다!")
+            console.print(f"   Playwright: {len(playwright_content)}자")
+            
+            if len(html_content) > len(playwright_content):
+                console.print("✅ HTML 방식이 더 많은 본문을 수집했습니다!")
+            elif len(playwright_content) > len(html_content):
+                console.print("✅ Playwright 방식이 더 많은 본문을 수집했습니다!")
+            else:
+                console.print("✅ 두 방식 모두 동일한 길이의 본문을 수집했습니다!")
             
     except Exception as e:
         console.print(f"❌ 오류 발생: {str(e)}")
@@ -59,4 +95,7 @@ async def test_single_article():
         await collector._cleanup_playwright()
 
 if __name__ == "__main__":
-    asyncio.run(test_single_article())
+    parser = argparse.ArgumentParser(description='특정 기사 본문 수집 테스트')
+    parser.add_argument('--force-playwright', action='store_true', help='HTML 본문이 충분해도 Playwright 추출 실행')
+    args = parser.parse_args()
+    asyncio.run(test_single_article(force_playwright=args.force_playwright))
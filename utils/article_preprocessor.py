@@ -7,22 +7,74 @@
 """
 
 import logging
-from typing import List, Dict, Tuple, Set
-from datetime import datetime
-import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Tuple, Set, Optional
+from datetime import datetime, timezone
+import os
+import time
+import pandas as pd
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.neighbors import NearestNeighbors
 import numpy as np
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.panel import Panel
 from rich.table import Table
 
+try:
+    import joblib
+    JOBLIB_AVAILABLE = True
+except Exception:
+    JOBLIB_AVAILABLE = False
+
 try:
     from utils.supabase_manager_unified import UnifiedSupabaseManager
 except ImportError:
     from supabase_manager_unified import UnifiedSupabaseManager
 
+# 이보다 짧은 본문(자)의 기사는 제거
+MIN_CONTENT_LENGTH = 50
+
+# 같은 언론사 내 유사 중복으로 판단하는 코사인 유사도 기준
+SIMILARITY_THRESHOLD = 0.95
+
+# 이 기사 수를 넘는 언론사 그룹은 희소 행렬 곱 대신 반경 이웃 검색으로 유사 쌍 탐색
+LARGE_GROUP_SIZE = 5000
+
+# 학습된 TF-IDF 벡터라이저 저장 위치와 재학습 조건
+# (저장본이 VECTORIZER_MAX_AGE초보다 오래됐거나, 어휘에 없는 단어만으로 된 본문 비율이 VECTORIZER_DRIFT_RATIO를 넘으면 재학습)
+VECTORIZER_CACHE_PATH = 'outputs/tfidf_vectorizer.joblib'
+VECTORIZER_MAX_AGE = 7 * 24 * 3600
+VECTORIZER_DRIFT_RATIO = 0.05
+
+# 벡터화 날짜 변환 대상: YYYY-MM-DD, YYYY-MM-DD HH:MM:SS, YYYY-MM-DDTHH:MM:SS[.ffffff][Z|±HH:MM]
+FAST_DATE_PATTERN = r'\d{4}-\d{2}-\d{2}(?:T\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:\d{2})?| \d{2}:\d{2}:\d{2})?'
+
+# articles 조회 페이지 크기 (PostgREST 기본 max-rows와 동일)
+ARTICLE_PAGE_SIZE = 1000
+
+# 결과 반영 시 upsert 청크 크기 / 동시 요청 수, 삭제 시 in_ 조회 한 번의 ID 수
+UPSERT_CHUNK_SIZE = 500
+UPSERT_MAX_WORKERS = 4
+DELETE_CHUNK_SIZE = 500
+
+@lru_cache(maxsize=4096)
+def _parse_date_str(date_value: str) -> Optional[datetime]:
+    """날짜 문자열을 datetime으로 파싱 (같은 published_at 문자열이 반복되므로 결과를 캐시)"""
+    try:
+        if 'T' in date_value:
+            return datetime.fromisoformat(date_value.replace('Z', '+00:00'))
+        elif '-' in date_value and ':' in date_value:
+            return datetime.strptime(date_value, '%Y-%m-%d %H:%M:%S')
+        elif '-' in date_value:
+            return datetime.strptime(date_value, '%Y-%m-%d')
+    except (ValueError, TypeError):
+        pass
+    return None
+
 class ArticlePreprocessor:
     """기사 전처리 클래스"""
     
@@ -32,10 +84,14 @@ class ArticlePreprocessor:
         self.logger = logging.getLogger(__name__)
         
         # TF-IDF 벡터라이저 초기화
+        # float32로 희소 행렬 메모리와 유사도 계산량을 절반으로, 로그 TF로 긴 기사의 반복어 영향 완화
         self.vectorizer = TfidfVectorizer(
             max_features=1000,
             stop_words=None,  # 한국어는 별도 처리 필요
-            ngram_range=(1, 2)
+            ngram_range=(1, 2),
+            sublinear_tf=True,
+            norm='l2',
+            dtype=np.float32
         )
         
         # 중복 제거 통계
@@ -64,24 +120,22 @@ class ArticlePreprocessor:
                 return True
             
             self.stats['total_articles'] = len(articles)
+            fetched_ids = [article['id'] for article in articles]
             self.console.print(f"[green]총 {len(articles)}개 기사 조회 완료[/green]")
             
-            # 2. URL + media_id 중복 제거
-            articles = self._remove_url_media_duplicates(articles)
+            # 2. URL + media_id 중복, 짧은 기사, 같은 언론사 내 동일 content 제거 (한 번에)
+            media_groups = self._filter_articles(articles)
             
-            # 3. 같은 언론사 내 content 중복 제거
-            articles = self._remove_content_duplicates(articles)
+            # 3. 같은 언론사 내 유사 content 중복 제거
+            articles = self._remove_content_duplicates(media_groups)
             
-            # 4. 짧은 기사 제거
-            articles = self._remove_short_articles(articles)
-            
-            # 5. 날짜 형식 통일
+            # 4. 날짜 형식 통일
             articles = self._normalize_dates(articles)
             
-            # 6. 최종 결과를 Supabase에 반영
-            success = self._update_supabase(articles)
+            # 5. 최종 결과를 Supabase에 반영
+            success = self._update_supabase(articles, fetched_ids)
             
-            # 7. 결과 출력
+            # 6. 결과 출력
             self._display_results()
             
             return success
@@ -94,48 +148,82 @@ class ArticlePreprocessor:
     def _fetch_all_articles(self) -> List[Dict]:
         """모든 기사 조회"""
         try:
-            result = self.supabase.client.table('articles').select('*').execute()
-            return result.data if result.data else []
+            # PostgREST는 한 요청에 최대 행 수가 제한되므로 id 순으로 페이지 단위 조회
+            articles = []
+            offset = 0
+            while True:
+                result = (self.supabase.client.table('articles')
+                          .select('*')
+                          .order('id')
+                          .range(offset, offset + ARTICLE_PAGE_SIZE - 1)
+                          .execute())
+                page = result.data or []
+                if not page:
+                    break
+                articles.extend(page)
+                offset += len(page)
+            return articles
         except Exception as e:
             self.logger.error(f"기사 조회 실패: {str(e)}")
             return []
     
-    def _remove_url_media_duplicates(self, articles: List[Dict]) -> List[Dict]:
-        """URL + media_id 중복 제거"""
-        self.console.print("[blue]URL + media_id 중복 제거 중...[/blue]")
+    def _filter_articles(self, articles: List[Dict]) -> Dict[int, List[Dict]]:
+        """URL + media_id 중복, 짧은 기사, 같은 언론사 내 동일 content를 한 번에 걸러 언론사별로 묶음"""
+        self.console.print("[blue]URL 중복 / 짧은 기사 / 동일 본문 제거 중...[/blue]")
         
-        seen = set()
-        unique_articles = []
+        # 판정에 필요한 열만 한 번 모아 pandas 해시 테이블에서 처리 (먼저 나온 기사 유지)
+        keys = pd.DataFrame({
+            'url': [article.get('url', '') for article in articles],
+            'media_id': [article.get('media_id') for article in articles],
+            'content': [article.get('content') or '' for article in articles],
+        })
         
-        for article in articles:
-            url = article.get('url', '')
-            media_id = article.get('media_id')
-            
-            if not url or media_id is None:
-                continue
-                
-            key = (url, media_id)
-            if key not in seen:
-                seen.add(key)
-                unique_articles.append(article)
-            else:
-                self.stats['duplicate_url_media'] += 1
+        # URL + media_id 중복 (url/media_id가 없는 기사는 제외)
+        keys = keys[keys['url'].fillna('').astype(bool) & keys['media_id'].notna()]
+        duplicated = keys.duplicated(['url', 'media_id']).to_numpy()
+        self.stats['duplicate_url_media'] += int(duplicated.sum())
+        keys = keys[~duplicated]
+        
+        # 짧은 기사 (본문 길이 < MIN_CONTENT_LENGTH자)
+        short = (keys['content'].str.len() < MIN_CONTENT_LENGTH).to_numpy()
+        self.stats['short_content_removed'] += int(short.sum())
+        keys = keys[~short]
+        
+        # 같은 언론사 내 완전히 동일한 content
+        duplicated = keys.duplicated(['media_id', 'content']).to_numpy()
+        self.stats['duplicate_content_exact'] += int(duplicated.sum())
+        
+        # 언론사별로 그룹화
+        media_groups = {}
+        for i in keys.index[~duplicated]:
+            article = articles[i]
+            media_groups.setdefault(article['media_id'], []).append(article)
         
         self.console.print(f"[green]URL 중복 제거 완료: {self.stats['duplicate_url_media']}개 제거[/green]")
-        return unique_articles
+        self.console.print(f"[green]짧은 기사 제거 완료: {self.stats['short_content_removed']}개 제거[/green]")
+        self.console.print(f"[green]정확한 내용 중복 제거 완료: {self.stats['duplicate_content_exact']}개 제거[/green]")
+        return media_groups
     
-    def _remove_content_duplicates(self, articles: List[Dict]) -> List[Dict]:
-        """같은 언론사 내 content 중복 제거"""
+    def _remove_content_duplicates(self, media_groups: Dict[int, List[Dict]]) -> List[Dict]:
+        """같은 언론사 내 유사 content 중복 제거"""
         self.console.print("[blue]Content 중복 제거 중...[/blue]")
         
-        # 언론사별로 그룹화
-        media_groups = {}
-        for article in articles:
-            media_id = article.get('media_id')
-            if media_id is not None:
-                if media_id not in media_groups:
-                    media_groups[media_id] = []
-                media_groups[media_id].append(article)
+        # TF-IDF는 전체 기사에 대해 한 번만 학습하고 언론사별로 행을 잘라 사용
+        all_articles = [article for group in media_groups.values() for article in group]
+        tfidf_matrix = None
+        if all_articles:
+            try:
+                # 공백/대소문자만 다른 본문은 한 번만 벡터화하고 행을 복제해 되돌림
+                unique_map: Dict[str, int] = {}
+                inverse = np.fromiter(
+                    (unique_map.setdefault(' '.join((article.get('content') or '').split()).lower(), len(unique_map))
+                     for article in all_articles),
+                    dtype=np.int64,
+                    count=len(all_articles),
+                )
+                tfidf_matrix = self._vectorize(list(unique_map))[inverse]
+            except Exception as e:
+                self.logger.error(f"TF-IDF 벡터화 중 오류: {str(e)}")
         
         unique_articles = []
         
@@ -146,72 +234,97 @@ class ArticlePreprocessor:
         ) as progress:
             task = progress.add_task("언론사별 중복 제거...", total=len(media_groups))
             
-            for media_id, media_articles in media_groups.items():
+            offset = 0
+            for media_id, group_articles in media_groups.items():
                 progress.update(task, description=f"언론사 {media_id} 처리 중...")
                 
-                # 완전히 동일한 content 제거
-                content_hash_map = {}
-                for article in media_articles:
-                    content = article.get('content', '')
-                    if not content:
-                        continue
-                    
-                    content_hash = hashlib.md5(content.encode('utf-8')).hexdigest()
-                    if content_hash not in content_hash_map:
-                        content_hash_map[content_hash] = article
-                    else:
-                        self.stats['duplicate_content_exact'] += 1
-                
                 # 유사도 기반 중복 제거
-                similar_articles = self._remove_similar_content(list(content_hash_map.values()))
+                end = offset + len(group_articles)
+                group_matrix = tfidf_matrix[offset:end] if tfidf_matrix is not None else None
+                similar_articles = self._remove_similar_content(group_articles, group_matrix)
                 unique_articles.extend(similar_articles)
+                offset = end
                 
                 progress.advance(task)
         
         self.console.print(f"[green]Content 중복 제거 완료: 정확 중복 {self.stats['duplicate_content_exact']}개, 유사 중복 {self.stats['duplicate_content_similar']}개 제거[/green]")
         return unique_articles
     
-    def _remove_similar_content(self, articles: List[Dict]) -> List[Dict]:
-        """유사도 기반 중복 제거 (같은 언론사 내에서만)"""
+    def _vectorize(self, contents: List[str]) -> sparse.csr_matrix:
+        """
+        저장된 벡터라이저가 유효하면 transform만 하고, 없거나 코퍼스가 바뀌었으면 새로 학습 후 저장
+        
+        Args:
+            contents: 벡터화할 본문 목록
+            
+        Returns:
+            TF-IDF 희소 행렬 (CSR)
+        """
+        if JOBLIB_AVAILABLE:
+            try:
+                if time.time() - os.path.getmtime(VECTORIZER_CACHE_PATH) < VECTORIZER_MAX_AGE:
+                    vectorizer = joblib.load(VECTORIZER_CACHE_PATH)
+                    tfidf_matrix = vectorizer.transform(contents).tocsr()
+                    if np.mean(tfidf_matrix.getnnz(axis=1) == 0) <= VECTORIZER_DRIFT_RATIO:
+                        self.vectorizer = vectorizer
+                        return tfidf_matrix
+                    self.console.print("[yellow]저장된 TF-IDF 어휘와 맞지 않는 기사가 많아 재학습합니다[/yellow]")
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                self.logger.warning(f"저장된 TF-IDF 벡터라이저 로드 실패: {str(e)}")
+        
+        tfidf_matrix = self.vectorizer.fit_transform(contents).tocsr()
+        
+        if JOBLIB_AVAILABLE:
+            try:
+                os.makedirs(os.path.dirname(VECTORIZER_CACHE_PATH), exist_ok=True)
+                tmp_path = f"{VECTORIZER_CACHE_PATH}.{os.getpid()}.tmp"
+                joblib.dump(self.vectorizer, tmp_path)
+                os.replace(tmp_path, VECTORIZER_CACHE_PATH)
+            except Exception as e:
+                self.logger.warning(f"TF-IDF 벡터라이저 저장 실패: {str(e)}")
+        
+        return tfidf_matrix
+    
+    def _remove_similar_content(self, articles: List[Dict], tfidf_matrix=None) -> List[Dict]:
+        """유사도 기반 중복 제거 (같은 언론사 내에서만, tfidf_matrix 전달 시 벡터화 생략)"""
         if len(articles) <= 1:
             return articles
         
         try:
             # TF-IDF 벡터화
-            contents = [article.get('content', '') for article in articles]
-            tfidf_matrix = self.vectorizer.fit_transform(contents)
+            if tfidf_matrix is None:
+                contents = [article.get('content', '') for article in articles]
+                tfidf_matrix = self.vectorizer.fit_transform(contents)
             
-            # 코사인 유사도 계산
-            similarity_matrix = cosine_similarity(tfidf_matrix)
+            # 유사도가 기준 이상인 쌍(i < j)만 추출
+            pair_rows, pair_cols = self._find_similar_pairs(tfidf_matrix)
             
-            # 유사도가 0.95 이상인 쌍 찾기
-            to_remove = set()
+            # 판정에 쓰는 발행일/본문 길이는 기사당 한 번만 계산
+            dates = np.array([self._to_datetime64(article.get('published_at')) for article in articles],
+                             dtype='datetime64[us]')
+            lengths = np.fromiter((len(article.get('content', '')) for article in articles),
+                                  dtype=np.int64, count=len(articles))
             
-            for i in range(len(similarity_matrix)):
-                for j in range(i + 1, len(similarity_matrix)):
-                    if similarity_matrix[i][j] >= 0.95:
-                        # 더 짧은 기사나 더 늦게 발행된 기사를 제거 대상으로 선택
-                        article_i = articles[i]
-                        article_j = articles[j]
-                        
-                        # 발행일 비교
-                        date_i = self._parse_date(article_i.get('published_at'))
-                        date_j = self._parse_date(article_j.get('published_at'))
-                        
-                        if date_i and date_j:
-                            if date_i >= date_j:  # 더 늦거나 같은 시간의 기사 제거
-                                to_remove.add(j)
-                            else:
-                                to_remove.add(i)
-                        else:
-                            # 발행일이 없으면 더 짧은 기사 제거
-                            if len(article_i.get('content', '')) <= len(article_j.get('content', '')):
-                                to_remove.add(i)
-                            else:
-                                to_remove.add(j)
+            # 유사 쌍을 간선으로 하는 그래프의 연결 요소마다 대표 기사 하나만 남김 (A~B~C 전이 중복까지 처리)
+            # 대표: 가장 먼저 발행된 기사 (발행일 없으면 뒤로), 같으면 본문이 긴 기사, 그래도 같으면 앞선 기사
+            n = len(articles)
+            graph = sparse.coo_matrix((np.ones(len(pair_rows), dtype=np.int8), (pair_rows, pair_cols)), shape=(n, n))
+            _, labels = connected_components(graph, directed=False)
+            
+            date_keys = dates.astype(np.int64)
+            date_keys[np.isnat(dates)] = np.iinfo(np.int64).max
+            order = np.lexsort((np.arange(n), -lengths, date_keys, labels))
+            sorted_labels = labels[order]
+            is_first = np.empty(n, dtype=bool)
+            is_first[0] = True
+            is_first[1:] = sorted_labels[1:] != sorted_labels[:-1]
             
             # 제거 대상이 아닌 기사들만 반환
-            unique_articles = [articles[i] for i in range(len(articles)) if i not in to_remove]
+            keep = np.zeros(n, dtype=bool)
+            keep[order[is_first]] = True
+            unique_articles = [articles[i] for i in np.flatnonzero(keep)]
             self.stats['duplicate_content_similar'] += len(articles) - len(unique_articles)
             
             return unique_articles
@@ -220,26 +333,45 @@ class ArticlePreprocessor:
             self.logger.error(f"유사도 계산 중 오류: {str(e)}")
             return articles
     
-    def _remove_short_articles(self, articles: List[Dict]) -> List[Dict]:
-        """짧은 기사 제거 (본문 길이 < 50자)"""
-        self.console.print("[blue]짧은 기사 제거 중...[/blue]")
-        
-        filtered_articles = []
-        for article in articles:
-            content = article.get('content', '')
-            if len(content) >= 50:
-                filtered_articles.append(article)
-            else:
-                self.stats['short_content_removed'] += 1
+    def _find_similar_pairs(self, tfidf_matrix) -> Tuple[np.ndarray, np.ndarray]:
+        """코사인 유사도가 기준 이상인 기사 쌍 (i < j)의 행/열 인덱스 반환"""
+        if tfidf_matrix.shape[0] <= LARGE_GROUP_SIZE:
+            # TF-IDF 행은 L2 정규화되어 있으므로 희소 행렬 곱이 곧 코사인 유사도 (dense n×n 행렬을 만들지 않음)
+            similarity = sparse.triu(tfidf_matrix @ tfidf_matrix.T, k=1).tocoo()
+            similar = similarity.data >= SIMILARITY_THRESHOLD
+            return similarity.row[similar], similarity.col[similar]
         
-        self.console.print(f"[green]짧은 기사 제거 완료: {self.stats['short_content_removed']}개 제거[/green]")
-        return filtered_articles
+        # 기사가 많은 언론사는 X @ X.T의 비영 원소가 n²에 가깝게 늘어나므로
+        # 반경 이웃 검색으로 거리(1 - 유사도)가 기준 이내인 후보만 청크 단위로 받음
+        neighbors = NearestNeighbors(radius=1 - SIMILARITY_THRESHOLD, metric='cosine', algorithm='brute')
+        neighbors.fit(tfidf_matrix)
+        graph = sparse.triu(neighbors.radius_neighbors_graph(tfidf_matrix, mode='connectivity'), k=1).tocoo()
+        return graph.row, graph.col
     
     def _normalize_dates(self, articles: List[Dict]) -> List[Dict]:
         """날짜 형식을 YYYY-MM-DD HH:MM:SS로 통일"""
         self.console.print("[blue]날짜 형식 통일 중...[/blue]")
         
-        for article in articles:
+        # 대부분을 차지하는 ISO 형식 문자열은 벽시계 시각(앞 19자)만 pandas C 파서로 한 번에 변환
+        # (문자열이 아닌 값은 빈 문자열로 두어 아래 개별 변환 경로로 보냄)
+        published = pd.Series(
+            [value if isinstance(value, str) else '' for value in (article.get('published_at') for article in articles)],
+            dtype=object
+        )
+        fast = published.str.fullmatch(FAST_DATE_PATTERN)
+        parsed = pd.to_datetime(
+            published[fast].str.slice(0, 19).str.replace('T', ' ', regex=False),
+            format='ISO8601', errors='coerce'
+        )
+        formatted = parsed.dt.strftime('%Y-%m-%d %H:%M:%S')
+        formatted = formatted[parsed.notna()]
+        
+        for i, normalized_date in zip(formatted.index, formatted):
+            articles[i]['published_at'] = normalized_date
+        
+        # 그 외 형식(또는 잘못된 날짜)은 기존 규칙으로 개별 변환
+        for i in np.flatnonzero(~published.index.isin(formatted.index)):
+            article = articles[i]
             published_at = article.get('published_at')
             if published_at:
                 normalized_date = self._normalize_date(published_at)
@@ -281,36 +413,47 @@ class ArticlePreprocessor:
     def _parse_date(self, date_value) -> datetime:
         """날짜 값을 datetime 객체로 파싱"""
         if isinstance(date_value, str):
-            try:
-                if 'T' in date_value:
-                    return datetime.fromisoformat(date_value.replace('Z', '+00:00'))
-                elif '-' in date_value and ':' in date_value:
-                    return datetime.strptime(date_value, '%Y-%m-%d %H:%M:%S')
-                elif '-' in date_value:
-                    return datetime.strptime(date_value, '%Y-%m-%d')
-            except:
-                pass
+            return _parse_date_str(date_value)
         elif hasattr(date_value, 'strftime'):
             return date_value
         
         return None
     
-    def _update_supabase(self, articles: List[Dict]) -> bool:
-        """전처리된 결과를 Supabase에 반영"""
+    def _to_datetime64(self, date_value) -> np.datetime64:
+        """날짜 값을 비교용 datetime64로 변환 (파싱 실패 시 NaT, 시간대가 있으면 UTC 기준)"""
+        dt = self._parse_date(date_value)
+        if dt is None:
+            return np.datetime64('NaT')
+        if getattr(dt, 'tzinfo', None) is not None:
+            dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+        return np.datetime64(dt, 'us')
+    
+    def _update_supabase(self, articles: List[Dict], fetched_ids: List[int]) -> bool:
+        """전처리된 결과를 Supabase에 반영 (남은 기사는 id 기준 upsert, 제거된 기사만 삭제)"""
         self.console.print("[blue]Supabase 업데이트 중...[/blue]")
         
         try:
-            # 기존 테이블 비우기 (모든 레코드 삭제)
-            # Supabase에서는 WHERE 절이 필요하므로 항상 참인 조건 사용
-            self.supabase.client.table('articles').delete().gte('id', 0).execute()
+            table = self.supabase.client.table
             
-            # 새로운 데이터 삽입
-            if articles:
-                result = self.supabase.client.table('articles').insert(articles).execute()
-                if result.data:
-                    self.stats['final_articles'] = len(result.data)
-                    self.console.print(f"[green]Supabase 업데이트 완료: {len(result.data)}개 기사 저장[/green]")
-                    return True
+            # 남은 기사 갱신 - 청크 단위 upsert를 병렬 전송 (HTTP 대기 중에는 GIL이 풀림)
+            chunks = [articles[i:i + UPSERT_CHUNK_SIZE] for i in range(0, len(articles), UPSERT_CHUNK_SIZE)]
+            with ThreadPoolExecutor(max_workers=UPSERT_MAX_WORKERS) as executor:
+                results = list(executor.map(
+                    lambda chunk: table('articles').upsert(chunk, on_conflict='id').execute(),
+                    chunks
+                ))
+            saved = sum(len(result.data or []) for result in results)
+            
+            # 중복/짧은 기사로 제거된 행만 삭제 (테이블 전체를 비우지 않음)
+            kept_ids = {article['id'] for article in articles}
+            removed_ids = [article_id for article_id in fetched_ids if article_id not in kept_ids]
+            for i in range(0, len(removed_ids), DELETE_CHUNK_SIZE):
+                table('articles').delete().in_('id', removed_ids[i:i + DELETE_CHUNK_SIZE]).execute()
+            
+            if saved:
+                self.stats['final_articles'] = saved
+                self.console.print(f"[green]Supabase 업데이트 완료: {saved}개 기사 저장, {len(removed_ids)}개 삭제[/green]")
+                return True
             
             self.console.print("[yellow]저장할 기사가 없습니다.[/yellow]")
             return True
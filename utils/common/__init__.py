@@ -2,7 +2,15 @@
 공통 유틸리티 모듈 패키지
 """
 
-from .http_client import HTTPClientManager, make_request, make_requests_batch
+from .http_client import (
+    HTTPClientManager,
+    make_request,
+    make_requests_batch,
+    get_shared_client,
+    close_shared_client,
+    fetch_text,
+    fetch_and_analyze
+)
 from .html_parser import (
     HTMLParserUtils, 
     parse_date_simple, 
@@ -11,15 +19,24 @@ from .html_parser import (
     get_date_range,
     is_recent_date
 )
+from .fetch_cache import cached_get
+from .browser_pool import get_browser, close_browser
 
 __all__ = [
     'HTTPClientManager',
     'make_request', 
     'make_requests_batch',
+    'get_shared_client',
+    'close_shared_client',
+    'fetch_text',
+    'fetch_and_analyze',
+    'cached_get',
     'HTMLParserUtils',
     'parse_date_simple',
     'clean_title_simple',
     'extract_content_simple',
     'get_date_range',
-    'is_recent_date'
+    'is_recent_date',
+    'get_browser',
+    'close_browser'
 ]
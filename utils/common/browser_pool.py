@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+공유 Playwright 브라우저 풀
+Chromium 실행(콜드 스타트)을 프로세스당 한 번만 하고, 호출자는 페이지만 열고 닫음
+"""
+
+import asyncio
+from typing import Optional, Any
+
+_playwright: Optional[Any] = None
+_browser: Optional[Any] = None
+_lock: Optional[asyncio.Lock] = None
+
+LAUNCH_ARGS = ['--no-sandbox', '--disable-dev-shm-usage', '--disable-gpu']
+
+
+async def get_browser() -> Any:
+    """
+    공유 Chromium 브라우저 반환 (최초 호출 시 실행)
+    
+    Returns:
+        playwright Browser 객체
+    """
+    global _playwright, _browser, _lock
+    if _browser is not None and _browser.is_connected():
+        return _browser
+    
+    if _lock is None:
+        _lock = asyncio.Lock()
+    
+    # 동시에 여러 작업이 호출해도 브라우저는 한 번만 실행
+    async with _lock:
+        if _browser is None or not _browser.is_connected():
+            from playwright.async_api import async_playwright
+            
+            if _playwright is None:
+                _playwright = await async_playwright().start()
+            _browser = await _playwright.chromium.launch(headless=True, args=LAUNCH_ARGS)
+    
+    return _browser
+
+
+async def close_browser():
+    """공유 브라우저와 Playwright 종료 (프로그램 종료 시 한 번 호출)"""
+    global _playwright, _browser, _lock
+    try:
+        if _browser is not None:
+            await _browser.close()
+        if _playwright is not None:
+            await _playwright.stop()
+    finally:
+        _playwright = None
+        _browser = None
+        _lock = None
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+URL 단위 HTML 디스크 캐시
+같은 URL을 반복 디버깅할 때 TTL 안에서는 다시 다운로드하지 않고 저장된 HTML을 재사용
+"""
+
+import hashlib
+import os
+import time
+
+from .http_client import fetch_text
+
+FETCH_CACHE_DIR = 'outputs/fetch_cache'
+FETCH_CACHE_TTL = 1800  # 30분
+
+
+def _cache_path(url: str, cache_dir: str) -> str:
+    """URL의 SHA-1 해시로 캐시 파일 경로 생성"""
+    key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    return os.path.join(cache_dir, f"{key}.html")
+
+
+async def cached_get(url: str, ttl: float = FETCH_CACHE_TTL, cache_dir: str = FETCH_CACHE_DIR) -> str:
+    """
+    캐시된 HTML이 TTL 안이면 반환하고, 아니면 공유 클라이언트로 받아 캐시에 저장
+
+    Args:
+        url: 요청할 URL
+        ttl: 캐시 유효 시간 (초)
+        cache_dir: 캐시 파일 저장 디렉토리
+
+    Returns:
+        응답 HTML 텍스트
+    """
+    path = _cache_path(url, cache_dir)
+    try:
+        if time.time() - os.path.getmtime(path) < ttl:
+            with open(path, 'r', encoding='utf-8') as f:
+                return f.read()
+    except OSError:
+        pass
+
+    html = await fetch_text(url)
+
+    # 임시 파일에 쓴 뒤 교체하여 중단되어도 깨진 캐시가 남지 않도록 함
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(html)
+    os.replace(tmp_path, path)
+
+    return html
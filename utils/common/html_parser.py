@@ -6,12 +6,52 @@
 
 import re
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union
+import soupsieve
 from bs4 import BeautifulSoup, Tag
 from rich.console import Console
 
 console = Console()
 
+# remove_ads_and_scripts에서 제거할 광고 관련 요소 + script/style
+REMOVABLE_SELECTOR = ', '.join([
+    '[class*="ad"]', '[class*="advertisement"]', '[class*="banner"]',
+    '[id*="ad"]', '[id*="advertisement"]', '[id*="banner"]',
+    'iframe[src*="ad"]', 'iframe[src*="banner"]',
+    'script', 'style'
+])
+# 매 페이지 호출되므로 모듈 로드 시 한 번만 컴파일해 두고 SoupSieve 객체를 직접 사용
+_REMOVABLE_MATCHER = soupsieve.compile(REMOVABLE_SELECTOR)
+
+# 제목 정리용 정규식
+_TAG_RE = re.compile(r'<[^>]+>')
+_TITLE_SPECIAL_RE = re.compile(r'[^\w\s가-힣\-\.\,\?\!\(\)\[\]\'\"]')
+_WS_RE = re.compile(r'\s+')
+
+# 기본 날짜 패턴들 (모듈 로드 시 한 번만 컴파일)
+_DATE_PATTERNS = tuple(re.compile(p) for p in (
+    # 한국어 날짜 형식
+    r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일',  # 2025년 8월 22일
+    r'(\d{1,2})월\s*(\d{1,2})일',  # 8월 22일 (올해로 가정)
+    
+    # 점 구분 형식
+    r'(\d{4})\.(\d{1,2})\.(\d{1,2})',  # 2025.08.22
+    r'(\d{2})\.(\d{1,2})\.(\d{1,2})',  # 25.08.22 (20xx년으로 가정)
+    r'(\d{1,2})\.(\d{1,2})\.(\d{1,2})',  # 08.22 (올해로 가정)
+    
+    # 하이픈 구분 형식
+    r'(\d{4})-(\d{1,2})-(\d{1,2})',  # 2025-08-22
+    r'(\d{2})-(\d{1,2})-(\d{1,2})',  # 25-08-22 (20xx년으로 가정)
+    
+    # 슬래시 구분 형식
+    r'(\d{4})/(\d{1,2})/(\d{1,2})',  # 2025/08/22
+    r'(\d{2})/(\d{1,2})/(\d{1,2})',  # 25/08/22 (20xx년으로 가정)
+    
+    # 공백 구분 형식
+    r'(\d{4})\s+(\d{1,2})\s+(\d{1,2})',  # 2025 08 22
+    r'(\d{2})\s+(\d{1,2})\s+(\d{1,2})',  # 25 08 22 (20xx년으로 가정)
+))
+
 
 class HTMLParserUtils:
     """HTML 파싱 공통 유틸리티"""
@@ -31,34 +71,18 @@ class HTMLParserUtils:
         if not date_str:
             return None
         
-        # 기본 패턴들
-        default_patterns = [
-            # 한국어 날짜 형식
-            r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일',  # 2025년 8월 22일
-            r'(\d{1,2})월\s*(\d{1,2})일',  # 8월 22일 (올해로 가정)
-            
-            # 점 구분 형식
-            r'(\d{4})\.(\d{1,2})\.(\d{1,2})',  # 2025.08.22
-            r'(\d{2})\.(\d{1,2})\.(\d{1,2})',  # 25.08.22 (20xx년으로 가정)
-            r'(\d{1,2})\.(\d{1,2})\.(\d{1,2})',  # 08.22 (올해로 가정)
-            
-            # 하이픈 구분 형식
-            r'(\d{4})-(\d{1,2})-(\d{1,2})',  # 2025-08-22
-            r'(\d{2})-(\d{1,2})-(\d{1,2})',  # 25-08-22 (20xx년으로 가정)
-            
-            # 슬래시 구분 형식
-            r'(\d{4})/(\d{1,2})/(\d{1,2})',  # 2025/08/22
-            r'(\d{2})/(\d{1,2})/(\d{1,2})',  # 25/08/22 (20xx년으로 가정)
-            
-            # 공백 구분 형식
-            r'(\d{4})\s+(\d{1,2})\s+(\d{1,2})',  # 2025 08 22
-            r'(\d{2})\s+(\d{1,2})\s+(\d{1,2})',  # 25 08 22 (20xx년으로 가정)
-        ]
+        # ISO 8601 문자열 전체(예: 2025-08-22T10:00:00+09:00)는 C 구현 fromisoformat으로 바로 처리
+        if not patterns and len(date_str) >= 10 and date_str[4] == '-' and date_str[7] == '-':
+            try:
+                parsed = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+                return f"{parsed.year:04d}-{parsed.month:02d}-{parsed.day:02d}"
+            except ValueError:
+                pass
         
-        patterns = patterns or default_patterns
+        compiled_patterns = [re.compile(p) for p in patterns] if patterns else _DATE_PATTERNS
         
-        for pattern in patterns:
-            match = re.search(pattern, date_str)
+        for pattern in compiled_patterns:
+            match = pattern.search(date_str)
             if match:
                 groups = match.groups()
                 if len(groups) == 3:
@@ -99,13 +123,13 @@ class HTMLParserUtils:
             return ""
         
         # HTML 태그 제거
-        title = re.sub(r'<[^>]+>', '', title)
+        title = _TAG_RE.sub('', title)
         
         # 특수 문자 정리
-        title = re.sub(r'[^\w\s가-힣\-\.\,\?\!\(\)\[\]\'\"]', '', title)
+        title = _TITLE_SPECIAL_RE.sub('', title)
         
         # 연속 공백 정리
-        title = re.sub(r'\s+', ' ', title)
+        title = _WS_RE.sub(' ', title)
         
         # 앞뒤 공백 제거
         title = title.strip()
@@ -128,9 +152,10 @@ class HTMLParserUtils:
         Returns:
             추출된 텍스트
         """
+        # 선택자 순서대로 첫 매치를 확인 (soupsieve.compile은 내부 캐시로 같은 선택자의 컴파일 결과를 재사용)
         for selector in selectors:
             try:
-                found = element.select_one(selector)
+                found = soupsieve.compile(selector).select_one(element)
                 if found:
                     text = found.get_text(separator='\n', strip=True)
                     if text:
@@ -141,14 +166,14 @@ class HTMLParserUtils:
         return ""
     
     @staticmethod
-    def extract_article_content(html: str, content_selectors: List[str], 
+    def extract_article_content(html: Union[str, BeautifulSoup], content_selectors: List[str], 
                                title_selectors: Optional[List[str]] = None,
                                date_selectors: Optional[List[str]] = None) -> Dict[str, str]:
         """
         기사 내용 추출 (제목, 본문, 날짜)
         
         Args:
-            html: HTML 문자열
+            html: HTML 문자열 또는 이미 파싱된 BeautifulSoup 객체 (remove_ads_and_scripts 결과 등)
             content_selectors: 본문 추출용 CSS 선택자 리스트
             title_selectors: 제목 추출용 CSS 선택자 리스트
             date_selectors: 날짜 추출용 CSS 선택자 리스트
@@ -156,7 +181,7 @@ class HTMLParserUtils:
         Returns:
             추출된 내용 딕셔너리
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = html if isinstance(html, BeautifulSoup) else BeautifulSoup(html, 'lxml')
         result = {
             'title': '',
             'content': '',
@@ -195,10 +220,12 @@ class HTMLParserUtils:
         links = []
         
         try:
+            link_re = re.compile(pattern)
+            
             # 모든 a 태그 찾기
             for link in element.find_all('a', href=True):
                 href = link.get('href')
-                if href and re.search(pattern, href):
+                if href and link_re.search(href):
                     # 상대 경로를 절대 경로로 변환
                     if href.startswith('/'):
                         full_url = base_url + href
@@ -214,38 +241,26 @@ class HTMLParserUtils:
         return links
     
     @staticmethod
-    def remove_ads_and_scripts(html: str) -> str:
+    def remove_ads_and_scripts(html: Union[str, BeautifulSoup]) -> BeautifulSoup:
         """
         광고와 스크립트 태그 제거
         
         Args:
-            html: 원본 HTML
+            html: 원본 HTML 문자열 또는 BeautifulSoup 객체 (객체는 그 자리에서 수정됨)
         
         Returns:
-            정리된 HTML
+            정리된 BeautifulSoup 객체 (다시 파싱하지 않고 extract_article_content 등에 그대로 전달,
+            문자열이 필요하면 str()로 변환)
         """
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        # 광고 관련 태그 제거
-        ad_selectors = [
-            '[class*="ad"]', '[class*="advertisement"]', '[class*="banner"]',
-            '[id*="ad"]', '[id*="advertisement"]', '[id*="banner"]',
-            'iframe[src*="ad"]', 'iframe[src*="banner"]'
-        ]
+        soup = html if isinstance(html, BeautifulSoup) else BeautifulSoup(html, 'lxml')
         
-        for selector in ad_selectors:
-            for element in soup.select(selector):
+        # 광고/스크립트/스타일 태그를 선택자 하나로 한 번만 순회하여 제거
+        # (문서 순서로 반환되므로 상위 요소가 먼저 제거되면 하위 요소는 건너뜀)
+        for element in _REMOVABLE_MATCHER.select(soup):
+            if not element.decomposed:
                 element.decompose()
         
-        # 스크립트 태그 제거
-        for script in soup.find_all('script'):
-            script.decompose()
-        
-        # 스타일 태그 제거
-        for style in soup.find_all('style'):
-            style.decompose()
-        
-        return str(soup)
+        return soup
 
 
 # 편의 함수들
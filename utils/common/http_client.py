@@ -5,55 +5,105 @@
 """
 
 import asyncio
-from typing import Optional, Dict, Any, Union
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Union, Callable, Awaitable, List
 import httpx
 import aiohttp
 from rich.console import Console
 
+# httpx의 HTTP/2 지원은 h2 패키지(httpx[http2])가 있을 때만 사용
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except Exception:
+    HTTP2_AVAILABLE = False
+
+# br 응답은 brotli(또는 brotlicffi)가 있어야 aiohttp/httpx가 자동 해제할 수 있으므로 있을 때만 광고
+try:
+    import brotli  # noqa: F401
+    BROTLI_AVAILABLE = True
+except Exception:
+    try:
+        import brotlicffi  # noqa: F401
+        BROTLI_AVAILABLE = True
+    except Exception:
+        BROTLI_AVAILABLE = False
+
+ACCEPT_ENCODING = "gzip, deflate, br" if BROTLI_AVAILABLE else "gzip, deflate"
+
+# 기본 HTTP 헤더 (요청마다 새로 만들지 않도록 한 번만 생성, 읽기 전용)
+_DEFAULT_HEADERS = MappingProxyType({
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3",
+    "Accept-Encoding": ACCEPT_ENCODING,
+    "DNT": "1",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+})
+
 console = Console()
 
+# 압축 응답 확인 로그는 프로세스당 한 번만 출력 (make_request는 호출마다 매니저를 새로 생성)
+_encoding_checked = False
+
 
 class HTTPClientManager:
     """통합 HTTP 클라이언트 매니저"""
     
-    def __init__(self, client_type: str = "httpx", timeout: float = 10.0):
+    def __init__(self, client_type: str = "aiohttp", timeout: float = 10.0, pool_size: int = 10):
         """
         Args:
-            client_type: "httpx" 또는 "aiohttp"
+            client_type: "aiohttp" (기본, 동시 요청이 많을 때 처리량이 높음) 또는 "httpx" (스트리밍 등 대체용)
             timeout: 요청 타임아웃 (초)
+            pool_size: 호스트당 연결 수 (전체 연결 수는 그 2배, 보통 동시 요청 수에 맞춤)
         """
         self.client_type = client_type
         self.timeout = timeout
+        self.pool_size = max(1, pool_size)
         self.session = None
+        self._httpx_client = None
         
     async def __aenter__(self):
         """비동기 컨텍스트 매니저 진입"""
-        if self.client_type == "aiohttp":
-            connector = aiohttp.TCPConnector(limit=20, limit_per_host=10)
+        if self.client_type == "httpx":
+            # 컨텍스트 안의 모든 요청이 keep-alive 연결을 재사용하도록 클라이언트를 한 번만 생성
+            self._httpx_client = httpx.AsyncClient(
+                headers=_DEFAULT_HEADERS,
+                timeout=self.timeout,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=self.pool_size * 2, max_keepalive_connections=self.pool_size),
+                http2=HTTP2_AVAILABLE  # 같은 호스트 동시 요청을 하나의 연결에 다중화
+            )
+        elif self.client_type == "aiohttp":
+            connector = aiohttp.TCPConnector(limit=self.pool_size * 2, limit_per_host=self.pool_size)
             timeout = aiohttp.ClientTimeout(total=self.timeout)
             self.session = aiohttp.ClientSession(
                 connector=connector,
                 timeout=timeout,
-                headers=self._get_default_headers()
+                headers=_DEFAULT_HEADERS,
+                auto_decompress=True  # gzip/deflate/br 본문을 읽을 때 자동 해제 (기본값이지만 명시)
             )
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """비동기 컨텍스트 매니저 종료"""
+        if self._httpx_client:
+            await self._httpx_client.aclose()
+            self._httpx_client = None
         if self.session:
             await self.session.close()
     
-    def _get_default_headers(self) -> Dict[str, str]:
-        """기본 HTTP 헤더 반환"""
-        return {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3",
-            "Accept-Encoding": "gzip, deflate, br",
-            "DNT": "1",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-        }
+    def _check_content_encoding(self, encoding: Optional[str], url: str):
+        """프로세스의 첫 응답 Content-Encoding을 한 번만 출력하여 압축 응답이 해제되었는지 확인"""
+        global _encoding_checked
+        if _encoding_checked:
+            return
+        _encoding_checked = True
+        if encoding:
+            console.print(f"🗜️ 압축 응답 자동 해제 확인: {encoding} - {url}")
+        else:
+            console.print(f"📄 압축되지 않은 응답: {url}")
     
     async def get(self, url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None) -> Optional[str]:
         """HTTP GET 요청 수행"""
@@ -86,14 +136,20 @@ class HTTPClientManager:
     async def _httpx_get(self, url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None) -> Optional[str]:
         """httpx를 사용한 GET 요청"""
         try:
-            async with httpx.AsyncClient(
-                headers=headers or self._get_default_headers(),
-                timeout=self.timeout,
-                follow_redirects=True
-            ) as client:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                return response.text
+            if self._httpx_client is not None:
+                # 헤더를 지정한 경우에만 요청 단위로 덮어씀 (지정하지 않으면 클라이언트 기본 헤더 사용)
+                response = await self._httpx_client.get(url, params=params, headers=headers)
+            else:
+                # 컨텍스트 매니저 없이 호출된 경우 일회용 클라이언트 사용
+                async with httpx.AsyncClient(
+                    headers=headers or _DEFAULT_HEADERS,
+                    timeout=self.timeout,
+                    follow_redirects=True
+                ) as client:
+                    response = await client.get(url, params=params)
+            response.raise_for_status()
+            self._check_content_encoding(response.headers.get('Content-Encoding'), url)
+            return response.text
                 
         except httpx.HTTPStatusError as e:
             console.print(f"❌ HTTP 오류: {e.response.status_code} - {url}")
@@ -108,14 +164,20 @@ class HTTPClientManager:
     async def _httpx_post(self, url: str, data: Optional[Dict] = None, headers: Optional[Dict] = None) -> Optional[str]:
         """httpx를 사용한 POST 요청"""
         try:
-            async with httpx.AsyncClient(
-                headers=headers or self._get_default_headers(),
-                timeout=self.timeout,
-                follow_redirects=True
-            ) as client:
-                response = await client.post(url, data=data)
-                response.raise_for_status()
-                return response.text
+            if self._httpx_client is not None:
+                # 헤더를 지정한 경우에만 요청 단위로 덮어씀 (지정하지 않으면 클라이언트 기본 헤더 사용)
+                response = await self._httpx_client.post(url, data=data, headers=headers)
+            else:
+                # 컨텍스트 매니저 없이 호출된 경우 일회용 클라이언트 사용
+                async with httpx.AsyncClient(
+                    headers=headers or _DEFAULT_HEADERS,
+                    timeout=self.timeout,
+                    follow_redirects=True
+                ) as client:
+                    response = await client.post(url, data=data)
+            response.raise_for_status()
+            self._check_content_encoding(response.headers.get('Content-Encoding'), url)
+            return response.text
                 
         except httpx.HTTPStatusError as e:
             console.print(f"❌ HTTP 오류: {e.response.status_code} - {url}")
@@ -130,16 +192,7 @@ class HTTPClientManager:
     async def _aiohttp_get(self, url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None) -> Optional[str]:
         """aiohttp를 사용한 GET 요청"""
         try:
-            if not self.session:
-                raise RuntimeError("aiohttp 세션이 초기화되지 않았습니다. 컨텍스트 매니저를 사용하세요.")
-            
-            async with self.session.get(url, params=params, headers=headers) as response:
-                if response.status == 200:
-                    return await response.text()
-                else:
-                    console.print(f"❌ HTTP 오류: {response.status} - {url}")
-                    return None
-                    
+            return await self._aiohttp_request("GET", url, params=params, headers=headers)
         except Exception as e:
             console.print(f"❌ aiohttp GET 요청 오류: {str(e)} - {url}")
             return None
@@ -147,50 +200,171 @@ class HTTPClientManager:
     async def _aiohttp_post(self, url: str, data: Optional[Dict] = None, headers: Optional[Dict] = None) -> Optional[str]:
         """aiohttp를 사용한 POST 요청"""
         try:
-            if not self.session:
-                raise RuntimeError("aiohttp 세션이 초기화되지 않았습니다. 컨텍스트 매니저를 사용하세요.")
-            
-            async with self.session.post(url, data=data, headers=headers) as response:
-                if response.status == 200:
-                    return await response.text()
-                else:
-                    console.print(f"❌ HTTP 오류: {response.status} - {url}")
-                    return None
-                    
+            return await self._aiohttp_request("POST", url, data=data, headers=headers)
         except Exception as e:
             console.print(f"❌ aiohttp POST 요청 오류: {str(e)} - {url}")
             return None
+    
+    async def _aiohttp_request(self, method: str, url: str, **kwargs) -> Optional[str]:
+        """컨텍스트의 세션으로 요청하고, 컨텍스트 매니저 없이 호출된 경우 일회용 세션 사용"""
+        if self.session is not None:
+            return await self._aiohttp_read(self.session, method, url, **kwargs)
+        
+        async with aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            headers=_DEFAULT_HEADERS
+        ) as session:
+            return await self._aiohttp_read(session, method, url, **kwargs)
+    
+    async def _aiohttp_read(self, session: aiohttp.ClientSession, method: str, url: str, **kwargs) -> Optional[str]:
+        """응답이 200이면 본문 텍스트 반환"""
+        async with session.request(method, url, **kwargs) as response:
+            if response.status == 200:
+                text = await response.text()
+                self._check_content_encoding(response.headers.get('Content-Encoding'), url)
+                return text
+            else:
+                console.print(f"❌ HTTP 오류: {response.status} - {url}")
+                return None
+
+
+# 공유 클라이언트: 여러 요청(디버그 스크립트 등)이 keep-alive 소켓과 DNS 결과를 재사용
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def get_shared_client(timeout: float = 10.0) -> httpx.AsyncClient:
+    """
+    지연 생성되는 공유 httpx.AsyncClient 반환
+    
+    Args:
+        timeout: 최초 생성 시 사용할 타임아웃 (초)
+    
+    Returns:
+        공유 AsyncClient (사용 후 close_shared_client로 종료)
+    """
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=75),
+            http2=HTTP2_AVAILABLE
+        )
+    return _shared_client
+
+
+async def close_shared_client():
+    """공유 클라이언트 종료 (이벤트 루프 종료 전에 호출)"""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+
+
+async def fetch_text(url: str, max_bytes: Optional[int] = None, chunk_size: int = 16384) -> str:
+    """
+    공유 클라이언트로 GET 요청 후 본문 텍스트 반환
+    
+    Args:
+        url: 요청할 URL
+        max_bytes: 지정 시 이 크기까지만 스트리밍으로 받고 나머지는 읽지 않음
+        chunk_size: 스트리밍 청크 크기
+    
+    Returns:
+        응답 텍스트 (max_bytes 지정 시 앞부분만)
+    """
+    client = get_shared_client()
+    if max_bytes is None:
+        response = await client.get(url)
+        return response.text
+    
+    buf = bytearray()
+    async with client.stream('GET', url) as response:
+        async for chunk in response.aiter_bytes(chunk_size):
+            buf += chunk
+            if len(buf) >= max_bytes:
+                break
+        encoding = response.encoding or 'utf-8'
+    # 잘린 멀티바이트 문자는 대체 문자로 처리
+    return bytes(buf[:max_bytes]).decode(encoding, errors='replace')
+
+
+# 여러 URL 분석 시 동시 요청 수 상한 (호스트 부하 제한)
+MAX_CONCURRENT_FETCHES = 8
+
+
+async def fetch_and_analyze(urls: List[str], analyze: Callable[[int, str, str], Awaitable[Any]],
+                            fetch: Callable[[str], Awaitable[str]] = fetch_text,
+                            max_concurrent: int = MAX_CONCURRENT_FETCHES):
+    """
+    여러 URL을 동시에 받고, 받은 페이지는 입력 순서대로 분석 (디버그 스크립트용)
+    
+    Args:
+        urls: 요청할 URL 목록
+        analyze: (순번, URL, HTML)을 받아 페이지를 분석하는 코루틴 함수
+        fetch: URL을 받아 HTML을 반환하는 코루틴 함수 (기본: fetch_text, 캐시 사용 시 cached_get 등)
+        max_concurrent: 동시 요청 수 상한
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+    
+    async def fetch_with_semaphore(url):
+        async with semaphore:
+            return await fetch(url)
+    
+    pages = await asyncio.gather(*(fetch_with_semaphore(url) for url in urls), return_exceptions=True)
+    
+    for i, (url, page) in enumerate(zip(urls, pages)):
+        if i:
+            console.print()
+        if isinstance(page, Exception):
+            # 요청 실패는 분석 결과와 같은 형식으로 출력하고 다음 URL로 진행
+            console.print(f"🔍 URL: {url}")
+            console.print("=" * 80)
+            console.print(f"❌ 오류 발생: {str(page)}")
+            continue
+        await analyze(i, url, page)
 
 
 # 편의 함수들
-async def make_request(url: str, client_type: str = "httpx", method: str = "GET", 
+async def make_request(url: str, client_type: str = "aiohttp", method: str = "GET", 
                       params: Optional[Dict] = None, data: Optional[Dict] = None, 
-                      headers: Optional[Dict] = None, timeout: float = 10.0) -> Optional[str]:
+                      headers: Optional[Dict] = None, timeout: float = 10.0,
+                      client: Optional[HTTPClientManager] = None) -> Optional[str]:
     """
     간단한 HTTP 요청 함수
     
     Args:
         url: 요청할 URL
-        client_type: "httpx" 또는 "aiohttp"
+        client_type: "aiohttp" (기본) 또는 "httpx"
         method: "GET" 또는 "POST"
         params: GET 요청 파라미터
         data: POST 요청 데이터
         headers: HTTP 헤더
         timeout: 타임아웃 (초)
+        client: 이미 진입한 HTTPClientManager (지정 시 연결을 재사용하고 client_type/timeout은 무시)
     
     Returns:
         응답 텍스트 또는 None (실패 시)
     """
+    if client is not None:
+        return await _request_with(client, url, method, params, data, headers)
+    
     async with HTTPClientManager(client_type, timeout) as client:
-        if method.upper() == "GET":
-            return await client.get(url, params, headers)
-        elif method.upper() == "POST":
-            return await client.post(url, data, headers)
-        else:
-            raise ValueError(f"지원하지 않는 HTTP 메서드: {method}")
+        return await _request_with(client, url, method, params, data, headers)
+
 
+async def _request_with(client: HTTPClientManager, url: str, method: str,
+                        params: Optional[Dict], data: Optional[Dict],
+                        headers: Optional[Dict]) -> Optional[str]:
+    """주어진 매니저로 GET/POST 요청 수행"""
+    if method.upper() == "GET":
+        return await client.get(url, params, headers)
+    elif method.upper() == "POST":
+        return await client.post(url, data, headers)
+    else:
+        raise ValueError(f"지원하지 않는 HTTP 메서드: {method}")
 
-async def make_requests_batch(urls: list, client_type: str = "httpx", 
+
+async def make_requests_batch(urls: list, client_type: str = "aiohttp", 
                              method: str = "GET", max_concurrent: int = 10, 
                              delay: float = 0.1) -> Dict[str, Optional[str]]:
     """
@@ -198,7 +372,7 @@ async def make_requests_batch(urls: list, client_type: str = "httpx",
     
     Args:
         urls: 요청할 URL 리스트
-        client_type: "httpx" 또는 "aiohttp"
+        client_type: "aiohttp" (기본) 또는 "httpx"
         method: "GET" 또는 "POST"
         max_concurrent: 최대 동시 요청 수
         delay: 요청 간 지연 (초)
@@ -206,19 +380,26 @@ async def make_requests_batch(urls: list, client_type: str = "httpx",
     Returns:
         URL별 응답 결과 딕셔너리
     """
+    if method.upper() not in ("GET", "POST"):
+        raise ValueError(f"지원하지 않는 HTTP 메서드: {method}")
+    
     semaphore = asyncio.Semaphore(max_concurrent)
     results = {}
     
-    async def fetch_with_semaphore(url):
-        async with semaphore:
-            result = await make_request(url, client_type, method)
-            await asyncio.sleep(delay)
-            return url, result
-    
-    tasks = [fetch_with_semaphore(url) for url in urls]
-    completed = await asyncio.gather(*tasks, return_exceptions=True)
+    # 배치 전체가 동시 요청 수에 맞춘 하나의 세션(연결 풀)을 공유
+    async with HTTPClientManager(client_type, pool_size=max_concurrent) as client:
+        request = client.get if method.upper() == "GET" else client.post
+        
+        async def fetch_with_semaphore(url):
+            async with semaphore:
+                result = await request(url)
+                await asyncio.sleep(delay)
+                return result
+        
+        tasks = [fetch_with_semaphore(url) for url in urls]
+        completed = await asyncio.gather(*tasks, return_exceptions=True)
     
-    for url, result in completed:
+    for url, result in zip(urls, completed):
         if isinstance(result, Exception):
             results[url] = None
             console.print(f"❌ {url} 요청 실패: {str(result)}")
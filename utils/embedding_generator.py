@@ -8,42 +8,94 @@ OpenAI 임베딩 생성 모듈
 - 429 에러 처리 및 자동 속도 조절
 """
 
+import asyncio
 import os
 import logging
 import random
-import time
-from typing import List, Dict, Optional, Tuple
+from typing import Iterator, List, Dict, Optional, Tuple
 from datetime import datetime
+import numpy as np
+import pandas as pd
 
 try:
     from utils.supabase_manager_unified import UnifiedSupabaseManager
 except ImportError:
     from supabase_manager_unified import UnifiedSupabaseManager
 
+# 토크나이저가 있으면 글자 수 대신 토큰 수 기준으로 입력을 자름
 try:
-    from openai import OpenAI
+    import tiktoken
+    _ENCODING = tiktoken.get_encoding("cl100k_base")  # text-embedding-3-small 토크나이저
+    TIKTOKEN_AVAILABLE = True
+except Exception:
+    _ENCODING = None
+    TIKTOKEN_AVAILABLE = False
+
+try:
+    from openai import AsyncOpenAI
 except ImportError:
     print("OpenAI 패키지가 설치되지 않았습니다. 'pip install openai'를 실행해주세요.")
     exit(1)
 
+# 한 번의 embeddings.create 호출에 넣을 기사 수 (API 한도는 2048개)
+EMBEDDING_BATCH_SIZE = 128
+
+# 동시에 진행할 임베딩 배치 요청 수 (Rate Limit 여유에 맞춰 조정)
+EMBEDDING_CONCURRENCY = 4
+
+# 임베딩 입력(제목 + 본문) 최대 토큰 수 (모델 한도 8191) / tiktoken이 없을 때의 최대 글자 수
+MAX_EMBEDDING_TOKENS = 8000
+MAX_EMBEDDING_CHARS = 1000
+
+# get_unembedded_articles RPC 한 번에 받을 기사 수 (PostgREST 기본 max-rows와 동일)
+UNEMBEDDED_PAGE_SIZE = 1000
+
+# 생성된 임베딩을 모아 embeddings 테이블에 한 번에 넣을 행 수
+EMBEDDING_INSERT_CHUNK_SIZE = 500
+
+# 한 번의 embeddings.create 요청에 담을 수 있는 전체 입력 토큰 수 (API 한도)
+MAX_REQUEST_TOKENS = 300000
+
+
+def _truncate_for_embedding(text: str) -> Tuple[str, int]:
+    """
+    임베딩 입력 길이 제한에 맞게 텍스트를 자름
+    
+    Args:
+        text: 제목 + 본문 텍스트
+    
+    Returns:
+        (잘린 텍스트, 토큰 수) - tiktoken이 없으면 글자 수로 자르고 토큰 수는 0
+    """
+    if not TIKTOKEN_AVAILABLE:
+        return text[:MAX_EMBEDDING_CHARS], 0
+    
+    tokens = _ENCODING.encode(text)
+    if len(tokens) > MAX_EMBEDDING_TOKENS:
+        tokens = tokens[:MAX_EMBEDDING_TOKENS]
+        text = _ENCODING.decode(tokens)
+    return text, len(tokens)
+
+
 class EmbeddingGenerator:
     """OpenAI 임베딩 생성 클래스"""
     
-    def __init__(self, limit: Optional[int] = None):
+    def __init__(self, limit: Optional[int] = None, concurrency: int = EMBEDDING_CONCURRENCY):
         self.supabase = UnifiedSupabaseManager()
         self.logger = logging.getLogger(__name__)
         self.limit = limit  # 테스트용 기사 개수 제한
+        self.concurrency = max(1, concurrency)  # 동시 배치 요청 수
         
         # OpenAI 클라이언트 초기화
         self.openai_client = self._init_openai_client()
         
         # 모드별 설정
         if self.limit:  # 테스트 모드
-            self.batch_size = 1
+            self.batch_size = min(self.limit, EMBEDDING_BATCH_SIZE)
             self.base_delay = 1
             print(f"🧪 테스트 모드: batch_size={self.batch_size}, base_delay={self.base_delay}초")
         else:  # 운영 모드
-            self.batch_size = 1
+            self.batch_size = EMBEDDING_BATCH_SIZE
             self.base_delay = 2
             print(f"🚀 운영 모드: batch_size={self.batch_size}, base_delay={self.base_delay}초")
         
@@ -66,6 +118,9 @@ class EmbeddingGenerator:
             'failed_requests': 0
         }
         
+        # 여러 배치의 임베딩을 모아 저장하기 위한 대기 행
+        self._pending_inserts = []
+        
         # 에러 추적
         self.failed_article_ids = []  # 실패한 article_id 리스트
         self.skipped_article_ids = []  # 건너뛴 article_id 리스트
@@ -73,7 +128,7 @@ class EmbeddingGenerator:
         # 재시도 설정
         self.max_retries = 10  # 429 에러에 대해서는 무한 재시도 대신 딜레이 조절
     
-    def _init_openai_client(self) -> Optional[OpenAI]:
+    def _init_openai_client(self) -> Optional[AsyncOpenAI]:
         """OpenAI 클라이언트 초기화"""
         api_key = os.getenv('OPENAI_API_KEY')
         if not api_key:
@@ -82,7 +137,7 @@ class EmbeddingGenerator:
             return None
         
         try:
-            client = OpenAI(api_key=api_key)
+            client = AsyncOpenAI(api_key=api_key)
             print("✅ OpenAI 클라이언트 초기화 성공")
             return client
         except Exception as e:
@@ -107,20 +162,15 @@ class EmbeddingGenerator:
             print("🚀 OPINION.IM 기사 임베딩 시작")
             print("=" * 60)
             
-            # 1. 임베딩이 필요한 기사 조회
+            # 임베딩이 필요한 기사를 페이지 단위로 받으면서 바로 배치 임베딩 및 저장 (배치들을 동시에 요청)
             print("🔍 임베딩이 필요한 기사를 조회하는 중...")
-            articles_to_embed = self._get_articles_needing_embedding()
-            if not articles_to_embed:
-                print("⚠️ 임베딩이 필요한 기사가 없습니다.")
-                return True
+            success = asyncio.run(self._run_embedding())
             
-            self.stats['total_articles'] = len(articles_to_embed)
-            print(f"📊 임베딩 대상: {len(articles_to_embed)}개 기사")
-            
-            # 2. 배치 단위로 임베딩 생성 및 저장
-            success = self._process_embeddings_in_batches(articles_to_embed)
+            if not self.stats['total_articles']:
+                print("⚠️ 임베딩이 필요한 기사가 없습니다.")
+                return success
             
-            # 3. 결과 출력
+            # 결과 출력
             self._display_results()
             
             return success
@@ -130,111 +180,260 @@ class EmbeddingGenerator:
             print(f"💥 임베딩 생성 실패: {str(e)}")
             return False
     
-    def _get_articles_needing_embedding(self) -> List[Dict]:
-        """임베딩이 필요한 기사 조회 (embeddings 테이블에 없는 기사)"""
+    def _iter_unembedded_articles(self, page_size: int = UNEMBEDDED_PAGE_SIZE) -> Iterator[List[Dict]]:
+        """
+        임베딩이 필요한 기사(embeddings 테이블에 없는 기사)를 페이지 단위로 생성
+        
+        Args:
+            page_size: 한 번에 조회할 기사 수
+        
+        Yields:
+            기사 리스트 (id, title, content)
+        """
+        # 서버에서 NOT EXISTS로 걸러 임베딩이 필요한 기사만 받음 (함수가 없으면 생성 후 재시도)
+        page = None
+        try:
+            page = self._fetch_unembedded_page(self._next_page_rows(0, page_size), 0)
+        except Exception as e:
+            print(f"  ⚠️ get_unembedded_articles 호출 실패, 함수 생성 후 재시도: {e}")
+            if self.supabase.create_unembedded_articles_function():
+                try:
+                    page = self._fetch_unembedded_page(self._next_page_rows(0, page_size), 0)
+                except Exception as e:
+                    self.logger.error(f"get_unembedded_articles 재시도 실패: {str(e)}")
+        
+        # RPC를 쓸 수 없으면 두 테이블을 받아 클라이언트에서 필터링
+        if page is None:
+            print("  ⚠️ 서버 측 조회를 사용할 수 없어 전체 기사를 받아 필터링합니다.")
+            yield from self._iter_articles_needing_embedding_client_side(page_size)
+            return
+        
+        # 이미 임베딩된 기사 수는 개수만 조회
+        existing = self.supabase.client.table('embeddings').select('article_id', count='exact').limit(1).execute()
+        self.stats['already_embedded'] = existing.count or 0
+        print(f"  📊 이미 임베딩됨: {self.stats['already_embedded']}개")
+        if self.limit:
+            print(f"📊 테스트 실행: 최대 {self.limit}개 기사만 임베딩")
+        
+        fetched = 0
+        while page:
+            yield page
+            fetched += len(page)
+            if self.limit and fetched >= self.limit:
+                break
+            page = self._fetch_unembedded_page(self._next_page_rows(fetched, page_size), page[-1]['id'])
+    
+    def _next_page_rows(self, fetched: int, page_size: int) -> int:
+        """limit을 넘지 않도록 다음 페이지에서 받을 기사 수 계산"""
+        if self.limit:
+            return min(page_size, self.limit - fetched)
+        return page_size
+    
+    def _fetch_unembedded_page(self, max_rows: int, after_id: int) -> List[Dict]:
+        """get_unembedded_articles RPC로 after_id 다음부터 최대 max_rows개 기사 조회"""
+        result = self.supabase.client.rpc(
+            'get_unembedded_articles', {'max_rows': max_rows, 'after_id': after_id}
+        ).execute()
+        return result.data or []
+    
+    def _iter_articles_needing_embedding_client_side(self, page_size: int) -> Iterator[List[Dict]]:
+        """임베딩이 필요한 기사를 클라이언트에서 필터링하여 페이지 단위로 생성 (get_unembedded_articles를 쓸 수 없을 때)"""
         try:
             print("  🔍 이미 임베딩된 article_id 조회 중...")
-            # 이미 임베딩된 article_id 조회
-            existing_embeddings = self.supabase.client.table('embeddings').select('article_id').execute()
+            # 이미 임베딩된 article_id 조회 (PostgREST 최대 행 수 제한이 있으므로 페이지 단위)
             existing_ids = set()
-            if existing_embeddings.data:
-                existing_ids = {item['article_id'] for item in existing_embeddings.data}
-                print(f"  ✅ 기존 임베딩: {len(existing_ids)}개")
-            else:
-                print("  ✅ 기존 임베딩: 0개")
+            for rows in self._iter_table_pages('embeddings', 'article_id', 'article_id', page_size):
+                existing_ids.update(item['article_id'] for item in rows)
+            print(f"  ✅ 기존 임베딩: {len(existing_ids)}개")
             
             print("  🔍 articles 테이블에서 기사 조회 중...")
-            # 모든 기사 조회 (content가 있는 것만)
-            all_articles = self.supabase.client.table('articles').select('id, content, title, media_id, bias, published_at').execute()
-            if not all_articles.data:
-                print("  ❌ articles 테이블에 데이터가 없습니다.")
-                return []
-            
-            print(f"  ✅ 전체 기사: {len(all_articles.data)}개")
-            
-            # 임베딩이 필요한 기사만 필터링
-            articles_needing_embedding = []
-            for article in all_articles.data:
-                article_id = article.get('id')
-                content = article.get('content', '')
-                title = article.get('title', '')
+            total = 0
+            needed_count = 0
+            for rows in self._iter_table_pages('articles', 'id, title, content', 'id', page_size):
+                total += len(rows)
+                
+                # 임베딩이 필요한 기사만 필터링 (열 단위 벡터 연산)
+                # content가 있고 아직 임베딩되지 않은 기사만 선택, 내용 없는 미임베딩 기사는 건너뜀
+                df = pd.DataFrame(rows, columns=['id', 'content'])
+                embedded = df['id'].isin(existing_ids).to_numpy()
+                has_content = df['content'].fillna('').astype(bool).to_numpy()
+                needed = has_content & ~embedded
+                skipped = ~has_content & ~embedded
                 
-                # content가 있고, 아직 임베딩되지 않은 기사만 선택
-                if content and article_id not in existing_ids:
-                    articles_needing_embedding.append(article)
-                elif article_id in existing_ids:
-                    self.stats['already_embedded'] += 1
-                elif not content:
-                    self.stats['skipped_articles'] += 1
-                    self.skipped_article_ids.append(article_id)
+                articles_needing_embedding = [rows[i] for i in np.flatnonzero(needed)]
+                self.stats['already_embedded'] += int(embedded.sum())
+                self.stats['skipped_articles'] += int(skipped.sum())
+                self.skipped_article_ids.extend(df['id'].to_numpy()[skipped].tolist())
+                
+                # limit 설정이 있다면 제한
+                if self.limit:
+                    articles_needing_embedding = articles_needing_embedding[:self.limit - needed_count]
+                
+                if articles_needing_embedding:
+                    needed_count += len(articles_needing_embedding)
+                    yield articles_needing_embedding
+                
+                if self.limit and needed_count >= self.limit:
+                    print(f"📊 테스트 실행: {self.limit}개 기사만 임베딩")
+                    break
             
-            print(f"  📊 임베딩 필요: {len(articles_needing_embedding)}개")
+            print(f"  ✅ 조회한 기사: {total}개")
             print(f"  📊 이미 임베딩됨: {self.stats['already_embedded']}개")
             print(f"  📊 건너뜀: {self.stats['skipped_articles']}개")
             
-            # limit 설정이 있다면 제한
-            if self.limit and len(articles_needing_embedding) > self.limit:
-                articles_needing_embedding = articles_needing_embedding[:self.limit]
-                print(f"📊 테스트 실행: {self.limit}개 기사만 임베딩")
-            
-            return articles_needing_embedding
-            
         except Exception as e:
             self.logger.error(f"기사 조회 실패: {str(e)}")
             print(f"❌ 기사 조회 실패: {str(e)}")
-            return []
     
-    def _process_embeddings_in_batches(self, articles: List[Dict]) -> bool:
-        """배치 단위로 임베딩 처리"""
-        total_batches = (len(articles) + self.batch_size - 1) // self.batch_size
-        
-        print(f"📦 총 {total_batches}개 배치로 처리 (배치 크기: {self.batch_size})")
+    def _iter_table_pages(self, table: str, columns: str, order_column: str, page_size: int) -> Iterator[List[Dict]]:
+        """테이블을 range로 페이지 단위 조회 (빈 페이지가 나오면 종료)"""
+        offset = 0
+        while True:
+            result = (self.supabase.client.table(table)
+                      .select(columns)
+                      .order(order_column)
+                      .range(offset, offset + page_size - 1)
+                      .execute())
+            rows = result.data or []
+            if not rows:
+                break
+            yield rows
+            offset += len(rows)
+    
+    async def _run_embedding(self) -> bool:
+        """임베딩 처리 후 이번 이벤트 루프에 묶인 OpenAI 연결을 정리"""
+        try:
+            return await self._process_embeddings_in_batches()
+        finally:
+            api_key = self.openai_client.api_key
+            await self.openai_client.close()
+            # 다음 실행(새 이벤트 루프)에서 쓸 클라이언트로 교체
+            self.openai_client = AsyncOpenAI(api_key=api_key)
+    
+    async def _process_embeddings_in_batches(self) -> bool:
+        """
+        기사 페이지를 받는 대로 배치로 나눠 큐에 넣고, concurrency개 작업자가 꺼내 임베딩
+        (다음 페이지 조회와 임베딩 요청이 겹쳐 진행됨)
+        """
+        print(f"📦 배치 크기: {self.batch_size}, 동시 요청: {self.concurrency}")
         print("=" * 60)
         
-        for i in range(0, len(articles), self.batch_size):
-            batch = articles[i:i + self.batch_size]
-            batch_num = (i // self.batch_size) + 1
-            
-            print(f"\n🔄 배치 {batch_num}/{total_batches} 처리 중... ({len(batch)}개 기사)")
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency * 2)
+        producer_done = False
+        batch_counter = 0
+        
+        async def produce():
+            nonlocal producer_done
+            pages = self._iter_unembedded_articles()
+            try:
+                while True:
+                    # Supabase 조회와 토큰화는 동기식이므로 스레드에서 실행
+                    page = await asyncio.to_thread(next, pages, None)
+                    if page is None:
+                        break
+                    self.stats['total_articles'] += len(page)
+                    print(f"📊 임베딩 대상 추가: {len(page)}개 기사 (누적 {self.stats['total_articles']}개)")
+                    for batch in await asyncio.to_thread(self._build_batches, page):
+                        await queue.put(batch)
+            finally:
+                producer_done = True
+                for _ in range(self.concurrency):
+                    await queue.put(None)
+        
+        async def work():
+            nonlocal batch_counter
+            while True:
+                batch = await queue.get()
+                if batch is None:
+                    return
+                batch_counter += 1
+                batch_num = batch_counter
+                print(f"\n🔄 배치 {batch_num} 처리 중... ({len(batch)}개 기사)")
+                
+                # 배치 처리
+                batch_success = await self._process_batch(batch, batch_num)
+                if not batch_success:
+                    print(f"❌ 배치 {batch_num} 처리 실패")
+                
+                # 같은 작업자의 다음 배치 전 딜레이 (남은 배치가 있는 경우에만)
+                if not (producer_done and queue.empty()):
+                    delay = random.uniform(self.current_delay * 0.5, self.current_delay * 1.5)
+                    if delay > 0:
+                        print(f"⏳ {delay:.1f}초 대기 중...")
+                        await asyncio.sleep(delay)
+        
+        try:
+            # 조회가 중간에 실패해도 이미 큐에 넣은 배치는 작업자가 끝까지 처리
+            results = await asyncio.gather(
+                produce(), *[work() for _ in range(self.concurrency)], return_exceptions=True
+            )
+        finally:
+            # 청크를 채우지 못하고 남은 임베딩 저장
+            await self._flush_pending_inserts()
+        
+        success = True
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.error(f"임베딩 처리 중 오류: {str(result)}")
+                print(f"❌ 임베딩 처리 중 오류: {str(result)}")
+                success = False
+        
+        return success
+    
+    def _build_batches(self, articles: List[Dict]) -> List[List[Tuple[Dict, str]]]:
+        """
+        기사별 입력 텍스트를 한 번만 만들어(토큰화 포함) 요청 단위 배치로 묶음
+        
+        Args:
+            articles: 임베딩할 기사 리스트
+        
+        Returns:
+            (기사, 입력 텍스트) 배치 리스트 - 배치당 최대 batch_size개, 전체 토큰 수 MAX_REQUEST_TOKENS 이하
+        """
+        batches = []
+        batch = []
+        batch_tokens = 0
+        for article in articles:
+            article_id = article.get('id')
+            content = article.get('content', '')
+            title = article.get('title', '')
             
-            # 배치 처리
-            batch_success = self._process_batch(batch, batch_num, total_batches)
-            if not batch_success:
-                print(f"❌ 배치 {batch_num} 처리 실패")
+            if not content:
+                self.stats['skipped_articles'] += 1
+                self.skipped_article_ids.append(article_id)
+                print(f"⚠️ 건너뜀: 기사 ID={article_id} (내용 없음)")
+                continue
             
-            # 배치 간 딜레이 (마지막 배치가 아닌 경우에만)
-            if batch_num < total_batches:
-                delay = random.uniform(self.current_delay * 0.5, self.current_delay * 1.5)
-                if delay > 0:
-                    print(f"⏳ {delay:.1f}초 대기 중...")
-                    time.sleep(delay)
-        
-        return True
+            text, token_count = _truncate_for_embedding(f"제목: {title}\n\n본문: {content}")
+            if batch and (len(batch) >= self.batch_size or batch_tokens + token_count > MAX_REQUEST_TOKENS):
+                batches.append(batch)
+                batch = []
+                batch_tokens = 0
+            batch.append((article, text))
+            batch_tokens += token_count
+        
+        if batch:
+            batches.append(batch)
+        return batches
     
-    def _process_batch(self, batch: List[Dict], batch_num: int, total_batches: int) -> bool:
-        """배치 단위 임베딩 처리"""
+    async def _process_batch(self, batch: List[Tuple[Dict, str]], batch_num: int) -> bool:
+        """배치 단위 임베딩 처리 (배치의 기사를 한 번의 API 호출로 임베딩)"""
         try:
             embeddings_to_insert = []
             batch_stats = {'success': 0, 'failed': 0}
             
-            for idx, article in enumerate(batch, 1):
+            # OpenAI 임베딩 생성 (지속적인 재시도)
+            texts = [text for _, text in batch]
+            article_ids = [article.get('id') for article, _ in batch]
+            embeddings = await self._generate_embeddings_with_persistence(texts, article_ids)
+            
+            for (article, text), embedding in zip(batch, embeddings):
                 article_id = article.get('id')
-                content = article.get('content', '')
-                title = article.get('title', '')
                 
-                if not content:
-                    self.stats['skipped_articles'] += 1
-                    self.skipped_article_ids.append(article_id)
-                    print(f"⚠️ 건너뜀: 기사 ID={article_id} (내용 없음)")
-                    continue
+                # 원문 길이와 잘린 입력 길이
+                original_length = len(article.get('content', ''))
+                truncated_length = len(text)
                 
-                # 원문 길이와 잘린 길이 계산
-                original_length = len(content)
-                max_chars = 1000
-                truncated_length = min(original_length, max_chars)
-                
-                # OpenAI 임베딩 생성 (지속적인 재시도)
-                embedding = self._generate_embedding_with_persistence(content, title, article_id)
                 if embedding:
                     embeddings_to_insert.append({
                         'article_id': article_id,
@@ -244,22 +443,20 @@ class EmbeddingGenerator:
                     self.stats['newly_embedded'] += 1
                     batch_stats['success'] += 1
                     print(f"✂️ {article_id} → {original_length}자 → {truncated_length}자 → 임베딩 성공")
-                    
-                    # 성공 시 딜레이 초기화
-                    self.current_delay = self.base_delay
                 else:
                     self.stats['failed_embeddings'] += 1
                     self.failed_article_ids.append(article_id)  # 실패한 article_id 저장
                     batch_stats['failed'] += 1
                     print(f"✂️ {article_id} → {original_length}자 → {truncated_length}자 → 임베딩 실패")
             
-            # 배치로 embeddings 테이블에 저장
-            if embeddings_to_insert:
-                save_success = self._insert_embeddings_batch(embeddings_to_insert)
-                if save_success:
-                    print(f"💾 데이터베이스 저장 완료: {len(embeddings_to_insert)}개 임베딩")
-                else:
-                    print(f"❌ 데이터베이스 저장 실패")
+            # 성공 시 딜레이 초기화
+            if batch_stats['success']:
+                self.current_delay = self.base_delay
+            
+            # 여러 배치분을 모아 EMBEDDING_INSERT_CHUNK_SIZE개 단위로 embeddings 테이블에 저장
+            self._pending_inserts.extend(embeddings_to_insert)
+            if len(self._pending_inserts) >= EMBEDDING_INSERT_CHUNK_SIZE:
+                await self._flush_pending_inserts()
             
             # 배치 완료 출력
             print(f"✅ {len(batch)}개 기사 임베딩 완료 (성공: {batch_stats['success']}, 실패: {batch_stats['failed']})")
@@ -270,28 +467,35 @@ class EmbeddingGenerator:
             self.logger.error(f"배치 처리 실패: {str(e)}")
             return False
     
-    def _generate_embedding_with_persistence(self, content: str, title: str, article_id: int) -> Optional[List[float]]:
-        """지속적인 재시도로 OpenAI 임베딩 생성 (429 에러 시 딜레이 조절)"""
-        max_attempts = self.max_retries
+    async def _generate_embeddings_with_persistence(self, texts: List[str], article_ids: List[int],
+                                                    retry_budget: Optional[Dict[str, int]] = None) -> List[Optional[List[float]]]:
+        """
+        여러 텍스트를 한 번의 요청으로 임베딩 (429 에러 시 딜레이를 늘리고 배치를 반으로 나눠 재시도)
+        
+        Args:
+            texts: 임베딩할 텍스트 리스트
+            article_ids: 텍스트별 기사 ID (로그용)
+            retry_budget: 원래 배치 전체가 공유하는 남은 429 재시도 횟수 (반으로 나눈 하위 배치도 같은 값을 차감)
+        
+        Returns:
+            입력 순서대로의 임베딩 리스트 (실패한 항목은 None)
+        """
+        if retry_budget is None:
+            retry_budget = {'remaining': self.max_retries}
         
-        for attempt in range(1, max_attempts + 1):
+        while retry_budget['remaining'] > 0:
             try:
-                # 제목과 본문을 결합하여 임베딩 생성
-                combined_text = f"제목: {title}\n\n본문: {content}"
-                
-                # 텍스트 길이 제한
-                max_chars = 1000
-                if len(combined_text) > max_chars:
-                    combined_text = combined_text[:max_chars]
-                
-                response = self.openai_client.embeddings.create(
+                response = await self.openai_client.embeddings.create(
                     model="text-embedding-3-small",
-                    input=combined_text
+                    input=texts
                 )
                 
-                # 성공 시 통계 업데이트
+                # 성공 시 통계 업데이트 (응답의 index로 입력 순서에 맞춰 배치)
                 self.stats['successful_requests'] += 1
-                return response.data[0].embedding
+                embeddings = [None] * len(texts)
+                for item in response.data:
+                    embeddings[item.index] = item.embedding
+                return embeddings
                 
             except Exception as e:
                 error_message = str(e)
@@ -301,29 +505,59 @@ class EmbeddingGenerator:
                 if "429" in error_message or "Too Many Requests" in error_message:
                     self.stats['rate_limit_retries'] += 1
                     self.stats['total_retries'] += 1
+                    retry_budget['remaining'] -= 1
+                    if retry_budget['remaining'] <= 0:
+                        break
                     
                     # 딜레이를 2배로 증가 (최대 60초)
                     self.current_delay = min(self.current_delay * 2, self.max_delay)
                     
-                    print(f"⚠️ Rate Limit: {self.current_delay:.0f}초 대기 후 재시도 (시도 {attempt}/{max_attempts})")
-                    time.sleep(self.current_delay)
+                    print(f"⚠️ Rate Limit: {self.current_delay:.0f}초 대기 후 재시도 (남은 재시도 {retry_budget['remaining']}/{self.max_retries})")
+                    await asyncio.sleep(self.current_delay)
+                    
+                    # 429 한 번에 한 번만 반으로 나눠 재시도 (두 하위 배치는 남은 재시도 횟수를 공유)
+                    if len(texts) > 1:
+                        return await self._split_and_retry(texts, article_ids, retry_budget)
                     continue
                 
-                # 기타 에러 - 로그 남기고 다음 기사로
+                # 기타 에러 - 여러 기사면 반으로 나눠 문제 기사만 실패 처리
+                elif len(texts) > 1:
+                    return await self._split_and_retry(texts, article_ids, retry_budget)
                 else:
-                    print(f"❌ API 에러 (기사 ID={article_id}): {error_message}")
-                    self.logger.error(f"기사 ID {article_id} 임베딩 실패: {error_message}")
-                    return None
+                    print(f"❌ API 에러 (기사 ID={article_ids[0]}): {error_message}")
+                    self.logger.error(f"기사 ID {article_ids[0]} 임베딩 실패: {error_message}")
+                    return [None]
+        
+        # 최대 시도 횟수 초과 (다른 하위 배치가 재시도 횟수를 모두 쓴 경우 요청하지 않고 실패 처리)
+        print(f"❌ 최대 시도 횟수 초과: 기사 ID={', '.join(str(article_id) for article_id in article_ids)}")
+        return [None] * len(texts)
+    
+    async def _split_and_retry(self, texts: List[str], article_ids: List[int],
+                               retry_budget: Dict[str, int]) -> List[Optional[List[float]]]:
+        """배치를 반으로 나눠 각각 임베딩 (남은 재시도 횟수는 두 하위 배치가 공유)"""
+        mid = len(texts) // 2
+        return (await self._generate_embeddings_with_persistence(texts[:mid], article_ids[:mid], retry_budget) +
+                await self._generate_embeddings_with_persistence(texts[mid:], article_ids[mid:], retry_budget))
+    
+    async def _flush_pending_inserts(self):
+        """대기 중인 임베딩을 한 번의 요청으로 저장"""
+        # await 전에 목록을 교체하므로 동시에 실행되는 배치가 같은 행을 두 번 저장하지 않음
+        rows, self._pending_inserts = self._pending_inserts, []
+        if not rows:
+            return
         
-        # 최대 시도 횟수 초과
-        print(f"❌ 최대 시도 횟수 초과: 기사 ID={article_id}")
-        return None
+        # Supabase 클라이언트는 동기식이므로 스레드에서 실행하여 다른 배치 요청을 막지 않음
+        save_success = await asyncio.to_thread(self._insert_embeddings_batch, rows)
+        if save_success:
+            print(f"💾 데이터베이스 저장 완료: {len(rows)}개 임베딩")
+        else:
+            print(f"❌ 데이터베이스 저장 실패")
     
     def _insert_embeddings_batch(self, embeddings: List[Dict]) -> bool:
-        """embeddings 테이블에 배치 삽입"""
+        """embeddings 테이블에 배치 삽입 (삽입된 행은 돌려받지 않음)"""
         try:
-            result = self.supabase.client.table('embeddings').insert(embeddings).execute()
-            return result.data is not None
+            self.supabase.client.table('embeddings').insert(embeddings, returning='minimal').execute()
+            return True
         except Exception as e:
             self.logger.error(f"임베딩 저장 실패: {str(e)}")
             print(f"❌ 임베딩 저장 실패: {str(e)}")
@@ -232,6 +232,117 @@ class UnifiedSupabaseManager:
             self.logger.error(f"편향성 요약 저장 실패: {str(e)}")
             return False
     
+    def create_issue_report_view(self) -> bool:
+        """이슈 레포트용 비정규화 뷰 생성 (이슈 + 공통점/편향성 요약/언론사 요약을 JSON 배열로 집계)"""
+        if not self.is_connected():
+            return False
+
+        try:
+            create_view_sql = """
+            CREATE OR REPLACE VIEW issue_report_v AS
+            SELECT
+                i.*,
+                COALESCE((
+                    SELECT jsonb_agg(to_jsonb(cp) ORDER BY cp.id)
+                    FROM common_points cp
+                    WHERE cp.issue_id = i.id
+                ), '[]'::jsonb) AS common_points,
+                COALESCE((
+                    SELECT jsonb_agg(to_jsonb(bs) ORDER BY bs.id)
+                    FROM bias_summaries bs
+                    WHERE bs.issue_id = i.id
+                ), '[]'::jsonb) AS bias_summaries,
+                COALESCE((
+                    SELECT jsonb_agg(to_jsonb(ms) || jsonb_build_object('media_name', mo.name) ORDER BY ms.id)
+                    FROM media_summaries ms
+                    LEFT JOIN media_outlets mo ON mo.id = ms.media_id
+                    WHERE ms.issue_id = i.id
+                ), '[]'::jsonb) AS media_summaries
+            FROM issues i
+            WHERE i.id > 1;
+            
+            -- PostgREST 스키마 캐시를 갱신해야 새 뷰가 REST API로 바로 조회됨
+            NOTIFY pgrst, 'reload schema';
+            """
+
+            self.client.rpc('exec_sql', {'sql': create_view_sql}).execute()
+            self.logger.info("이슈 레포트 뷰 issue_report_v 생성/확인 완료")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"이슈 레포트 뷰 생성 실패: {str(e)}")
+            return False
+
+    def create_issue_child_indexes(self) -> bool:
+        """이슈 하위 테이블의 issue_id 인덱스 생성 (media_summaries는 유니크 인덱스로 대체)"""
+        if not self.is_connected():
+            return False
+        
+        try:
+            create_index_sql = """
+            CREATE INDEX IF NOT EXISTS common_points_issue_idx ON common_points(issue_id);
+            CREATE INDEX IF NOT EXISTS bias_summaries_issue_idx ON bias_summaries(issue_id);
+            CREATE INDEX IF NOT EXISTS articles_issue_media_idx ON articles(issue_id, media_id);
+            """
+            
+            self.client.rpc('exec_sql', {'sql': create_index_sql}).execute()
+            self.logger.info("이슈 하위 테이블 인덱스 생성/확인 완료")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"이슈 하위 테이블 인덱스 생성 실패: {str(e)}")
+            return False
+    
+    def create_media_summaries_unique_index(self) -> bool:
+        """media_summaries (issue_id, media_id) 유니크 인덱스 생성 (upsert on_conflict 용)"""
+        if not self.is_connected():
+            return False
+        
+        try:
+            create_index_sql = """
+            CREATE UNIQUE INDEX IF NOT EXISTS media_summaries_issue_media_key
+                ON media_summaries(issue_id, media_id);
+            """
+            
+            self.client.rpc('exec_sql', {'sql': create_index_sql}).execute()
+            self.logger.info("media_summaries (issue_id, media_id) 유니크 인덱스 생성/확인 완료")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"media_summaries 유니크 인덱스 생성 실패: {str(e)}")
+            return False
+    
+    def create_unembedded_articles_function(self) -> bool:
+        """임베딩이 없는 기사를 id 순으로 페이지 단위 반환하는 get_unembedded_articles 함수 생성"""
+        if not self.is_connected():
+            return False
+        
+        try:
+            create_function_sql = """
+            CREATE INDEX IF NOT EXISTS embeddings_article_id_idx ON embeddings(article_id);
+            
+            CREATE OR REPLACE FUNCTION get_unembedded_articles(max_rows integer DEFAULT 1000, after_id bigint DEFAULT 0)
+            RETURNS TABLE (id articles.id%TYPE, title articles.title%TYPE, content articles.content%TYPE)
+            LANGUAGE sql STABLE
+            AS $$
+                SELECT a.id, a.title, a.content
+                FROM articles a
+                WHERE a.id > after_id
+                  AND a.content IS NOT NULL AND a.content <> ''
+                  AND NOT EXISTS (SELECT 1 FROM embeddings e WHERE e.article_id = a.id)
+                ORDER BY a.id
+                LIMIT max_rows;
+            $$;
+            """
+            
+            self.client.rpc('exec_sql', {'sql': create_function_sql}).execute()
+            self.logger.info("get_unembedded_articles 함수 생성/확인 완료")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"get_unembedded_articles 함수 생성 실패: {str(e)}")
+            return False
+    
     # ===== 통합 메서드 =====
     def get_project_status(self) -> Dict:
         """프로젝트 전체 상태 조회"""